@@ -20,12 +20,14 @@ from app.modules.slack_integration.model.model import SlackIntegration
 from app.modules.incidents.models.incident_model import Incidents
 from app.modules.incidents.models.activity_model import Activity
 from app.modules.incidents.models.comment_model import Comments
-from app.modules.scoring.model.model import BusinessCriticality, Environment, DataSensitivity, RegulatoryRequirement
+from app.modules.incidents.models.rollup_model import IncidentDailyRollup
+from app.modules.scoring.model.model import BusinessCriticality, Environment, DataSensitivity, RegulatoryRequirement, RepositoryScore
 from app.modules.groups.models.group_model import Group
 from app.modules.whitelist.model.whitelist_model import Whitelist, WhitelistComment
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 from app.modules.jiraAlerts.models.model import JiraAlert
 from app.modules.licenses.licenses_model import License
+from app.modules.facets.models.facet_model import FacetValue
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,124 @@
+"""
+Add repository_scores with trigger-maintained finding score aggregates
+
+Revision ID: 1792401124
+Revises: 1742713011
+Create Date: 2026-10-19 09:12:04
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision = '1792401124'
+down_revision = '1742713011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (finding table, column prefix in repository_scores)
+FINDING_TABLES = [
+    ('secrets', 'secret'),
+    ('vulnerability', 'vulnerability'),
+]
+
+COUNTED = "repository_id IS NOT NULL AND score_normalized IS NOT NULL AND NOT COALESCE(whitelisted, false)"
+
+APPLY_DELTA = """
+        INSERT INTO repository_scores (repository_id, {prefix}_score_sum, {prefix}_count, updated_at)
+        SELECT repository_id, SUM(score_delta), SUM(count_delta), timezone('utc', now())
+        FROM ({deltas}) AS deltas
+        GROUP BY repository_id
+        ON CONFLICT (repository_id) DO UPDATE SET
+            {prefix}_score_sum = CASE
+                WHEN repository_scores.{prefix}_count + EXCLUDED.{prefix}_count <= 0 THEN 0
+                ELSE repository_scores.{prefix}_score_sum + EXCLUDED.{prefix}_score_sum
+            END,
+            {prefix}_count = GREATEST(repository_scores.{prefix}_count + EXCLUDED.{prefix}_count, 0),
+            updated_at = EXCLUDED.updated_at;
+"""
+
+NEW_ROWS = f"SELECT repository_id, score_normalized AS score_delta, 1 AS count_delta FROM new_rows WHERE {COUNTED}"
+OLD_ROWS = f"SELECT repository_id, -score_normalized AS score_delta, -1 AS count_delta FROM old_rows WHERE {COUNTED}"
+
+
+def _trigger_function(table, prefix):
+    return f"""
+    CREATE OR REPLACE FUNCTION {table}_repository_scores_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+{APPLY_DELTA.format(prefix=prefix, deltas=NEW_ROWS)}
+        ELSIF TG_OP = 'DELETE' THEN
+{APPLY_DELTA.format(prefix=prefix, deltas=OLD_ROWS)}
+        ELSE
+{APPLY_DELTA.format(prefix=prefix, deltas=f"{NEW_ROWS} UNION ALL {OLD_ROWS}")}
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+
+
+def upgrade():
+    op.create_table(
+        'repository_scores',
+        sa.Column(
+            'repository_id',
+            sa.Integer(),
+            sa.ForeignKey('repositories.id', ondelete='CASCADE'),
+            primary_key=True),
+        sa.Column('secret_score_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('secret_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('vulnerability_score_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('vulnerability_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+    # Backfill from existing findings
+    op.execute(f"""
+        INSERT INTO repository_scores (repository_id, secret_score_sum, secret_count, vulnerability_score_sum, vulnerability_count, updated_at)
+        SELECT r.id,
+               COALESCE(s.score_sum, 0), COALESCE(s.cnt, 0),
+               COALESCE(v.score_sum, 0), COALESCE(v.cnt, 0),
+               timezone('utc', now())
+        FROM repositories r
+        LEFT JOIN (
+            SELECT repository_id, SUM(score_normalized) AS score_sum, COUNT(*) AS cnt
+            FROM secrets WHERE {COUNTED} GROUP BY repository_id
+        ) s ON s.repository_id = r.id
+        LEFT JOIN (
+            SELECT repository_id, SUM(score_normalized) AS score_sum, COUNT(*) AS cnt
+            FROM vulnerability WHERE {COUNTED} GROUP BY repository_id
+        ) v ON v.repository_id = r.id;
+    """)
+
+    # Statement-level triggers with transition tables: one pass per statement,
+    # however many rows it touched (e.g. the scoring cron's table-wide UPDATE)
+    for table, prefix in FINDING_TABLES:
+        op.execute(_trigger_function(table, prefix))
+        op.execute(f"""
+            CREATE TRIGGER {table}_repository_scores_insert
+            AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_repository_scores_sync();
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_repository_scores_update
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_repository_scores_sync();
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_repository_scores_delete
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_repository_scores_sync();
+        """)
+
+
+def downgrade():
+    for table, _ in FINDING_TABLES:
+        for event in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_repository_scores_{event} ON {table};")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_repository_scores_sync();")
+    op.drop_table('repository_scores')
@@ -0,0 +1,57 @@
+"""
+Unique index on repositories (vc_id, name) for webhook repo resolution
+
+Revision ID: 1792487563
+Revises: 1792401124
+Create Date: 2026-10-19 11:46:03
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision = '1792487563'
+down_revision = '1792401124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # Repo sync and the repo-creation webhook already look repos up by
+    # (vc_id, name) before inserting; this makes the invariant explicit and
+    # gives the webhook resolver a single-row index lookup
+    bind = op.get_bind()
+    duplicates = bind.execute(sa.text(
+        "SELECT vc_id, name, array_agg(id ORDER BY id) FROM repositories "
+        "GROUP BY vc_id, name HAVING count(*) > 1 ORDER BY vc_id, name"
+    )).all()
+    if duplicates:
+        # Findings, scans and groups reference these rows, so merging them is
+        # left to an operator rather than guessed at here
+        listed = "\n".join(f"  vc_id={vc_id} name={name!r} ids={ids}" for vc_id, name, ids in duplicates[:20])
+        more = f"\n  ...and {len(duplicates) - 20} more" if len(duplicates) > 20 else ""
+        raise RuntimeError(
+            f"Cannot create uq_repositories_vc_id_name: {len(duplicates)} (vc_id, name) pairs "
+            f"have more than one repository. Merge or delete the duplicates and re-run:\n{listed}{more}"
+        )
+
+    # Built CONCURRENTLY so repo sync and scans can keep writing meanwhile
+    with op.get_context().autocommit_block():
+        # An interrupted concurrent build leaves an INVALID index that
+        # IF NOT EXISTS would keep
+        invalid = bind.execute(sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = 'uq_repositories_vc_id_name'"
+        )).scalar()
+        if invalid:
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_repositories_vc_id_name;")
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_repositories_vc_id_name "
+            "ON repositories (vc_id, name);"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_repositories_vc_id_name;")
@@ -0,0 +1,51 @@
+"""
+pg_trgm GIN indexes over the searchable text of secrets, vulnerabilities,
+repositories and live commits
+
+Revision ID: 1792494210
+Revises: 1792487563
+Create Date: 2026-10-19 13:43:30
+"""
+
+from alembic import op
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision = '1792494210'
+down_revision = '1792487563'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns) -- column lists must stay in sync with the
+# search_document() calls in the services, or the planner will not match
+# the query expression to the index
+SEARCH_INDEXES = [
+    ('ix_secrets_search_trgm', 'secrets',
+     ['secret', 'rule', 'description', 'commit', 'author', 'email']),
+    ('ix_vulnerability_search_trgm', 'vulnerability', ['vulnerability_id', 'cve_id']),
+    ('ix_repositories_search_trgm', 'repositories', ['name']),
+    ('ix_live_commits_search_trgm', 'live_commits', ['commit_id', 'commit_msg', 'author_name']),
+]
+
+
+def _document(columns):
+    return " || ' ' || ".join(f'coalesce("{column}", \'\')' for column in columns)
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    # CONCURRENTLY cannot run inside a transaction; building without it
+    # would block finding inserts from scans for the whole build
+    with op.get_context().autocommit_block():
+        for index, table, columns in SEARCH_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                f"ON {table} USING gin (({_document(columns)}) gin_trgm_ops);"
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index, _, _ in SEARCH_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index};")
@@ -0,0 +1,88 @@
+"""
+Secondary indexes for the filters and joins of the hot service queries
+
+Revision ID: 1792501877
+Revises: 1792494210
+Create Date: 2026-10-19 15:37:57
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision = '1792501877'
+down_revision = '1792494210'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, columns, partial predicate). Kept in step with the
+# __table_args__ of the models. Scan and whitelist references are NULL for
+# most findings, so those indexes only cover the rows that carry one.
+INDEXES = [
+    # Listing filters, repo summaries and repository_scores maintenance
+    ('ix_secrets_repository_id', 'secrets', ['repository_id'], None),
+    # add_secret dedup, whitelisting and the repos-for-secret listing by secret
+    # value. Secrets (PEM keys) can exceed the B-tree entry limit, so index
+    # their digest; lookups go through secret_value_in
+    ('ix_secrets_secret_md5', 'secrets', ['md5(secret)'], None),
+    ('ix_secrets_pr_scan_id', 'secrets', ['pr_scan_id'], 'pr_scan_id IS NOT NULL'),
+    ('ix_secrets_live_commit_scan_id', 'secrets', ['live_commit_scan_id'], 'live_commit_scan_id IS NOT NULL'),
+    ('ix_secrets_whitelist_id', 'secrets', ['whitelist_id'], 'whitelist_id IS NOT NULL'),
+
+    ('ix_vulnerability_repository_id', 'vulnerability', ['repository_id'], None),
+    # add_vulnerabilities dedup per repo and lookups by vulnerability id
+    ('ix_vulnerability_vulnerability_id_repository_id', 'vulnerability',
+     ['vulnerability_id', 'repository_id'], None),
+    ('ix_vulnerability_cve_id', 'vulnerability', ['cve_id'], 'cve_id IS NOT NULL'),
+    ('ix_vulnerability_pr_scan_id', 'vulnerability', ['pr_scan_id'], 'pr_scan_id IS NOT NULL'),
+    ('ix_vulnerability_live_commit_scan_id', 'vulnerability',
+     ['live_commit_scan_id'], 'live_commit_scan_id IS NOT NULL'),
+    ('ix_vulnerability_whitelist_id', 'vulnerability', ['whitelist_id'], 'whitelist_id IS NOT NULL'),
+
+    # Dashboard counts and trends filter on type/status and bucket by updated_at
+    ('ix_incidents_type_status_updated_at', 'incidents', ['type', 'status', 'updated_at'], None),
+    # Incident listing date range and default sort
+    ('ix_incidents_created_at', 'incidents', ['created_at'], None),
+
+    # is_whitelisted / whitelist matching during every scan
+    ('ix_whitelist_type_active_name', 'whitelist', ['type', 'active', 'name'], None),
+]
+
+
+def drop_invalid_indexes(names):
+    """
+    A failed or interrupted CREATE INDEX CONCURRENTLY leaves an INVALID index
+    behind, which IF NOT EXISTS would then keep. Drop those so a re-run
+    rebuilds them.
+    """
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+        ),
+        {"names": list(names)},
+    ).scalars().all()
+    for index in invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index};")
+
+
+def upgrade():
+    # Built CONCURRENTLY so scans can keep writing findings meanwhile
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes(index for index, _, _, _ in INDEXES)
+        for index, table, columns, where in INDEXES:
+            predicate = f" WHERE {where}" if where else ""
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                f"ON {table} ({', '.join(columns)}){predicate};"
+            )
+
+    for table in sorted({table for _, table, _, _ in INDEXES}):
+        op.execute(f"ANALYZE {table};")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index, _, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index};")
@@ -0,0 +1,147 @@
+"""
+Add facet_values with trigger-maintained per-column value counts for
+filter dropdowns
+
+Revision ID: 1792508342
+Revises: 1792501877
+Create Date: 2026-10-19 17:25:42
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision = '1792508342'
+down_revision = '1792501877'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> faceted columns. Enum, integer and boolean columns are stored as
+# their text form, array columns once per element. Must match
+# FACET_COLUMNS in app/modules/facets/facet_service.py.
+FACETS = {
+    'secrets': ['secret', 'description', 'severity', 'scan_type', 'rule', 'commit',
+                'author', 'email', 'message', 'branches[]'],
+    'vulnerability': ['vulnerability_id', 'cve_id', 'severity', 'artifact_type', 'artifact_path',
+                      'package', 'package_version', 'license', 'vulnerability_data_source', 'description'],
+    'incidents': ['status', 'type'],
+    'live_commits': ['author_name', 'commit_id', 'vc_id', 'repo_id', 'branch'],
+    'live_commits_scan': ['vc_id', 'repo_id'],
+    'pr_scans': ['vc_id', 'repo_id', 'block_status', 'pr_id', 'scan_type'],
+    'prs': ['vc_id', 'repo_id', 'pr_name'],
+    'repositories': ['author', 'name'],
+}
+
+UPSERT = """
+        {with_clause}INSERT INTO facet_values (source, dimension, value, occurrences)
+        SELECT '{table}', dimension, value, SUM(delta)
+        FROM ({deltas}) AS deltas
+        WHERE value IS NOT NULL
+        GROUP BY dimension, value
+        HAVING SUM(delta) <> 0
+        ON CONFLICT (source, dimension, md5(value)) DO UPDATE SET
+            occurrences = facet_values.occurrences + EXCLUDED.occurrences;
+"""
+
+PURGE = "DELETE FROM facet_values WHERE source = '{table}' AND occurrences <= 0;"
+
+
+def _columns(table):
+    return [column.rstrip('[]') for column in FACETS[table]]
+
+
+def _deltas(table, rows, delta):
+    parts = []
+    for column in FACETS[table]:
+        name = column.rstrip('[]')
+        value = f'unnest("{name}")' if column.endswith('[]') else f'"{name}"::text'
+        parts.append(f"SELECT '{name}' AS dimension, {value} AS value, {delta} AS delta FROM {rows}")
+    return " UNION ALL ".join(parts)
+
+
+def _changed(table):
+    """CTEs of the old and new versions of rows whose faceted columns an UPDATE changed."""
+    columns = _columns(table)
+    old = ", ".join(f'o."{column}"' for column in columns)
+    new = ", ".join(f'n."{column}"' for column in columns)
+    changed = f"FROM old_rows o JOIN new_rows n ON n.id = o.id WHERE ROW({old}) IS DISTINCT FROM ROW({new})"
+    return f"WITH old_changed AS (SELECT o.* {changed}), new_changed AS (SELECT n.* {changed})\n        "
+
+
+def _trigger_function(table):
+    updated = f"{_deltas(table, 'new_changed', 1)} UNION ALL {_deltas(table, 'old_changed', -1)}"
+    return f"""
+    CREATE OR REPLACE FUNCTION {table}_facets_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+{UPSERT.format(table=table, with_clause='', deltas=_deltas(table, 'new_rows', 1))}
+        ELSIF TG_OP = 'DELETE' THEN
+{UPSERT.format(table=table, with_clause='', deltas=_deltas(table, 'old_rows', -1))}
+        ELSE
+{UPSERT.format(table=table, with_clause=_changed(table), deltas=updated)}
+        END IF;
+        {PURGE.format(table=table)}
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+
+
+def upgrade():
+    op.create_table(
+        'facet_values',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('dimension', sa.String(), nullable=False),
+        sa.Column('value', sa.Text(), nullable=False),
+        sa.Column('occurrences', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    # Hashed so arbitrarily long values (private keys, commit messages) fit a btree
+    op.execute("CREATE UNIQUE INDEX uq_facet_values_value ON facet_values (source, dimension, md5(value));")
+    # Case-insensitive prefix search and value ordering for the dropdowns
+    op.execute(
+        "CREATE INDEX ix_facet_values_prefix "
+        "ON facet_values (source, dimension, (left(lower(value), 200)) COLLATE \"C\");"
+    )
+    # Keeps the purge of emptied values cheap
+    op.execute("CREATE INDEX ix_facet_values_empty ON facet_values (source) WHERE occurrences <= 0;")
+
+    for table in FACETS:
+        op.execute(f"""
+            INSERT INTO facet_values (source, dimension, value, occurrences)
+            SELECT '{table}', dimension, value, COUNT(*)
+            FROM ({_deltas(table, table, 1)}) AS facets
+            WHERE value IS NOT NULL
+            GROUP BY dimension, value;
+        """)
+
+    # Statement-level triggers with transition tables, as for repository_scores
+    for table in FACETS:
+        op.execute(_trigger_function(table))
+        op.execute(f"""
+            CREATE TRIGGER {table}_facets_insert
+            AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_facets_sync();
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_facets_update
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_facets_sync();
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_facets_delete
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_facets_sync();
+        """)
+
+
+def downgrade():
+    for table in FACETS:
+        for event in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_facets_{event} ON {table};")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_facets_sync();")
+    op.drop_table('facet_values')
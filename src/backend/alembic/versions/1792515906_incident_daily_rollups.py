@@ -0,0 +1,180 @@
+"""
+Add incident_daily_rollups with trigger-maintained per-day incident counts
+for the trend and breakdown dashboards
+
+Revision ID: 1792515906
+Revises: 1792508342
+Create Date: 2026-10-19 19:25:06
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision = '1792515906'
+down_revision = '1792508342'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Lowercase SeverityLevel value of a finding, as the dashboards report it
+SEVERITY = {
+    'secrets': "CASE f.severity WHEN 'INFORMATION' THEN 'informational' ELSE lower(f.severity::text) END",
+    'vulnerability': "coalesce(lower(f.severity), 'unknown')",
+}
+
+# The incident column pointing at each finding table
+INCIDENT_KEY = {
+    'secrets': 'secret_id',
+    'vulnerability': 'vulnerability_id',
+}
+
+KEY = "basis, day, type, status, severity, repository_id, vc_id"
+
+UPSERT = f"""
+        {{with_clause}}INSERT INTO incident_daily_rollups ({KEY}, incident_count)
+        SELECT {KEY}, SUM(delta)
+        FROM ({{deltas}}) AS deltas
+        WHERE day IS NOT NULL
+        GROUP BY {KEY}
+        HAVING SUM(delta) <> 0
+        ON CONFLICT (basis, day, type, status, severity, (COALESCE(repository_id, 0)), (COALESCE(vc_id, 0)))
+        DO UPDATE SET incident_count = incident_daily_rollups.incident_count + EXCLUDED.incident_count;
+"""
+
+PURGE = "DELETE FROM incident_daily_rollups WHERE incident_count <= 0;"
+
+
+def _contributions(incidents, findings, table, delta):
+    """One row per incident and basis: the bucket it is counted in and `delta`."""
+    return f"""
+        SELECT b.basis,
+               (CASE b.basis WHEN 'created' THEN i.created_at ELSE i.updated_at END)::date AS day,
+               i.type, i.status, {SEVERITY[table]} AS severity, f.repository_id, f.vc_id, {delta} AS delta
+        FROM {incidents} i
+        JOIN {findings} f ON f.id = i.{INCIDENT_KEY[table]}
+        CROSS JOIN (VALUES ('created'), ('updated')) AS b (basis)"""
+
+
+def _incident_deltas(rows, delta):
+    return " UNION ALL ".join(
+        _contributions(rows, table, table, delta) for table in SEVERITY)
+
+
+def _incidents_trigger_function():
+    columns = ['type', 'status', 'created_at', 'updated_at', 'secret_id', 'vulnerability_id']
+    old = ", ".join(f"o.{column}" for column in columns)
+    new = ", ".join(f"n.{column}" for column in columns)
+    changed = f"FROM old_rows o JOIN new_rows n ON n.id = o.id WHERE ROW({old}) IS DISTINCT FROM ROW({new})"
+    with_clause = f"WITH old_changed AS (SELECT o.* {changed}), new_changed AS (SELECT n.* {changed})\n        "
+    updated = f"{_incident_deltas('new_changed', 1)} UNION ALL {_incident_deltas('old_changed', -1)}"
+    return f"""
+    CREATE OR REPLACE FUNCTION incidents_rollup_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+{UPSERT.format(with_clause='', deltas=_incident_deltas('new_rows', 1))}
+        ELSIF TG_OP = 'DELETE' THEN
+{UPSERT.format(with_clause='', deltas=_incident_deltas('old_rows', -1))}
+        ELSE
+{UPSERT.format(with_clause=with_clause, deltas=updated)}
+        END IF;
+        {PURGE}
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+
+
+def _finding_trigger_function(table):
+    """Moves the incidents of findings whose severity, repository or vc changed between buckets."""
+    changed = (
+        "FROM old_rows o JOIN new_rows n ON n.id = o.id "
+        "WHERE ROW(o.severity, o.repository_id, o.vc_id) IS DISTINCT FROM ROW(n.severity, n.repository_id, n.vc_id)"
+    )
+    with_clause = f"WITH old_changed AS (SELECT o.* {changed}), new_changed AS (SELECT n.* {changed})\n        "
+    deltas = (f"{_contributions('incidents', 'new_changed', table, 1)} UNION ALL "
+              f"{_contributions('incidents', 'old_changed', table, -1)}")
+    return f"""
+    CREATE OR REPLACE FUNCTION {table}_rollup_sync() RETURNS trigger AS $$
+    BEGIN
+{UPSERT.format(with_clause=with_clause, deltas=deltas)}
+        {PURGE}
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+
+
+def upgrade():
+    op.create_table(
+        'incident_daily_rollups',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('basis', sa.String(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('type', postgresql.ENUM(name='incidenttypeenum', create_type=False), nullable=False),
+        sa.Column('status', postgresql.ENUM(name='incidentstatusenum', create_type=False), nullable=False),
+        sa.Column('severity', sa.String(), nullable=False),
+        sa.Column('repository_id', sa.Integer(), nullable=True),
+        sa.Column('vc_id', sa.Integer(), nullable=True),
+        sa.Column('incident_count', sa.BigInteger(), nullable=False, server_default='0'),
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX uq_incident_daily_rollups_key ON incident_daily_rollups "
+        "(basis, day, type, status, severity, (COALESCE(repository_id, 0)), (COALESCE(vc_id, 0)));"
+    )
+    # Dashboards read one basis over a day range, per type
+    op.execute("CREATE INDEX ix_incident_daily_rollups_range ON incident_daily_rollups (basis, type, day);")
+    # Keeps the purge of emptied buckets cheap
+    op.execute("CREATE INDEX ix_incident_daily_rollups_empty ON incident_daily_rollups (basis) WHERE incident_count <= 0;")
+
+    op.execute(f"""
+        INSERT INTO incident_daily_rollups ({KEY}, incident_count)
+        SELECT {KEY}, COUNT(*)
+        FROM ({_incident_deltas('incidents', 1)}) AS contributions
+        WHERE day IS NOT NULL
+        GROUP BY {KEY};
+    """)
+
+    # Statement-level triggers with transition tables, as for facet_values
+    op.execute(_incidents_trigger_function())
+    op.execute("""
+        CREATE TRIGGER incidents_rollup_insert
+        AFTER INSERT ON incidents
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION incidents_rollup_sync();
+    """)
+    op.execute("""
+        CREATE TRIGGER incidents_rollup_update
+        AFTER UPDATE ON incidents
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION incidents_rollup_sync();
+    """)
+    op.execute("""
+        CREATE TRIGGER incidents_rollup_delete
+        AFTER DELETE ON incidents
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION incidents_rollup_sync();
+    """)
+
+    # An incident's severity and repository live on its finding. Findings
+    # cannot be deleted while an incident references them, so updates are
+    # the only change to follow.
+    for table in SEVERITY:
+        op.execute(_finding_trigger_function(table))
+        op.execute(f"""
+            CREATE TRIGGER {table}_rollup_update
+            AFTER UPDATE ON {table}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_rollup_sync();
+        """)
+
+
+def downgrade():
+    for table in SEVERITY:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_rollup_update ON {table};")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_rollup_sync();")
+    for event in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS incidents_rollup_{event} ON incidents;")
+    op.execute("DROP FUNCTION IF EXISTS incidents_rollup_sync();")
+    op.drop_table('incident_daily_rollups')
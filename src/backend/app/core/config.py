@@ -15,13 +15,85 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     LOG_LEVEL: str = "INFO"
 
+    # Async engine / connection pool
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements per connection
+    DB_JIT: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 disables the server-side timeout
+
+    # Optional read replica for dashboards and listings (postgresql+asyncpg:// DSN)
+    READ_REPLICA_DATABASE_URL: str = ''
+    READ_REPLICA_MAX_LAG_SECONDS: float = 30
+    READ_REPLICA_CHECK_INTERVAL: float = 10
+    READ_REPLICA_CHECK_TIMEOUT: float = 2
+
     SECRET_KEY: str = "SECRET"
     FRONTEND_URL: str = ''
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
 
+    # In-process cache of users resolved from bearer tokens
+    USER_CACHE_SIZE: int = 1024
+    USER_CACHE_TTL: int = 30
+
+    # Listing totals: exact counts cached per filter set, planner estimates above the threshold
+    COUNT_CACHE_SIZE: int = 2048
+    COUNT_CACHE_TTL: int = 30
+    COUNT_EXACT_THRESHOLD: int = 10000
+
+    # Webhook repo lookups by (vc_id, name)
+    REPO_RESOLVER_CACHE_SIZE: int = 4096
+    REPO_RESOLVER_CACHE_TTL: int = 300
+
+    # Rows fetched per round trip by the streaming exports' server-side cursors
+    EXPORT_FETCH_SIZE: int = 2000
+
+    # Validate fast-path (ORJSON) responses against their response models; for
+    # debugging only, it gives back most of what skipping validation saves
+    DEBUG_RESPONSE_VALIDATION: bool = False
+
+    # Dashboard and filter responses, cached until the data version changes.
+    # Without a Redis URL each replica caches on its own and only sees its own
+    # writes, so entries live RESPONSE_CACHE_MEMORY_TTL seconds; with one,
+    # entries and the version are shared and live RESPONSE_CACHE_TTL.
+    RESPONSE_CACHE_SIZE: int = 1024
+    RESPONSE_CACHE_MEMORY_TTL: int = 5
+    RESPONSE_CACHE_TTL: int = 300
+    RESPONSE_CACHE_REDIS_URL: str = ''
+
+    # Identical concurrent reads share one execution; a shared result is at most
+    # this many seconds old (0 disables coalescing)
+    SINGLE_FLIGHT_MAX_STALENESS: float = 2.0
+
+    # Slack notifications are posted by a background worker. The integration is
+    # re-read every SLACK_CONFIG_CACHE_TTL seconds and posts to a channel are
+    # spaced SLACK_MIN_POST_INTERVAL apart. Optional digests: one message per
+    # SLACK_DIGEST_WINDOW seconds (0 = off) and/or one per whole-VC scan.
+    SLACK_CONFIG_CACHE_TTL: int = 60
+    SLACK_MIN_POST_INTERVAL: float = 1.0
+    SLACK_MAX_RETRIES: int = 3
+    SLACK_QUEUE_SIZE: int = 1000
+    SLACK_DIGEST_WINDOW: int = 0
+    SLACK_DIGEST_VC_SCANS: bool = False
+
     LICENSE_SERVER_VALIDATE_URL: str = ''
+    # Seconds between background license checks, how long a valid result is
+    # trusted, and extra grace when refreshes keep failing
+    LICENSE_REFRESH_INTERVAL: int = 60
+    LICENSE_CACHE_TTL: int = 300
+    LICENSE_GRACE_PERIOD: int = 900
+
+    # JSON file of {"rule": "severity"} pairs overriding built-in rule severities
+    SEVERITY_OVERRIDES_FILE: str = ''
+
+    # Seconds the what-if scoring simulation keeps its finding snapshot
+    SCORING_SIMULATION_CACHE_TTL: int = 300
 
     PORT: int = 80
     RELOAD: bool = True
@@ -1,6 +1,11 @@
+import asyncio
+import time
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
+from app.core.logger import logger
 
 DATABASE_URL = (
     f"postgresql+asyncpg://{settings.POSTGRES_USER}:"
@@ -9,16 +14,162 @@ DATABASE_URL = (
 )
 
 
-engine = create_async_engine(DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    expire_on_commit=False,
-    class_=AsyncSession)
+def _server_settings() -> dict:
+    server_settings = {}
+    if not settings.DB_JIT:
+        server_settings["jit"] = "off"
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    return server_settings
+
+
+def _engine_options() -> dict:
+    return dict(
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": _server_settings(),
+        },
+    )
+
+
+def _session_factory(bind):
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=bind,
+        expire_on_commit=False,
+        class_=AsyncSession)
+
+
+engine = create_async_engine(DATABASE_URL, **_engine_options())
+SessionLocal = _session_factory(engine)
+
+read_engine = (
+    create_async_engine(settings.READ_REPLICA_DATABASE_URL, **_engine_options())
+    if settings.READ_REPLICA_DATABASE_URL else None
+)
+ReadSessionLocal = _session_factory(read_engine) if read_engine is not None else None
+
 Base = declarative_base()
 
 
 async def get_db():
     async with SessionLocal() as session:
         yield session
+
+
+# Replay lag in seconds; 0 when the replica has applied everything it received
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaStatus:
+    """
+    Cached health of the read replica. The lag is re-measured at most every
+    READ_REPLICA_CHECK_INTERVAL seconds; a replica that is unreachable or
+    lagging more than READ_REPLICA_MAX_LAG_SECONDS is skipped until the next
+    check succeeds.
+    """
+
+    def __init__(self):
+        self.healthy = False
+        self.lag_seconds = None
+        self.last_error = None
+        self.checked_at = None
+        self._lock = asyncio.Lock()
+
+    def _due(self) -> bool:
+        return self.checked_at is None or time.monotonic() - self.checked_at >= settings.READ_REPLICA_CHECK_INTERVAL
+
+    @staticmethod
+    async def _measure_lag():
+        async with read_engine.connect() as conn:
+            return await conn.scalar(REPLICA_LAG_QUERY)
+
+    async def check(self):
+        was_healthy = self.healthy
+        try:
+            lag = await asyncio.wait_for(self._measure_lag(), timeout=settings.READ_REPLICA_CHECK_TIMEOUT)
+            self.lag_seconds = float(lag)
+            self.healthy = self.lag_seconds <= settings.READ_REPLICA_MAX_LAG_SECONDS
+            self.last_error = None if self.healthy else f"Replica lag {self.lag_seconds:.1f}s"
+        except Exception as e:
+            self.healthy = False
+            self.last_error = str(e) or type(e).__name__
+        finally:
+            self.checked_at = time.monotonic()
+
+        if was_healthy and not self.healthy:
+            logger.warning(f"Read replica unavailable, falling back to primary: {self.last_error}")
+        elif self.healthy and not was_healthy:
+            logger.info(f"Read replica available (lag {self.lag_seconds:.1f}s)")
+
+    def mark_failed(self, error: Exception):
+        self.healthy = False
+        self.last_error = str(error)
+        self.checked_at = time.monotonic()
+        logger.warning(f"Read replica query failed, falling back to primary: {error}")
+
+    async def is_usable(self) -> bool:
+        if read_engine is None:
+            return False
+        if self._due():
+            async with self._lock:
+                if self._due():
+                    await self.check()
+        return self.healthy
+
+    def as_dict(self) -> dict:
+        return {
+            "configured": read_engine is not None,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "last_error": self.last_error,
+        }
+
+
+replica_status = ReplicaStatus()
+
+
+async def get_read_db():
+    """
+    Session for read-only endpoints: the replica when it is configured and
+    fresh enough, the primary otherwise. A connection failure on the replica
+    marks it unhealthy so subsequent requests go to the primary.
+    """
+    if not await replica_status.is_usable():
+        async with SessionLocal() as session:
+            yield session
+        return
+
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        except DBAPIError as e:
+            if e.connection_invalidated:
+                replica_status.mark_failed(e)
+            raise
+
+
+def get_pool_stats() -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout": settings.DB_POOL_TIMEOUT,
+        "replica": replica_status.as_dict(),
+    }
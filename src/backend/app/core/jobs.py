@@ -0,0 +1,86 @@
+import hashlib
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import SessionLocal, engine
+from app.core.logger import logger
+
+JobFunc = Callable[[AsyncSession], Awaitable[object]]
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_started_at: Optional[datetime] = None
+    last_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+job_stats: Dict[str, JobStats] = {}
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable signed 64-bit key for pg_try_advisory_lock derived from the job name."""
+    return int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+
+
+async def run_job(name: str, job: JobFunc):
+    """
+    Run one scheduled job with its own session.
+
+    A Postgres advisory lock, held on a dedicated autocommit connection for
+    the duration of the run, ensures only one replica executes the job at a
+    time; replicas that do not get the lock skip the run.
+    """
+    stats = job_stats.setdefault(name, JobStats())
+    key = advisory_lock_key(name)
+
+    async with engine.connect() as lock_conn:
+        lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        acquired = await lock_conn.scalar(select(func.pg_try_advisory_lock(key)))
+        if not acquired:
+            stats.skipped += 1
+            logger.info(f"Job {name} is running on another replica, skipping")
+            return
+
+        started = time.monotonic()
+        stats.last_started_at = datetime.utcnow()
+        try:
+            async with SessionLocal() as db:
+                await job(db)
+            stats.last_error = None
+        except Exception as e:
+            stats.failures += 1
+            stats.last_error = str(e)
+            logger.error(f"Job {name} failed: {e}")
+        finally:
+            stats.runs += 1
+            stats.last_duration_seconds = time.monotonic() - started
+            await lock_conn.scalar(select(func.pg_advisory_unlock(key)))
+            logger.info(f"Job {name} finished in {stats.last_duration_seconds:.2f}s")
+
+
+def add_job(scheduler: AsyncIOScheduler, name: str, job: JobFunc, trigger):
+    """Register `job` so runs never overlap and missed runs collapse into one."""
+    scheduler.add_job(
+        run_job,
+        trigger,
+        args=[name, job],
+        id=name,
+        name=name,
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True,
+    )
+
+
+def get_job_stats() -> Dict[str, dict]:
+    return {name: asdict(stats) for name, stats in job_stats.items()}
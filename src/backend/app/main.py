@@ -1,4 +1,6 @@
+import asyncio
 from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,7 +12,10 @@ from sqlalchemy.exc import IntegrityError
 
 from app.core.db import Base, get_db
 from app.core.config import settings
-from app.core.db import engine
+from app.core.db import engine, get_pool_stats
+from app.core.jobs import add_job, get_job_stats
+from app.utils.single_flight import get_single_flight_stats
+from app.modules.slack_integration.slack_notifier import slack_notifier
 
 from app.modules.user.user_service import create_user, get_user_by_username
 from app.modules.user.schemas.user_schema import UserCreate
@@ -37,7 +42,7 @@ from app.modules.jiraAlerts import jiraAlerts_controller
 from app.modules.vulnerability import vulnerability_controller
 from app.modules.whitelist.whitelist_service import sca_whitelist_fix_cron
 from app.modules.licenses import licenses_controller
-from app.modules.licenses.licesses_service import validate_license_cron
+from app.modules.licenses.licesses_service import validate_license_cron, run_license_refresher
 
 from app.utils.error_handling import add_error_middleware
 
@@ -79,20 +84,28 @@ async def lifespan(app: FastAPI):
                     print("Admin user already exists. Skipping creation.")
 
                 await RepositoryPropertyService.init_default_values(db)
-                scheduler.add_job(calculate_score, CronTrigger(minute="*/30"), args=[db])
-                scheduler.add_job(sca_whitelist_fix_cron, CronTrigger(hour="*/3"), args=[db])
-                scheduler.add_job(validate_license_cron, CronTrigger(minute="*/1"), args=[db])
+                # Each run gets its own session; see app.core.jobs
+                add_job(scheduler, "calculate_score", calculate_score, CronTrigger(minute="*/30"))
+                add_job(scheduler, "sca_whitelist_fix_cron", sca_whitelist_fix_cron, CronTrigger(hour="*/3"))
+                add_job(scheduler, "validate_license_cron", validate_license_cron, CronTrigger(minute="*/1"))
                 
                 start_scheduler()
             break
         finally:
             await db.close()
 
+    # Keep this process's license state fresh off the request path
+    license_refresher = asyncio.create_task(run_license_refresher())
+
     yield  # Yields control back to FastAPI
 
+    license_refresher.cancel()
+    await slack_notifier.close()
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
     await engine.dispose()
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Enable CORS
 app.add_middleware(
@@ -101,6 +114,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # Add error handling middleware
@@ -141,6 +155,21 @@ async def health(db: AsyncSession = Depends(get_db)):
     except Exception as e:
         return {"status": "Database not connected", "detail": str(e)}
 
+# Connection pool usage
+@app.get("/health/pool")
+async def health_pool():
+    return get_pool_stats()
+
+# Scheduled job run counts and durations
+@app.get("/health/jobs")
+async def health_jobs():
+    return get_job_stats()
+
+# Coalesced read executions per service
+@app.get("/health/single-flight")
+async def health_single_flight():
+    return get_single_flight_stats()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -6,6 +6,7 @@ from app.core.security import decode_token
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db import get_db
 from app.modules.user.models.user import User
+from app.modules.auth.user_cache import user_cache
 import enum
 
 
@@ -30,22 +31,26 @@ async def get_bearer_token(
 async def get_current_user(
         token: str = Depends(get_bearer_token),
         db: AsyncSession = Depends(get_db)) -> User:
-    payload = decode_token(token)
-    username: str = payload.get("username")
+    user = user_cache.get(token)
+    if user is None:
+        payload = decode_token(token)
+        username: str = payload.get("username")
 
-    from app.modules.licenses.licesses_service import validate_license
-    valid = await validate_license(db)
+    from app.modules.licenses.licesses_service import is_license_valid
+    valid = await is_license_valid(db)
     if not valid:
         raise HTTPException(
             status_code=401,
             detail="Invalid license")
 
-    user = await get_user_by_username(db, username)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing Authorization header",
-        )
+        user = await get_user_by_username(db, username)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or missing Authorization header",
+            )
+        user_cache.set(token, user, payload.get("exp"))
     return user
 
 
@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.modules.user.models.user import User
+
+
+class UserCache:
+    """
+    Small in-process LRU of resolved users keyed by bearer token.
+
+    Entries expire after USER_CACHE_TTL seconds or when the token expires,
+    whichever comes first. Each entry remembers the user's version at insert
+    time; `invalidate` bumps the version so every cached token for that user
+    misses on its next lookup.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[User, float, int]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+
+    def get(self, token: str) -> Optional[User]:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        user, expires_at, version = entry
+        if expires_at < time.time() or version != self._versions.get(user.id, 0):
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return user
+
+    def set(self, token: str, user: User, token_exp: Optional[float] = None):
+        expires_at = time.time() + self.ttl
+        if token_exp:
+            expires_at = min(expires_at, token_exp)
+        self._entries[token] = (user, expires_at, self._versions.get(user.id, 0))
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def clear(self):
+        self._entries.clear()
+
+
+user_cache = UserCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
@@ -0,0 +1,105 @@
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import ARRAY, BigInteger, Boolean, Enum, Integer, cast, collate, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.facets.models.facet_model import FacetValue
+from app.modules.incidents.models.incident_model import Incidents
+from app.modules.live_commits.models.live_commits import LiveCommit
+from app.modules.live_commits.models.live_commits_scan import LiveCommitScan
+from app.modules.pr.models.pr import PR
+from app.modules.pr.models.pr_scan import PRScan
+from app.modules.repository.models.repository import Repo
+from app.modules.secrets.model.secrets_model import Secrets
+from app.modules.vulnerability.models.vulnerability_model import Vulnerability
+
+# Columns with trigger-maintained facets, as (table, column) names. Must
+# match FACETS in the facet_values migration.
+FACET_COLUMNS = {
+    (column.table.name, column.name)
+    for column in (
+        Secrets.secret, Secrets.description, Secrets.severity, Secrets.scan_type, Secrets.rule,
+        Secrets.commit, Secrets.author, Secrets.email, Secrets.message, Secrets.branches,
+        Vulnerability.vulnerability_id, Vulnerability.cve_id, Vulnerability.severity,
+        Vulnerability.artifact_type, Vulnerability.artifact_path, Vulnerability.package,
+        Vulnerability.package_version, Vulnerability.license, Vulnerability.vulnerability_data_source,
+        Vulnerability.description,
+        Incidents.status, Incidents.type,
+        LiveCommit.author_name, LiveCommit.commit_id, LiveCommit.vc_id, LiveCommit.repo_id, LiveCommit.branch,
+        LiveCommitScan.vc_id, LiveCommitScan.repo_id,
+        PRScan.vc_id, PRScan.repo_id, PRScan.block_status, PRScan.pr_id, PRScan.scan_type,
+        PR.vc_id, PR.repo_id, PR.pr_name,
+        Repo.author, Repo.name,
+    )
+    for column in column.property.columns[:1]
+}
+
+# Prefix search key; identical to the ix_facet_values_prefix expression
+PREFIX_LENGTH = 200
+_PREFIX_KEY = collate(func.left(func.lower(FacetValue.value), literal_column(str(PREFIX_LENGTH))), "C")
+_MAX_CHAR = "\U0010ffff"
+
+
+def _column(attribute):
+    """The table Column behind a mapped attribute such as `Secrets.rule`."""
+    return attribute.property.columns[0] if hasattr(attribute, "property") else attribute
+
+
+def is_faceted(attribute) -> bool:
+    column = _column(attribute)
+    return (column.table.name, column.name) in FACET_COLUMNS
+
+
+def _value_type(column):
+    return column.type.item_type if isinstance(column.type, ARRAY) else column.type
+
+
+def facet_value(attribute, value: str) -> Any:
+    """Facets store values as text; convert back to the column's Python type."""
+    column = _column(attribute)
+    column_type = _value_type(column)
+    if isinstance(column_type, Enum) and column_type.enum_class is not None:
+        return column_type.enum_class[value]
+    if isinstance(column_type, Boolean):
+        return value == "true"
+    if isinstance(column_type, Integer):
+        return int(value)
+    return value
+
+
+async def get_facet_values(
+        db: AsyncSession,
+        attribute,
+        search: Optional[str] = None,
+        page: int = 1,
+        page_size: Optional[int] = 10) -> Tuple[List[Tuple[Any, int]], int]:
+    """
+    Distinct values of a faceted column as (value, row count) pairs, in
+    value order (numeric for integer columns), filtered to those starting
+    with `search` (case-insensitive). The total is an exact count.
+
+    :param page_size: Values per page; None returns every matching value.
+    :return: One page of values, total number of matching values.
+    """
+    column = _column(attribute)
+    query = select(FacetValue.value, FacetValue.occurrences).where(
+        FacetValue.source == column.table.name,
+        FacetValue.dimension == column.name,
+        FacetValue.occurrences > 0,
+    )
+    if search:
+        prefix = search.lower()[:PREFIX_LENGTH]
+        query = query.where(_PREFIX_KEY >= prefix, _PREFIX_KEY < prefix + _MAX_CHAR)
+
+    # Integer columns are stored as text; sort them as numbers (1, 2, 10)
+    sort_key = cast(FacetValue.value, BigInteger) if isinstance(_value_type(column), Integer) else _PREFIX_KEY
+    query = query.order_by(sort_key, FacetValue.id)
+    if page_size is None:
+        rows = (await db.execute(query)).all()
+        total_count = len(rows)
+    else:
+        # Exact: one dimension's facet rows are few next to its source table,
+        # and dropdown totals are not flagged as estimates
+        total_count = await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+        rows = (await db.execute(query.offset((page - 1) * page_size).limit(page_size))).all()
+    return [(facet_value(column, value), occurrences) for value, occurrences in rows], total_count
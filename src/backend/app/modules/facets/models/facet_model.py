@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Column, String, Text
+
+from app.core.db import Base
+
+
+class FacetValue(Base):
+    """
+    Number of rows of `source` whose `dimension` column holds `value`.
+    Maintained by statement-level triggers on the source tables (see the
+    facet_values migration) so filter dropdowns never aggregate the source.
+    Rows may linger at zero until the next change to their source; readers
+    skip them.
+    """
+    __tablename__ = 'facet_values'
+
+    id = Column(BigInteger, primary_key=True)
+    source = Column(String, nullable=False)
+    dimension = Column(String, nullable=False)
+    value = Column(Text, nullable=False)
+    occurrences = Column(BigInteger, nullable=False, default=0)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from typing import List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 from sqlalchemy.orm import Session
@@ -16,9 +16,11 @@ from app.modules.incidents.schemas.comment_schemas import CommentBase, CommentRe
 from typing import Dict
 from app.modules.secrets.model.secrets_model import SeverityLevel
 from datetime import datetime, timezone
+from app.utils.export import ExportFormat
 
 from app.modules.incidents.services.incident_service import (
     get_incidents,
+    export_incidents,
     get_incident_by_id,
     update_incident_status,
     get_filter_values,
@@ -39,6 +41,7 @@ from app.modules.incidents.services.comment_service import (
     get_comments_by_incident_id
 )
 from app.modules.incidents.models.incident_model import IncidentStatusEnum
+from app.utils.response_cache import cached_response
 from pydantic import BaseModel
 
 
@@ -54,7 +57,7 @@ router = APIRouter(
 )
 async def fetch_incidents(
         params: IncidentFetchParams = Body(..., description="Incident fetch parameters"),
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
 ):
     return await get_incidents(
         db=db,
@@ -70,9 +73,24 @@ async def fetch_incidents(
         to_date=params.to_date,
         sort_by=params.sort_by,
         order_by=params.order_by,
+        cursor=params.cursor,
+        include_total=params.include_total,
     )
 
 
+@router.post(
+    "/export",
+    dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))],
+)
+async def export_incidents_endpoint(
+        params: IncidentFetchParams = Body(..., description="Incident filters, as for the listing"),
+        format: ExportFormat = Query(ExportFormat.csv, description="csv or ndjson"),
+        gzip: bool = Query(False, description="Gzip the download"),
+        db: AsyncSession = Depends(get_read_db),
+):
+    return await export_incidents(db, params, export_format=format, compress=gzip)
+
+
 # List available filter fields
 @router.get(
     "/filters",
@@ -155,13 +173,14 @@ async def list_available_filters(
                 UserRole.user,
                 UserRole.readonly
             ]))])
+@cached_response
 async def get_filter_values_endpoint(
     filter_name: str,
     type: Optional[IncidentTypeEnum] = Query(None, alias="type"),
     search: Optional[str] = Query(None, description="Search within the filter values"),
     page: int = Query(1, description="Page number"),
     page_size: int = Query(10, description="Number of items per page"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Return distinct filter values for a given filter name.
@@ -285,8 +304,9 @@ async def update_status(
     return incident
 
 @router.get("/severity-count", dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))])
+@cached_response
 async def fetch_incident_severity_counts(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     incident_type: Optional[IncidentTypeEnum] = Query(IncidentTypeEnum.secret, description="Type of incident to filter by")
 ):
 
@@ -319,8 +339,9 @@ async def fetch_incident_by_id(
     summary="Retrieve incident trends",
     description="Fetch trends in incidents grouped by daily, weekly, or monthly intervals."
 )
+@cached_response
 async def get_trends(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     interval: str = Query("monthly", description="Interval type: 'daily', 'weekly', 'monthly'"),
     from_date: Optional[datetime] = Query(None, description="Start date in YYYY-MM-DD format"),
     to_date: Optional[datetime] = Query(None, description="End date in YYYY-MM-DD format"),
@@ -337,8 +358,9 @@ async def get_trends(
     summary="Retrieve incident severity split",
     description="Fetch the distribution of incidents across different severity levels."
 )
+@cached_response
 async def get_severity(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     from_date: Optional[datetime] = Query(None, description="Start date in YYYY-MM-DDTHH:MM:SS format"),
     to_date: Optional[datetime] = Query(None, description="End date in YYYY-MM-DDTHH:MM:SS format"),
     status: Optional[IncidentStatusEnum] = Query(None, description="Filter by incident status"),
@@ -354,8 +376,9 @@ async def get_severity(
     summary="Retrieve top repositories",
     description="Fetch the top repositories based on the number of incidents and severity."
 )
+@cached_response
 async def get_top_repos(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     severities: List[SeverityLevel] = Query(["high", "critical", "low", "medium", "unknown"], description="List of severity levels to filter"),
     repo_length: Optional[int] = Query(5, description="Number of top repositories to retrieve"),
     from_date: Optional[datetime] = Query(None, description="Start date in YYYY-MM-DD format"),
@@ -372,8 +395,9 @@ async def get_top_repos(
     summary="Retrieve repository severity split",
     description="Fetch the count of repositories grouped by severity levels."
 )
+@cached_response
 async def get_repo_count_by_severity_con(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     severities: List[SeverityLevel] = Query(["high", "critical", "low", "medium", "unknown"], description="List of severity levels to filter"),
     from_date: Optional[datetime] = Query(None, description="Start date in YYYY-MM-DD format"),
     to_date: Optional[datetime] = Query(None, description="End date in YYYY-MM-DD format"),
@@ -392,16 +416,13 @@ async def bulk_update_by_ids(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
-    result = await bulk_update_incidents_by_ids(
+    updated_count = await bulk_update_incidents_by_ids(
         db=db,
         incident_ids=update_data.incident_ids,
         update_data=update_data,
         current_user=current_user
     )
-    if not result:
-        raise HTTPException(status_code=404,
-                            detail="Incidents not found or update failed")
-    return {"detail": "Incidents updated successfully"}
+    return {"detail": "Incidents updated successfully", "updated_count": updated_count}
 
 
 @router.patch('/bulk-update/by-filters',
@@ -411,16 +432,13 @@ async def bulk_update_by_filters(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
-    result = await bulk_update_incidents_by_filters(
+    updated_count = await bulk_update_incidents_by_filters(
         db=db,
         filters=update_data.filters,
         update_data=update_data,
         current_user=current_user
     )
-    if not result:
-        raise HTTPException(status_code=404,
-                            detail="Incidents not found or update failed")
-    return {"detail": "Incidents updated successfully"}
+    return {"detail": "Incidents updated successfully", "updated_count": updated_count}
 
 
 
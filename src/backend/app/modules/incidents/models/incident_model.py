@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.db import Base
@@ -22,6 +22,10 @@ class IncidentClosedBy(enum.Enum):
 
 class Incidents(Base):
     __tablename__ = "incidents"
+    __table_args__ = (
+        Index('ix_incidents_type_status_updated_at', 'type', 'status', 'updated_at'),
+        Index('ix_incidents_created_at', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
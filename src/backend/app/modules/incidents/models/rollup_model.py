@@ -0,0 +1,34 @@
+from sqlalchemy import BigInteger, Column, Date, Enum, Integer, String
+
+from app.core.db import Base
+from app.modules.incidents.models.incident_model import IncidentStatusEnum, IncidentTypeEnum
+
+
+class RollupBasis:
+    # Which incident timestamp a rollup row is bucketed by
+    CREATED = "created"
+    UPDATED = "updated"
+
+
+class IncidentDailyRollup(Base):
+    """
+    Number of incidents per day and (type, status, severity, repository, vc),
+    once bucketed by created_at and once by updated_at. Maintained by
+    statement-level triggers on incidents, secrets and vulnerability (see the
+    incident_daily_rollups migration) so the dashboards never aggregate the
+    incidents table. Severity is the lowercase SeverityLevel value.
+
+    Repository is part of the key, so distinct repository counts over any
+    range of days are exact: count(DISTINCT repository_id) over the rows.
+    """
+    __tablename__ = 'incident_daily_rollups'
+
+    id = Column(BigInteger, primary_key=True)
+    basis = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+    type = Column(Enum(IncidentTypeEnum, create_type=False), nullable=False)
+    status = Column(Enum(IncidentStatusEnum, create_type=False), nullable=False)
+    severity = Column(String, nullable=False)
+    repository_id = Column(Integer, nullable=True)
+    vc_id = Column(Integer, nullable=True)
+    incident_count = Column(BigInteger, nullable=False, default=0)
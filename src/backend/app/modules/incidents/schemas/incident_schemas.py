@@ -119,6 +119,9 @@ class IncidentFetchParams(IncidentFilters):
     limit: int = 10
     sort_by: str = "created_at"
     order_by: str = "desc"
+    # Keyset pagination: "" for the first page, then the previous page's next_cursor
+    cursor: Optional[str] = None
+    include_total: bool = True
 
 class BulkIncidentUpdate(BaseModel):
     status: Optional[IncidentStatusEnum]
@@ -4,14 +4,16 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, func, asc
+from sqlalchemy import desc, func, asc, insert, literal, case, cast, update, Integer, String, DateTime
+from sqlalchemy.sql.dml import Update
 
-from app.modules.incidents.models.activity_model import Activity
+from app.modules.incidents.models.activity_model import Activity, Action
+from app.modules.incidents.models.incident_model import Incidents, IncidentStatusEnum, IncidentClosedBy
 from app.modules.incidents.schemas.activity_schemas import ActivityCreate, ActivityResponse
 from app.modules.user.models.user import User
 from app.utils.pagination import paginate
 from sqlalchemy.exc import NoSuchColumnError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
 async def add_activity(
     db: AsyncSession,
@@ -42,6 +44,83 @@ async def add_activity(
     return new_activity
 
 
+async def update_incidents_with_activity(
+    db: AsyncSession,
+    incident_update: Update,
+    action: Action,
+    old_value: Optional[str],
+    new_value: Optional[str],
+    user_id: Optional[int] = None
+) -> int:
+    """
+    Execute an UPDATE on Incidents and log one activity per updated incident
+    in the same statement: the UPDATE runs as a CTE and its RETURNING feeds an
+    INSERT ... SELECT into Activity. Returns the number of incidents updated.
+    """
+    updated = incident_update.returning(Incidents.id).cte("updated_incidents")
+    stmt = insert(Activity).from_select(
+        ["action", "old_value", "new_value", "incident_id", "user_id", "created_at"],
+        select(
+            literal(action, Activity.action.type),
+            literal(old_value, String),
+            literal(new_value, String),
+            updated.c.id,
+            literal(user_id, Integer),
+            literal(datetime.utcnow(), DateTime),
+        )
+    ).add_cte(updated)
+    result = await db.execute(stmt)
+    return result.rowcount or 0
+
+
+async def update_incident_status_with_activity(
+    db: AsyncSession,
+    condition,
+    status: IncidentStatusEnum,
+    action: Action,
+    user_id: Optional[int] = None,
+    closed_by: Optional[IncidentClosedBy] = None
+) -> int:
+    """
+    Move every incident matching `condition` that is not already in `status`
+    to it and log one activity per moved incident with its previous status,
+    in a single statement. The UPDATE joins a pre-update snapshot of
+    incidents so RETURNING can report (id, old status), and feeds a
+    multi-row INSERT ... SELECT into Activity. Returns the number of
+    incidents updated.
+    """
+    previous = aliased(Incidents)
+    values = {"status": status, "updated_at": datetime.utcnow()}
+    if closed_by:
+        values["closed_by"] = closed_by
+
+    updated = (
+        update(Incidents)
+        .where(Incidents.id == previous.id, Incidents.status != status, condition)
+        .values(**values)
+        .returning(Incidents.id, previous.status.label("old_status"))
+        .cte("updated_incidents")
+    )
+    # Activities record statuses by value ("in-progress"), the column by name
+    old_value = case(
+        {member.name: member.value for member in IncidentStatusEnum},
+        value=cast(updated.c.old_status, String),
+    )
+    stmt = insert(Activity).from_select(
+        ["action", "old_value", "new_value", "incident_id", "user_id", "created_at"],
+        select(
+            literal(action, Activity.action.type),
+            old_value,
+            literal(status.value, String),
+            updated.c.id,
+            literal(user_id, Integer),
+            literal(datetime.utcnow(), DateTime),
+        )
+    ).add_cte(updated)
+    result = await db.execute(stmt)
+    return result.rowcount or 0
+
+
 async def get_activities(
     db: AsyncSession,
     incident_id: int,
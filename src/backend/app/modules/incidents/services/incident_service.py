@@ -1,21 +1,28 @@
 from app.modules.incidents.schemas.activity_schemas import ActivityCreate
-from app.modules.incidents.services.activity_service import add_activity
+from app.modules.incidents.services.activity_service import add_activity, update_incident_status_with_activity
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session, joinedload, selectinload
 from app.modules.incidents.models.incident_model import Incidents, IncidentClosedBy
-from app.modules.incidents.schemas.incident_schemas import IncidentBase, IncidentUpdate, IncidentStatusEnum, IncidentTypeEnum, IncidentResponse, IncidentFilters, BulkIncidentUpdate
+from app.modules.incidents.models.rollup_model import IncidentDailyRollup, RollupBasis
+from app.modules.incidents.schemas.incident_schemas import IncidentBase, IncidentUpdate, IncidentStatusEnum, IncidentTypeEnum, IncidentResponse, IncidentFilters, IncidentFetchParams, BulkIncidentUpdate
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, keyset_paginate, keyset_page
+from app.utils.counting import count_rows
+from app.utils.export import ExportFormat, export_response
+from app.utils.single_flight import single_flight
+from app.modules.facets.facet_service import is_faceted, get_facet_values
 from typing import List, Optional
+from fastapi import HTTPException
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import desc, extract, func
 from app.modules.user.models.user import User
 from app.modules.incidents.models.activity_model import Action
-from app.modules.secrets.model.secrets_model import Secrets, SeverityLevel, ScanType
+from app.modules.secrets.model.secrets_model import Secrets, SeverityLevel, ScanType, secret_value_in
 from sqlalchemy import func, distinct
 from app.modules.repository.models.repository import Repo
-from sqlalchemy import select, func, literal_column, update, distinct, cast, String, or_
+from sqlalchemy import select, func, literal_column, update, distinct, cast, String, Integer, or_, any_
+from sqlalchemy.dialects.postgresql import ARRAY
 from app.modules.groups.models.group_model import Group
 from typing import Dict
 from app.modules.pr.models.pr import PR
@@ -55,6 +62,7 @@ async def create_incident(db: AsyncSession, incident: IncidentBase):
     return new_incident
 
 
+@single_flight
 async def count_incidents_by_severity(
         db: AsyncSession,
         incident_type: Optional[IncidentTypeEnum]
@@ -70,47 +78,25 @@ async def count_incidents_by_severity(
     # Define the statuses to filter on
     statuses = [IncidentStatusEnum.OPEN, IncidentStatusEnum.IN_PROGRESS]
 
-    if incident_type == IncidentTypeEnum.secret:
-        # Query for secret incidents using the Secrets table (severity is an enum)
-        query = (
-            select(Secrets.severity, func.count(Secrets.id))
-            .join(Incidents, Secrets.id == Incidents.secret_id)
-            .where(
-                Incidents.type == incident_type,
-                Incidents.status.in_(statuses)
-            )
-            .group_by(Secrets.severity)
-        )
-        result = await db.execute(query)
-        # The result is already keyed by a SeverityLevel enum.
-        severity_counts = dict(result.all())
+    if incident_type is None:
+        return []
 
-    elif incident_type == IncidentTypeEnum.vulnerability:
-        # Query for vulnerability incidents using the Vulnerability table (severity stored as string)
-        query = (
-            select(Vulnerability.severity, func.count(Vulnerability.id))
-            .join(Incidents, Vulnerability.id == Incidents.vulnerability_id)
-            .where(
-                Incidents.type == incident_type,
-                Incidents.status.in_(statuses)
-            )
-            .group_by(Vulnerability.severity)
+    # Every incident is counted in exactly one created-basis bucket
+    query = (
+        select(IncidentDailyRollup.severity, func.sum(IncidentDailyRollup.incident_count))
+        .where(
+            IncidentDailyRollup.basis == RollupBasis.CREATED,
+            IncidentDailyRollup.type == incident_type,
+            IncidentDailyRollup.status.in_(statuses)
         )
-        result = await db.execute(query)
-        raw_counts = result.all()
-        severity_counts = {}
-        # Convert the returned string to a SeverityLevel enum.
-        for sev_str, count in raw_counts:
-            try:
-                # Normalize the string for conversion (if stored in lower-case, adjust accordingly)
-                sev_enum = SeverityLevel(sev_str.lower())
-                severity_counts[sev_enum] = count
-            except ValueError:
-                # If conversion fails, skip or handle as desired.
-                continue
-    else:
-        # Optionally, handle the case where incident_type is not provided.
-        return []
+        .group_by(IncidentDailyRollup.severity)
+    )
+    severity_counts = {}
+    for severity, count in (await db.execute(query)).all():
+        try:
+            severity_counts[SeverityLevel(severity)] = int(count)
+        except ValueError:
+            continue
 
     # Build the response using the predefined severity_labels.
     response = [
@@ -126,46 +112,20 @@ async def count_incidents_by_severity(
     return response
 
 
-async def get_incidents(
-    db: AsyncSession,
+def _incidents_query(
     filters: IncidentFilters,
     incident_type: IncidentTypeEnum,
-    page: int = 1,
-    limit: int = 10,
     repo_ids: Optional[List[int]] = None,
     vc_ids: Optional[List[int]] = None,
     pr_ids: Optional[List[int]] = None,
-    group_ids: Optional[List[int]] = None,
     from_date: Optional[datetime] = None,
     to_date: Optional[datetime] = None,
-    sort_by: Optional[str] = "created_at",
-    order_by: Optional[str] = "desc",
-) -> dict:
-    # Step 1: (Optional) Resolve repository IDs from group_ids if provided.
-    if group_ids:
-        group_repo_query = (
-            select(Repo.id)
-            .join(Group.repos)
-            .where(Group.id.in_(group_ids))
-        )
-        group_repo_result = await db.execute(group_repo_query)
-        group_repo_ids = [row[0] for row in group_repo_result.fetchall()]
-
-        if repo_ids:
-            repo_ids = list(set(repo_ids).intersection(group_repo_ids))
-        else:
-            repo_ids = group_repo_ids
-
-        if group_ids and not repo_ids:
-            return {
-                "data": [],
-                "current_page": 0,
-                "total_pages": 0,
-                "current_limit": 0,
-                "total_count": 0,
-            }
-
-    # Step 2: Build base query with appropriate joins.
+):
+    """
+    select(Incidents) of one type with the joins and WHERE conditions for
+    `filters`, shared by the listing and the bulk updates.
+    """
+    # Build base query with appropriate joins.
     if incident_type == IncidentTypeEnum.secret:
         # For secret incidents, join the Secrets table and its related repository and PR.
         query = (
@@ -173,10 +133,6 @@ async def get_incidents(
             .outerjoin(Secrets, Incidents.secret_id == Secrets.id)
             .outerjoin(Repo, Secrets.repository_id == Repo.id)
             .outerjoin(PR, Secrets.pr_id == PR.id)
-            .options(
-                selectinload(Incidents.secret).selectinload(Secrets.repository),
-                selectinload(Incidents.secret).selectinload(Secrets.pr),
-            )
             .where(Incidents.type == incident_type)
         )
     else:  # Assume vulnerability
@@ -185,9 +141,6 @@ async def get_incidents(
             select(Incidents)
             .outerjoin(Vulnerability, Incidents.vulnerability_id == Vulnerability.id)
             .outerjoin(Repo, Vulnerability.repository_id == Repo.id)
-            .options(
-                selectinload(Incidents.vulnerability).selectinload(Vulnerability.repository),
-            )
             .where(Incidents.type == incident_type)
         )
 
@@ -214,7 +167,7 @@ async def get_incidents(
     # ---------------------------------
     if incident_type == IncidentTypeEnum.secret:
         if filters.secrets:
-            filters_to_apply.append(Secrets.secret.in_(filters.secrets))
+            filters_to_apply.append(secret_value_in(filters.secrets))
         if filters.rules:
             filters_to_apply.append(Secrets.rule.in_(filters.rules))
         if filters.commits:
@@ -317,6 +270,71 @@ async def get_incidents(
     for condition in filters_to_apply:
         query = query.where(condition)
 
+    return query
+
+
+async def _group_repo_ids(
+    db: AsyncSession,
+    group_ids: List[int],
+    repo_ids: Optional[List[int]] = None,
+) -> List[int]:
+    """Repositories of the groups, narrowed to repo_ids when both are given."""
+    group_repo_query = (
+        select(Repo.id)
+        .join(Group.repos)
+        .where(Group.id.in_(group_ids))
+    )
+    group_repo_result = await db.execute(group_repo_query)
+    group_repo_ids = [row[0] for row in group_repo_result.fetchall()]
+
+    if repo_ids:
+        return list(set(repo_ids).intersection(group_repo_ids))
+    return group_repo_ids
+
+
+@single_flight
+async def get_incidents(
+    db: AsyncSession,
+    filters: IncidentFilters,
+    incident_type: IncidentTypeEnum,
+    page: int = 1,
+    limit: int = 10,
+    repo_ids: Optional[List[int]] = None,
+    vc_ids: Optional[List[int]] = None,
+    pr_ids: Optional[List[int]] = None,
+    group_ids: Optional[List[int]] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    sort_by: Optional[str] = "created_at",
+    order_by: Optional[str] = "desc",
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+) -> dict:
+    # Step 1: (Optional) Resolve repository IDs from group_ids if provided.
+    if group_ids:
+        repo_ids = await _group_repo_ids(db, group_ids, repo_ids)
+
+        if not repo_ids:
+            return {
+                "data": [],
+                "current_page": 0,
+                "total_pages": 0,
+                "current_limit": 0,
+                "total_count": 0,
+            }
+
+    # Step 2: Build the filtered query and load the finding each incident points at.
+    query = _incidents_query(filters, incident_type, repo_ids, vc_ids, pr_ids, from_date, to_date)
+    if incident_type == IncidentTypeEnum.secret:
+        query = query.options(
+            selectinload(Incidents.secret).selectinload(Secrets.repository),
+            selectinload(Incidents.secret).selectinload(Secrets.pr),
+        )
+    else:
+        query = query.options(
+            selectinload(Incidents.vulnerability).selectinload(Vulnerability.repository),
+        )
+
     # ---------------------------------
     # Sorting - use asc/desc for sort_by field
     # ---------------------------------
@@ -331,11 +349,20 @@ async def get_incidents(
     # ---------------------------------
     # Pagination
     # ---------------------------------
-    total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
-    offset = (page - 1) * limit
-    paginated_query = query.limit(limit).offset(offset)
-    result = await db.execute(paginated_query)
-    incidents = result.scalars().all()
+    total_count, approximate = await count_rows(db, query) if include_total else (None, False)
+    if cursor is not None:
+        # Keyset pagination: the sort value is selected alongside each incident to build the next cursor
+        pagination = keyset_paginate(
+            query.add_columns(sort_column), sort_column, Incidents.id, cursor, limit,
+            descending=order_by == "desc", total_count=total_count, approximate=approximate)
+        result = await db.execute(pagination["query"])
+        rows = keyset_page(result.all(), pagination, lambda row: (row[1], row[0].id))
+        incidents = [row[0] for row in rows]
+    else:
+        offset = (page - 1) * limit
+        paginated_query = query.limit(limit).offset(offset)
+        result = await db.execute(paginated_query)
+        incidents = result.scalars().all()
 
     # Build and return the response.
     response_data = [
@@ -359,17 +386,54 @@ async def get_incidents(
         for incident in incidents
     ]
 
-    total_pages = (total_count + limit - 1) // limit if limit > 0 else 1
+    if cursor is not None:
+        return {"data": response_data, **pagination["meta"]}
+
+    total_pages = (total_count + limit - 1) // limit if limit > 0 and total_count is not None else None
 
     return {
         "data": response_data,
         "current_page": page,
         "current_limit": limit,
         "total_count": total_count,
+        "total_count_approximate": approximate,
         "total_pages": total_pages,
     }
 
 
+INCIDENT_EXPORT_COLUMNS = [
+    ("id", Incidents.id),
+    ("name", Incidents.name),
+    ("type", Incidents.type),
+    ("status", Incidents.status),
+    ("closed_by", Incidents.closed_by),
+    ("secret_id", Incidents.secret_id),
+    ("vulnerability_id", Incidents.vulnerability_id),
+    ("repository_id", Repo.id),
+    ("repository_name", Repo.name),
+    ("created_at", Incidents.created_at),
+    ("updated_at", Incidents.updated_at),
+]
+
+
+async def export_incidents(
+    db: AsyncSession,
+    params: IncidentFetchParams,
+    export_format: ExportFormat = ExportFormat.csv,
+    compress: bool = False,
+):
+    """Every incident matching the listing's filters, streamed as a download."""
+    repo_ids = params.repo_ids
+    if params.group_ids:
+        # No repository in the groups: export nothing rather than everything
+        repo_ids = await _group_repo_ids(db, params.group_ids, repo_ids) or [-1]
+
+    query = _incidents_query(
+        params, params.incident_type, repo_ids, params.vc_ids, params.pr_ids, params.from_date, params.to_date
+    ).order_by(Incidents.id)
+    return export_response(query, INCIDENT_EXPORT_COLUMNS, "incidents", export_format, compress)
+
+
 async def get_filter_values(
     db: AsyncSession,
     filter_name: str,
@@ -421,6 +485,14 @@ async def get_filter_values(
         if not column:
             raise ValueError(f"Invalid filter name: {filter_name}")
 
+        if is_faceted(column):
+            values, total_count = await get_facet_values(db, column, search, page, page_size)
+            formatted_values = [
+                {"label": getattr(value, "value", str(value)), "value": getattr(value, "value", str(value))}
+                for value, _ in values
+            ]
+            return {"values": formatted_values, "total": total_count}
+
         query = select(distinct(column)).where(column.isnot(None))
 
     # Apply search filter using ilike only (for free‑text search)
@@ -605,6 +677,30 @@ async def get_incident_by_id(db, incident_id: int) -> IncidentResponse:
     return incident
 
 
+def _rollup_filters(
+    basis: str,
+    from_date: datetime,
+    to_date: datetime,
+    incident_type: Optional[IncidentTypeEnum],
+    status: Optional[IncidentStatusEnum] = None,
+):
+    """
+    Rollup rows of one basis whose day falls within [from_date, to_date].
+    Buckets are whole days, so partial days at either end count in full.
+    Without an incident_type the dashboards have always reported secrets.
+    """
+    filters = [
+        IncidentDailyRollup.basis == basis,
+        IncidentDailyRollup.type == (incident_type or IncidentTypeEnum.secret),
+        IncidentDailyRollup.day >= from_date.date(),
+        IncidentDailyRollup.day <= to_date.date(),
+    ]
+    if status:
+        filters.append(IncidentDailyRollup.status == status)
+    return filters
+
+
+@single_flight
 async def get_trend(
     db: AsyncSession,
     interval: str = "monthly",
@@ -628,98 +724,47 @@ async def get_trend(
         else:
             return {"error": "Invalid interval. Use 'daily', 'weekly', or 'monthly'."}
 
-    # Decide which table to join
-    if incident_type == IncidentTypeEnum.vulnerability:
-        join_table = Vulnerability
-        join_condition = (Incidents.vulnerability_id == Vulnerability.id)
-        repo_id_col = Vulnerability.repository_id
-    else:
-        # Default to Secrets
-        join_table = Secrets
-        join_condition = (Incidents.secret_id == Secrets.id)
-        repo_id_col = Secrets.repository_id
-
-    # Base query components
-    group_by = Incidents.updated_at
-    count_incidents = func.count(Incidents.id).label("incident_count")
-    distinct_repos = func.count(func.distinct(repo_id_col)).label("repo_count")
-
-    # Build query per interval
+    # Daily buckets by updated_at, rolled up to the requested interval
+    day = IncidentDailyRollup.day
     if interval == "daily":
-        query = (
-            select(
-                func.date(group_by).label("date"),
-                count_incidents,
-                distinct_repos
-            )
-            .join(join_table, join_condition)
-            .where(group_by >= from_date, group_by <= to_date)
-            .group_by(func.date(group_by))
-        )
+        buckets = [day]
     elif interval == "weekly":
-        query = (
-            select(
-                extract("year", group_by).label("year"),
-                extract("week", group_by).label("week"),
-                count_incidents,
-                distinct_repos
-            )
-            .join(join_table, join_condition)
-            .where(group_by >= from_date, group_by <= to_date)
-            .group_by(extract("year", group_by), extract("week", group_by))
-        )
+        buckets = [extract("year", day), extract("week", day)]
     elif interval == "monthly":
-        query = (
-            select(
-                extract("year", group_by).label("year"),
-                extract("month", group_by).label("month"),
-                count_incidents,
-                distinct_repos
-            )
-            .join(join_table, join_condition)
-            .where(group_by >= from_date, group_by <= to_date)
-            .group_by(extract("year", group_by), extract("month", group_by))
-        )
+        buckets = [extract("year", day), extract("month", day)]
     else:
         return {"error": "Invalid interval. Use 'daily', 'weekly', or 'monthly'."}
 
-    # Apply optional filters
-    if status:
-        query = query.where(Incidents.status == status)
-    if incident_type:
-        query = query.where(Incidents.type == incident_type)
+    query = (
+        select(
+            *buckets,
+            func.sum(IncidentDailyRollup.incident_count).label("incident_count"),
+            func.count(func.distinct(IncidentDailyRollup.repository_id)).label("repo_count")
+        )
+        .where(*_rollup_filters(RollupBasis.UPDATED, from_date, to_date, incident_type, status))
+        .group_by(*buckets)
+        .order_by(*buckets)
+    )
 
     # Execute query
     rows = (await db.execute(query)).all()
 
     # Build response data
     if interval == "daily":
-        incident_data = [
-            {
-                "date": row.date.strftime("%Y-%m-%d"),
-                "incident_count": row.incident_count,
-                "repo_count": row.repo_count
-            }
-            for row in rows
-        ]
+        labels = [row[0].strftime("%Y-%m-%d") for row in rows]
     elif interval == "weekly":
-        incident_data = [
-            {
-                "date": f"{int(row.year)}-W{int(row.week)}",
-                "incident_count": row.incident_count,
-                "repo_count": row.repo_count
-            }
-            for row in rows
-        ]
+        labels = [f"{int(row[0])}-W{int(row[1])}" for row in rows]
     else:  # monthly
-        incident_data = [
-            {
-                "date": f"{int(row.year)}-{int(row.month):02d}",
-                "incident_count": row.incident_count,
-                "repo_count": row.repo_count
-            }
-            for row in rows
-        ]
+        labels = [f"{int(row[0])}-{int(row[1]):02d}" for row in rows]
+
+    incident_data = [
+        {
+            "date": label,
+            "incident_count": int(row.incident_count),
+            "repo_count": row.repo_count
+        }
+        for label, row in zip(labels, rows)
+    ]
 
     return {
         "interval": interval,
@@ -729,6 +774,7 @@ async def get_trend(
     }
 
 
+@single_flight
 async def get_severity_breakdown(
     db: AsyncSession,
     from_date: Optional[datetime] = None,
@@ -744,53 +790,27 @@ async def get_severity_breakdown(
     if not from_date:
         from_date = to_date - timedelta(days=30)
 
-    # Decide which table/column to use based on incident_type
-    if incident_type == IncidentTypeEnum.vulnerability:
-        join_table = Vulnerability
-        join_condition = (Incidents.vulnerability_id == Vulnerability.id)
-        severity_column = Vulnerability.severity
-    else:
-        # Default to Secrets
-        join_table = Secrets
-        join_condition = (Incidents.secret_id == Secrets.id)
-        severity_column = Secrets.severity
-
-    group_by = Incidents.updated_at
-
-    # Build the query
     query = (
         select(
-            severity_column,
-            func.count(Incidents.id).label("incident_count")
+            IncidentDailyRollup.severity,
+            func.sum(IncidentDailyRollup.incident_count).label("incident_count")
         )
-        .join(join_table, join_condition)
-        .where(group_by >= from_date, group_by <= to_date)
-        .group_by(severity_column)
+        .where(*_rollup_filters(RollupBasis.UPDATED, from_date, to_date, incident_type, status))
+        .group_by(IncidentDailyRollup.severity)
     )
 
-    # Apply optional status and incident_type filters
-    if status:
-        query = query.where(Incidents.status == status)
-    if incident_type:
-        query = query.where(Incidents.type == incident_type)
-
     # Execute the query
     rows = (await db.execute(query)).all()
 
     # Build the result
-    severity_data = []
-    for row in rows:
-        severity = row[0]
-        if isinstance(severity, str):
-            severity_value = severity
-        else:
-            severity_value = severity.value
-
-        severity_data.append({
-            "value": severity_value,  # Use the extracted string value
-            "label": severity_value.capitalize(),  # Capitalize for a human-readable label
-            "count": row[1]
-        })
+    severity_data = [
+        {
+            "value": row.severity,
+            "label": row.severity.capitalize(),  # Capitalize for a human-readable label
+            "count": int(row.incident_count)
+        }
+        for row in rows
+    ]
 
     response_content = {
         "severity_breakdown": severity_data,
@@ -800,6 +820,7 @@ async def get_severity_breakdown(
 
     return response_content
 
+@single_flight
 async def get_incidents_top_repo(
     db: AsyncSession,
     severities: List[SeverityLevel],  # or strings
@@ -815,45 +836,36 @@ async def get_incidents_top_repo(
     if from_date is None:
         from_date = to_date - timedelta(days=30)
 
-    # Decide which table/columns to join
-    if incident_type == IncidentTypeEnum.vulnerability:
-        join_table = Vulnerability
-        join_condition = (Vulnerability.id == Incidents.vulnerability_id)
-        severity_col = Vulnerability.severity
-        repo_col = Vulnerability.repository_id
-    else:
-        join_table = Secrets
-        join_condition = (Secrets.id == Incidents.secret_id)
-        severity_col = Secrets.severity
-        repo_col = Secrets.repository_id
-
     normalized_severities = [
         s.value.lower() if hasattr(s, 'value') else str(s).lower()
         for s in severities
     ]
 
+    repo_counts = (
+        select(
+            IncidentDailyRollup.repository_id,
+            func.sum(IncidentDailyRollup.incident_count).label("incident_count")
+        )
+        .where(
+            *_rollup_filters(RollupBasis.CREATED, from_date, to_date, incident_type),
+            IncidentDailyRollup.severity.in_(normalized_severities)
+        )
+        .group_by(IncidentDailyRollup.repository_id)
+        .subquery()
+    )
+
     query = (
         select(
             Repo.id.label("repository_id"),
             Repo.name.label("repository_name"),
             Repo.author.label("repository_author"),
-            func.count(Incidents.id).label("incident_count")
-        )
-        .join(join_table, join_condition)
-        .join(Repo, repo_col == Repo.id)
-        .where(
-            Incidents.created_at >= from_date,
-            Incidents.created_at <= to_date,
-            func.lower(cast(severity_col, String)).in_(normalized_severities)
+            repo_counts.c.incident_count
         )
-        .group_by(Repo.id)
-        .order_by(desc(func.count(Incidents.id)))
+        .join(repo_counts, repo_counts.c.repository_id == Repo.id)
+        .order_by(desc(repo_counts.c.incident_count))
         .limit(repo_length)
     )
 
-    if incident_type:
-        query = query.where(Incidents.type == incident_type)
-
     result = await db.execute(query)
     repos = result.all()
 
@@ -863,7 +875,7 @@ async def get_incidents_top_repo(
             "repository_id": row.repository_id,
             "repository_name": row.repository_name,
             "repository_author": row.repository_author,
-            "incident_count": row.incident_count
+            "incident_count": int(row.incident_count)
         }
         for row in repos
     ]
@@ -876,8 +888,7 @@ async def get_incidents_top_repo(
     }
 
 
-from sqlalchemy import cast, String, func
-
+@single_flight
 async def get_repo_count_by_severity(
     db: AsyncSession,
     severities: List[SeverityLevel],
@@ -898,50 +909,29 @@ async def get_repo_count_by_severity(
         for s in severities
     ]
 
-    # Decide which table to join (Secrets vs. Vulnerabilities)
-    if incident_type == IncidentTypeEnum.vulnerability:
-        join_table = Vulnerability
-        join_condition = (Incidents.vulnerability_id == Vulnerability.id)
-        severity_col = Vulnerability.severity
-        repo_id_col = Vulnerability.repository_id
-    else:
-        join_table = Secrets
-        join_condition = (Incidents.secret_id == Secrets.id)
-        severity_col = Secrets.severity
-        repo_id_col = Secrets.repository_id
-
-    # Build the query
+    # Repository is part of the rollup key, so the distinct count is exact
     query = (
         select(
-            severity_col.label("severity"),
-            func.count(func.distinct(Repo.id)).label("repo_count"),
+            IncidentDailyRollup.severity,
+            func.count(func.distinct(IncidentDailyRollup.repository_id)).label("repo_count"),
         )
-        .join(Incidents, join_condition)
-        .join(Repo, repo_id_col == Repo.id)
         .where(
-            Incidents.created_at >= from_date,
-            Incidents.created_at <= to_date,
-            # Cast the severity to String, then apply lower() for case-insensitive matching
-            func.lower(cast(severity_col, String)).in_(normalized_severities),
+            *_rollup_filters(RollupBasis.CREATED, from_date, to_date, incident_type),
+            IncidentDailyRollup.severity.in_(normalized_severities),
+            IncidentDailyRollup.repository_id.isnot(None),
         )
-        .group_by(severity_col)
+        .group_by(IncidentDailyRollup.severity)
     )
 
-    if incident_type:
-        query = query.where(Incidents.type == incident_type)
-
     result = await db.execute(query)
-    severity_repo_counts = result.all()
-
-    repo_data_by_severity = []
-    for row in severity_repo_counts:
-        severity_value = row[0].value if hasattr(row[0], "value") else str(row[0])
-        repo_data_by_severity.append(
-            {
-                "severity": severity_value,
-                "repo_count": row[1],
-            }
-        )
+
+    repo_data_by_severity = [
+        {
+            "severity": row.severity,
+            "repo_count": row.repo_count,
+        }
+        for row in result.all()
+    ]
 
     return {
         "severities": severities,
@@ -952,24 +942,47 @@ async def get_repo_count_by_severity(
 
 
 
+STATUS_ACTIONS = {
+    IncidentStatusEnum.OPEN: Action.INCIDENT_OPENED,
+    IncidentStatusEnum.IN_PROGRESS: Action.INCIDENT_IN_PROGRESS,
+    IncidentStatusEnum.CLOSED: Action.INCIDENT_CLOSED,
+}
+
+
+async def _bulk_update_status(
+    db: AsyncSession,
+    condition,
+    status: Optional[IncidentStatusEnum],
+    current_user: User
+) -> int:
+    if status is None:
+        return 0
+
+    updated_count = await update_incident_status_with_activity(
+        db,
+        condition,
+        status,
+        STATUS_ACTIONS[status],
+        user_id=current_user.id if current_user else None,
+        closed_by=IncidentClosedBy.USER if status == IncidentStatusEnum.CLOSED else None,
+    )
+    await db.commit()
+    return updated_count
+
+
 async def bulk_update_incidents_by_ids(
     db: AsyncSession,
     incident_ids: List[int],
     update_data: BulkIncidentUpdate,
     current_user: User
-) -> bool:
-    query = select(Incidents).where(Incidents.id.in_(incident_ids))
-    result = await db.execute(query)
-    incidents = result.scalars().all()
+) -> int:
+    """Set the status of the given incidents in one statement. Returns how many changed."""
+    if not incident_ids:
+        return 0
 
-    if not incidents:
-        return True
-
-    for incident in incidents:
-        await update_incident_status(db, incident.id, update_data.status, current_user)
-
-    await db.commit()
-    return True
+    # One array parameter, however many ids are sent
+    condition = Incidents.id == any_(cast(list(set(incident_ids)), ARRAY(Integer)))
+    return await _bulk_update_status(db, condition, update_data.status, current_user)
 
 
 async def bulk_update_incidents_by_filters(
@@ -977,25 +990,20 @@ async def bulk_update_incidents_by_filters(
     filters: IncidentFilters,
     update_data: BulkIncidentUpdate,
     current_user: User
-) -> bool:
-    page = 1  # Start with the first page
-    batch_size = 1000  # Set the batch size to 1000
-
-    # Loop until there are no more incidents to update
-    while True:
-        # Get a batch of incidents with the current page
-        incidents_data = await get_incidents(db=db, filters=filters, page=page, limit=batch_size)
-        incidents = incidents_data["data"]
-
-        # If no incidents are found, exit the loop
-        if not incidents:
-            break
-
-        # Update each incident in the current batch
-        for incident in incidents:
-            await update_incident_status(db, incident["id"], update_data.status, current_user)
-
-        # Move to the next page
-        page += 1
-
-    return True
+) -> int:
+    """
+    Set the status of every incident matching `filters` in one statement,
+    resolving the filters to an id subquery rather than paging over the
+    rows being changed. Returns how many changed.
+    """
+    # Type-specific filters only apply to their own type, so an untyped
+    # filter set would silently match every incident of the other type
+    if filters.incident_type is None:
+        raise HTTPException(status_code=400, detail="incident_type is required to bulk update by filters")
+
+    matching = (
+        _incidents_query(filters, filters.incident_type)
+        .with_only_columns(Incidents.id)
+        .correlate(None)
+    )
+    return await _bulk_update_status(db, Incidents.id.in_(matching), update_data.status, current_user)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.licenses.licenses_schema import LicenseCreate, LicenseVerify
-from app.modules.licenses.licesses_service import create_license, validate_license, verify_license
+from app.modules.licenses.licesses_service import create_license, is_license_valid, verify_license
 from app.core.db import get_db
 from app.modules.auth.auth_utils import role_required
 from app.modules.user.models.user import UserRole
@@ -31,9 +31,9 @@ async def verify_license_route(license_req: LicenseVerify, db: AsyncSession = De
 @router.get("/validate", dependencies=[])
 async def validate_license_route(db: AsyncSession = Depends(get_db)):
     """
-    Endpoint to validate the existing license token locally or via the server.
+    Endpoint to report whether the license is valid, from the cached license state.
     """
-    is_valid = await validate_license(db)
+    is_valid = await is_license_valid(db)
     return {
         "valid": is_valid
     }
@@ -1,7 +1,10 @@
 import uuid
+import asyncio
 import hashlib
 import platform
 import requests
+import httpx
+from functools import lru_cache
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional
@@ -61,6 +64,7 @@ async def get_token(db: AsyncSession) -> Optional[str]:
 # 2. Fingerprint Generation
 #########################;/......###############################################
 
+@lru_cache(maxsize=1)
 def get_machine_fingerprint() -> str:
     """
     Generate a machine fingerprint by hashing several system attributes:
@@ -147,6 +151,7 @@ async def verify_license(db: AsyncSession, otp: str, license_id: str):
             "email": data.get('email'),
             "hardware_id": data.get('hardware_id'),
         }
+        await refresh_license_state(db)
         return True
 
     except requests.RequestException as e:
@@ -180,13 +185,14 @@ async def validate_license(db: AsyncSession) -> bool:
             "licenseKey": token,
             "hardwareId": get_machine_fingerprint()
         }
-        response = requests.post(url, json=payload, timeout=5)
+        async with httpx.AsyncClient(timeout=5) as client:
+            response = await client.post(url, json=payload)
         data = response.json()
         valid = data.get("valid")
         if not valid:
             print(f"Invalid token")
             return False
-    except requests.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         print(f"Unable to validate license from server {url}: {e}")
         
     
@@ -220,8 +226,66 @@ async def validate_license(db: AsyncSession) -> bool:
         print(f"License token is error. {e}")
         return False
 
+class LicenseState:
+    """
+    Result of the last license validation, kept in memory so the request path
+    only does an O(1) check. A valid result is trusted for LICENSE_CACHE_TTL
+    seconds plus LICENSE_GRACE_PERIOD seconds if refreshes stop succeeding;
+    an invalid result takes effect immediately.
+    """
+
+    def __init__(self):
+        self.valid = False
+        self.checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def update(self, valid: bool):
+        self.valid = valid
+        self.checked_at = time.monotonic()
+
+    @property
+    def checked(self) -> bool:
+        return self.checked_at is not None
+
+    def is_valid(self) -> bool:
+        if not self.valid or self.checked_at is None:
+            return False
+        age = time.monotonic() - self.checked_at
+        return age <= settings.LICENSE_CACHE_TTL + settings.LICENSE_GRACE_PERIOD
+
+
+license_state = LicenseState()
+
+
+async def refresh_license_state(db: AsyncSession) -> bool:
+    async with license_state._lock:
+        valid = await validate_license(db)
+        license_state.update(valid)
+    return valid
+
+
+async def is_license_valid(db: AsyncSession) -> bool:
+    """Cached license check for the request path; validates only before the first refresh."""
+    if not license_state.checked:
+        await refresh_license_state(db)
+    return license_state.is_valid()
+
+
+async def run_license_refresher():
+    """Refresh this process's license state every LICENSE_REFRESH_INTERVAL seconds."""
+    from app.core.db import SessionLocal
+
+    while True:
+        try:
+            async with SessionLocal() as db:
+                await refresh_license_state(db)
+        except Exception as e:
+            logger.error(f"License refresh failed: {e}")
+        await asyncio.sleep(settings.LICENSE_REFRESH_INTERVAL)
+
+
 async def validate_license_cron(db: AsyncSession):
-    valid = await validate_license(db)
+    valid = await refresh_license_state(db)
     if not valid:
         logger.warning("License validation failed! Disabling all VC and Webhooks...")
 
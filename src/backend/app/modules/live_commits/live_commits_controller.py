@@ -16,6 +16,7 @@ from app.modules.auth.auth_utils import role_required, get_current_user
 from app.modules.user.models.user import UserRole
 from typing import List
 from app.modules.live_commits.models.live_commits_scan import LiveCommitScanType
+from app.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/live_commits", tags=["Live Commits"])
 
@@ -58,6 +59,7 @@ async def get_live_commits_endpoint(
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_live_commit_scan_filters_endpoint(
         db: AsyncSession = Depends(get_db)):
     return await get_live_commit_scan_filters(db)
@@ -67,15 +69,19 @@ async def get_live_commit_scan_filters_endpoint(
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_live_commit_scan_filter_values_endpoint(
-        filter_name: str, db: AsyncSession = Depends(get_db)):
-    return await get_live_commit_scan_filter_values(db, filter_name)
+        filter_name: str,
+        search: str = Query(None, description="Prefix of the values to return"),
+        db: AsyncSession = Depends(get_db)):
+    return await get_live_commit_scan_filter_values(db, filter_name, search)
 
 
 @router.get("/filters",
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_live_commit_filters_endpoint(db: AsyncSession = Depends(get_db)):
     return await get_live_commit_filters(db)
 
@@ -84,9 +90,12 @@ async def get_live_commit_filters_endpoint(db: AsyncSession = Depends(get_db)):
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_live_commit_filter_values_endpoint(
-        filter_name: str, db: AsyncSession = Depends(get_db)):
-    return await get_live_commit_filter_values(db, filter_name)
+        filter_name: str,
+        search: str = Query(None, description="Prefix of the values to return"),
+        db: AsyncSession = Depends(get_db)):
+    return await get_live_commit_filter_values(db, filter_name, search)
 
 
 # Route to get live commits for a specific scan ID
@@ -122,6 +131,8 @@ async def get_live_commits_scan_endpoint(
     search: str = Query(None, description="Search across all parameters"),
     sort_by: str = Query(None, description="Sort by 'repo_count', 'secret_count', or 'vulnerability_count'"),
     order_by: str = Query('asc', description="Order by 'asc' or 'desc'"),  # Default to ascending order
+    cursor: str = Query(None, description="Keyset cursor: empty for the first page, then next_cursor"),
+    include_total: bool = Query(True, description="Compute the total count"),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
@@ -138,7 +149,9 @@ async def get_live_commits_scan_endpoint(
         live_commit_scan_type=scan_type,
         search=search,
         sort_by=sort_by,
-        order_by=order_by
+        order_by=order_by,
+        cursor=cursor,
+        include_total=include_total
     )
 
     if not live_commit_scans["data"]:
@@ -9,7 +9,7 @@ from sqlalchemy.sql import text
 
 from app.modules.live_commits.models.live_commits_scan import LiveCommitScan
 from app.modules.live_commits.schemas.live_commits_schemas import LiveCommitScanCreate
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, keyset_paginate, keyset_page
 from app.modules.pr.models.pr_scan import StatusEnum
 from app.modules.live_commits.live_commits_service import get_commits_for_scan
 from sqlalchemy.orm import joinedload
@@ -19,10 +19,15 @@ from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 from app.modules.vc.models.vc import VC
 from app.modules.repository.models.repository import Repo
 from app.modules.live_commits.models.live_commits import LiveCommit
+from app.utils.search import search_document, matches, search_int, search_enum
+from app.modules.facets.facet_service import get_facet_values
 import logging
 from sqlalchemy.exc import SQLAlchemyError
 logger = logging.getLogger(__name__)
 
+# Matches the ix_live_commits_search_trgm index expression
+LIVE_COMMIT_SEARCH_DOCUMENT = search_document(LiveCommit.commit_id, LiveCommit.commit_msg, LiveCommit.author_name)
+
 async def add_live_commit_scan(
         db: AsyncSession,
         live_commit_scan: LiveCommitScanCreate):
@@ -53,7 +58,9 @@ async def get_live_commits_scan(
     live_commit_scan_type: LiveCommitScanType = None,
     search: str = None,
     sort_by: str = None,
-    order_by: str = "asc"
+    order_by: str = "asc",
+    cursor: str = None,
+    include_total: bool = True
 ):
     # Filters
     filters = []
@@ -70,16 +77,15 @@ async def get_live_commits_scan(
     if commit_msg:
         filters.append(LiveCommit.commit_msg.ilike(f"%{commit_msg}%"))
     if search:
-        search_filter = or_(
-            cast(LiveCommitScan.vc_id, String).ilike(f"%{search}%"),
-            cast(LiveCommitScan.repo_id, String).ilike(f"%{search}%"),
-            cast(LiveCommitScan.scan_type, String).ilike(f"%{search}%"),
-            cast(LiveCommitScan.status, String).ilike(f"%{search}%"),
-            LiveCommit.commit_id.ilike(f"%{search}%"),
-            LiveCommit.commit_msg.ilike(f"%{search}%"),
-            LiveCommit.author_name.ilike(f"%{search}%")
-        )
-        filters.append(search_filter)
+        conditions = [matches(LIVE_COMMIT_SEARCH_DOCUMENT, search)]
+        search_id = search_int(search)
+        if search_id is not None:
+            conditions += [LiveCommitScan.vc_id == search_id, LiveCommitScan.repo_id == search_id]
+        for column, enum_class in ((LiveCommitScan.scan_type, LiveCommitScanType), (LiveCommitScan.status, StatusEnum)):
+            condition = search_enum(column, enum_class, search)
+            if condition is not None:
+                conditions.append(condition)
+        filters.append(or_(*conditions))
 
     # Subquery for counts
     counts_subquery = (
@@ -121,6 +127,7 @@ async def get_live_commits_scan(
     )
 
     # Sorting
+    sort_column = LiveCommitScan.id
     if sort_by in [
         "vc_name",
         "repo_name",
@@ -145,12 +152,23 @@ async def get_live_commits_scan(
         )
 
     # Total count
-    total_count_query = select(func.count()).select_from(query.subquery())
-    total_count = await db.scalar(total_count_query)
+    total_count = None
+    if include_total:
+        total_count_query = select(func.count()).select_from(query.subquery())
+        total_count = await db.scalar(total_count_query)
 
     # Pagination
-    result_query = paginate(query, total_count, page, limit)
-    result = await db.execute(result_query["query"])
+    if cursor is not None:
+        # The sort value is selected as the last column to build the next cursor
+        result_query = keyset_paginate(
+            query.add_columns(sort_column), sort_column, LiveCommitScan.id, cursor, limit,
+            descending=order_by == "desc", total_count=total_count)
+        result = await db.execute(result_query["query"])
+        rows = keyset_page(result.all(), result_query, lambda row: (row[-1], row.id))
+    else:
+        result_query = paginate(query, total_count, page, limit)
+        result = await db.execute(result_query["query"])
+        rows = result.all()
     scans_with_details = [
         {
             "id": row.id,
@@ -168,7 +186,7 @@ async def get_live_commits_scan(
             "vulnerability_count": row.vulnerability_count,
             "created_at": row.created_at,
         }
-        for row in result.all()
+        for row in rows
     ]
 
     return {"data": scans_with_details, **result_query["meta"]}
@@ -212,44 +230,39 @@ async def get_live_commit_scan_filters(db: AsyncSession) -> dict:
 
 
 
-async def get_live_commit_scan_filter_values(db: AsyncSession, filter_name: str):
+async def get_live_commit_scan_filter_values(db: AsyncSession, filter_name: str, search: str = None):
     try:
-        # Define the query based on the filter_name
+        # Define the facet based on the filter_name
         if filter_name == 'sort_by':
             return ["vc_name", "repo_name", "secret_count", "vulnerability_count", "created_at"]
         elif filter_name == 'order_by':
             return ['desc', 'asc']
         elif filter_name == "vc_ids":
-            query = select(distinct(LiveCommitScan.vc_id))
+            column = LiveCommitScan.vc_id
         elif filter_name == "repo_ids":
-            query = select(distinct(LiveCommitScan.repo_id))
+            column = LiveCommitScan.repo_id
         elif filter_name == "author":
-            query = select(distinct(LiveCommit.author_name))
+            column = LiveCommit.author_name
         elif filter_name == "commit_ids":
-            query = (
-                select(distinct(LiveCommit.commit_id))
-                .join(LiveCommitScan, LiveCommit.id == LiveCommitScan.live_commit_id)
-            )
+            column = LiveCommit.commit_id
         else:
             logger.error(f"Invalid filter name provided: {filter_name}")
             raise ValueError(f"Invalid filter name: {filter_name}")
 
-        # Execute the query and fetch the results
-        result = await db.execute(query)
-        rows = result.fetchall()
+        values, total = await get_facet_values(db, column, search, page_size=None)
 
         # Prepare the return value depending on the filter_name
         if filter_name == "author":
             # For 'author', return a list of dicts with value and label
             return {
-                "values": [{"value": row[0], "label": row[0]} for row in rows],
-                "total": len(rows)
+                "values": [{"value": value, "label": value} for value, _ in values],
+                "total": total
             }
 
         # For other filters, return a simple list with the total count
         return {
-            "values": [row[0] for row in rows],
-            "total": len(rows)
+            "values": [value for value, _ in values],
+            "total": total
         }
 
     except Exception as e:
@@ -9,6 +9,7 @@ from app.modules.repository.models.repository import Repo
 from app.modules.live_commits.models.live_commits import LiveCommit
 from app.modules.live_commits.schemas.live_commits_schemas import LiveCommitCreate
 from app.utils.pagination import paginate
+from app.modules.facets.facet_service import get_facet_values
 
 
 async def add_live_commit(db: AsyncSession, live_commit: LiveCommitCreate):
@@ -104,15 +105,15 @@ async def get_live_commit_filters(db: AsyncSession) -> dict:
     }
 
 
-async def get_live_commit_filter_values(db: AsyncSession, filter_name: str):
+async def get_live_commit_filter_values(db: AsyncSession, filter_name: str, search: str = None):
     if filter_name == "vc_ids":
-        query = select(distinct(LiveCommit.vc_id))
+        column = LiveCommit.vc_id
     elif filter_name == "repo_ids":
-        query = select(distinct(LiveCommit.repo_id))
+        column = LiveCommit.repo_id
     elif filter_name == "branch_name":
-        query = select(distinct(LiveCommit.branch))
+        column = LiveCommit.branch
     else:
         raise ValueError("Invalid filter name")
 
-    result = await db.execute(query)
-    return [row[0] for row in result.fetchall()]
\ No newline at end of file
+    values, _ = await get_facet_values(db, column, search, page_size=None)
+    return [value for value, _ in values]
\ No newline at end of file
@@ -7,6 +7,7 @@ from app.modules.user.models.user import UserRole
 from app.modules.pr.schemas.pr_schema import PRInDB
 from app.modules.pr.schemas.pr_scan_schema import PRScan, PRScanType
 from app.modules.pr.models.pr_scan import StatusEnum
+from app.utils.response_cache import cached_response
 from app.modules.pr.pr_service import (
     get_pr,
     get_pr_by_id,
@@ -61,6 +62,7 @@ async def get_scan_filters():
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_scan_filter_values_controller(
     filter_name: str,
     db: AsyncSession = Depends(get_db),
@@ -83,11 +85,15 @@ async def get_filters():
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_filter_values_controller(
     filter_name: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    search: Optional[str] = Query(
+        None,
+        description="Prefix of the values to return"),
 ):
-    return await get_filter_values(db, filter_name)
+    return await get_filter_values(db, filter_name, search)
 
 
 
@@ -109,6 +115,8 @@ async def list_pr_scans(
     order_by: Optional[str] = Query('desc'),
     scan_type: Optional[PRScanType] = Query(PRScanType.SECRET, description="Type of scan"),
     search: Optional[str] = Query(None, description="Search across PR scan parameters"),  # New search parameter
+    cursor: Optional[str] = Query(None, description="Keyset cursor: empty for the first page, then next_cursor"),
+    include_total: bool = Query(True, description="Compute the total count"),
     db: AsyncSession = Depends(get_db)
 ):
     return await get_pr_scan(
@@ -124,7 +132,9 @@ async def list_pr_scans(
         sort_by=sort_by,
         order_by=order_by,
         scan_type=scan_type,
-        search=search  # Pass the new search parameter to get_pr_scan
+        search=search,  # Pass the new search parameter to get_pr_scan
+        cursor=cursor,
+        include_total=include_total
     )
 
 
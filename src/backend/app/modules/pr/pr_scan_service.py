@@ -6,14 +6,14 @@ from fastapi import HTTPException, status
 from typing import Optional, List
 from app.modules.pr.models.pr_scan import PRScan as models_PRScan, StatusEnum
 from app.modules.pr.schemas.pr_scan_schema import PRScanCreate, PRScanUpdate, PRScan, PRScanType
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, keyset_paginate, keyset_page
 from app.modules.secrets.model.secrets_model import Secrets
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 from sqlalchemy import String, TEXT
 from app.modules.repository.models.repository import Repo
 from sqlalchemy.sql import text
-from sqlalchemy.sql import literal_column
 from app.modules.pr.models.pr import PR
+from app.modules.facets.facet_service import get_facet_values
 
 async def create_pr_scan(db: AsyncSession, pr_scan_data: PRScanCreate) -> models_PRScan:
     pr_scan = models_PRScan(**pr_scan_data.dict())
@@ -35,7 +35,9 @@ async def get_pr_scan(
     limit: int = 10,
     sort_by: Optional[str] = "created_at",
     order_by: Optional[str] = "desc",
-    search: Optional[str] = None  # New search parameter
+    search: Optional[str] = None,  # New search parameter
+    cursor: Optional[str] = None,
+    include_total: bool = True
 ) -> dict:
     # Subqueries for secret and vulnerability counts
     # Subqueries for secret and vulnerability counts
@@ -61,12 +63,15 @@ async def get_pr_scan(
         .subquery()
     )
 
+    secret_count = func.coalesce(secret_count_subquery.c.secret_count, 0)
+    vulnerability_count = func.coalesce(vulnerability_count_subquery.c.vulnerability_count, 0)
+
     # Main query with joins and optional filters
     query = (
         select(
             models_PRScan,  # Select PRScan records
-            func.coalesce(secret_count_subquery.c.secret_count, 0).label("secret_count"),  # Add secret count
-            func.coalesce(vulnerability_count_subquery.c.vulnerability_count, 0).label("vulnerability_count")
+            secret_count.label("secret_count"),  # Add secret count
+            vulnerability_count.label("vulnerability_count")
             # Add vulnerability count
         )
         .outerjoin(secret_count_subquery,
@@ -113,20 +118,30 @@ async def get_pr_scan(
         "pr_id": models_PRScan.pr_id,
         "status": models_PRScan.status,
         "created_at": models_PRScan.created_at,
-        "secret_count": literal_column("secret_count"),
-        "vulnerability_count": literal_column("vulnerability_count")
+        "secret_count": secret_count,
+        "vulnerability_count": vulnerability_count
     }
 
     sort_column = sort_columns.get(sort_by, models_PRScan.created_at)
     query = query.order_by(order(sort_column))
 
     # Pagination and results
-    total_count_query = select(func.count()).select_from(query.subquery())
-    total_count = await db.scalar(total_count_query)
-    result_query = paginate(query, total_count, page, limit)
-    result = await db.execute(result_query['query'])
-
-    pr_scans = result.fetchall()
+    total_count = None
+    if include_total:
+        total_count_query = select(func.count()).select_from(query.subquery())
+        total_count = await db.scalar(total_count_query)
+
+    if cursor is not None:
+        # The sort value is selected as the last column to build the next cursor
+        result_query = keyset_paginate(
+            query.add_columns(sort_column), sort_column, models_PRScan.id, cursor, limit,
+            descending=order_by != "asc", total_count=total_count)
+        result = await db.execute(result_query['query'])
+        pr_scans = keyset_page(result.fetchall(), result_query, lambda row: (row[-1], row[0].id))
+    else:
+        result_query = paginate(query, total_count, page, limit)
+        result = await db.execute(result_query['query'])
+        pr_scans = result.fetchall()
     serialized_pr_scans = [
         PRScan(
             pr_id=row[0].pr_id,
@@ -195,12 +210,8 @@ async def get_scan_filter_values(
         )
 
     column = filter_map[filter_name]
-    query = select(distinct(column)).where(column.isnot(None))
-    if search and isinstance(column.type, (String, TEXT)):
-        query = query.where(column.ilike(f"%{search}%"))
-
-    result = await db.execute(query)
-    return result.scalars().all()
+    values, _ = await get_facet_values(db, column, search, page_size=None)
+    return [value for value, _ in values]
 
 
 
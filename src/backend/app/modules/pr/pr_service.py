@@ -12,6 +12,7 @@ from app.utils.pagination import paginate
 from app.modules.secrets.model.secrets_model import Secrets
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 from fastapi import HTTPException
+from app.modules.facets.facet_service import get_facet_values
 
 def to_int(value):
     try:
@@ -150,7 +151,7 @@ async def get_available_filters() -> dict:
     }
 
 
-async def get_filter_values(db: AsyncSession, filter_name: str) -> List:
+async def get_filter_values(db: AsyncSession, filter_name: str, search: Optional[str] = None) -> List:
     filter_map = {
         "vc_ids": models_PR.vc_id,
         "repo_ids": models_PR.repo_id,
@@ -160,5 +161,5 @@ async def get_filter_values(db: AsyncSession, filter_name: str) -> List:
     if filter_name not in filter_map:
         raise HTTPException(status_code=400, detail="Invalid filter name")
 
-    values = (await db.execute(select(distinct(filter_map[filter_name])))).scalars().all()
-    return values
+    values, _ = await get_facet_values(db, filter_map[filter_name], search, page_size=None)
+    return [value for value, _ in values]
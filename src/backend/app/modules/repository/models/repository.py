@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Enum, Float, ARRAY
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Enum, Float, ARRAY, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.core.db import Base
@@ -7,6 +7,9 @@ from app.modules.vc.models.vc import VcTypes  # Import VcTypes enum
 
 class Repo(Base):
     __tablename__ = 'repositories'
+    __table_args__ = (
+        Index('uq_repositories_vc_id_name', 'vc_id', 'name', unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     vc_id = Column(Integer, ForeignKey('vcs.id'), nullable=False, index=True)
@@ -0,0 +1,79 @@
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.config import settings
+from app.modules.repository.models.repository import Repo
+
+
+class ResolvedRepo(NamedTuple):
+    id: int
+    vc_id: int
+    name: str
+
+
+class RepoResolver:
+    """
+    In-process LRU mapping (vc_id, repo name) to the repository id, for
+    webhook handlers that only need to know which repo an event is about.
+
+    Misses go to a single-row lookup on the unique (vc_id, name) index and
+    are not cached, so a repo created by sync or a repo-creation webhook is
+    found on the next event. Entries expire after REPO_RESOLVER_CACHE_TTL
+    seconds; `invalidate` drops them early.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[int, str], Tuple[ResolvedRepo, float]]" = OrderedDict()
+
+    def get(self, vc_id: int, name: str) -> Optional[ResolvedRepo]:
+        key = (vc_id, name)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        repo, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return repo
+
+    def set(self, repo: ResolvedRepo):
+        key = (repo.vc_id, repo.name)
+        self._entries[key] = (repo, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def resolve(self, db: AsyncSession, vc_id: int, name: str) -> Optional[ResolvedRepo]:
+        repo = self.get(vc_id, name)
+        if repo is not None:
+            return repo
+
+        row = (await db.execute(
+            select(Repo.id, Repo.vc_id, Repo.name).where(Repo.vc_id == vc_id, Repo.name == name)
+        )).first()
+        if row is None:
+            return None
+        repo = ResolvedRepo(*row)
+        self.set(repo)
+        return repo
+
+    def invalidate(self, vc_id: int, name: Optional[str] = None):
+        """Drop one repo, or every repo of a VC when no name is given."""
+        if name is not None:
+            self._entries.pop((vc_id, name), None)
+            return
+        for key in [key for key in self._entries if key[0] == vc_id]:
+            del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+
+repo_resolver = RepoResolver(maxsize=settings.REPO_RESOLVER_CACHE_SIZE, ttl=settings.REPO_RESOLVER_CACHE_TTL)
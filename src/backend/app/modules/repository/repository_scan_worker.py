@@ -6,6 +6,7 @@ from app.modules.repository.models.repository_scan import ScanStatusEnum
 from app.core.logger import logger
 from app.modules.repository.repository_service import *
 from app.modules.repository.models.repository_scan import RepositoryScan
+from app.modules.slack_integration.slack_notifier import slack_notifier
 
 
 class RepositoryWorker:
@@ -37,13 +38,14 @@ class RepositoryWorker:
 
             logger.info(f"Starting scan for {len(pending_repos)} repositories.")
 
-            # Start scanning each pending repository
-            for scan in pending_repos:
-                try:
-                    logger.info(f"Starting scan for repository {scan.repository_id}")
-                    await scan_repo_by_id(self.db, scan.repository_id)
-                except Exception as e:
-                    logger.error(f"Failed to scan repository {scan.repository_id}: {e}")
+            async with slack_notifier.scan_digest("Pending repository scans"):
+                # Start scanning each pending repository
+                for scan in pending_repos:
+                    try:
+                        logger.info(f"Starting scan for repository {scan.repository_id}")
+                        await scan_repo_by_id(self.db, scan.repository_id)
+                    except Exception as e:
+                        logger.error(f"Failed to scan repository {scan.repository_id}: {e}")
 
             self.running = False
 
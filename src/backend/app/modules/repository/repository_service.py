@@ -6,14 +6,16 @@ from fastapi import HTTPException, status
 from fastapi.exceptions import ResponseValidationError
 from pydantic import ValidationError
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from app.core.logger import logger
 from datetime import datetime, timezone
 
 from app.modules.secrets.model.secrets_model import Secrets, ScanType
 from app.modules.repository.models.repository import Repo
 from app.modules.repository.models.repository_scan import RepositoryScan, ScanStatusEnum
+from app.modules.repository.repo_resolver import repo_resolver
 from app.modules.repository.schemas.repository_schema import RepoResponse, SecretsResponse, FilterOption
+from app.modules.repository.schemas.repository_schema import VCResponse as RepoVCResponse
 from app.modules.vc.models.vc import VC
 from app.modules.vc.schemas.vc_schema import VCResponse
 from app.modules.vc.vc_service import get_vc
@@ -22,13 +24,17 @@ from app.modules.repository.models.repository_scan import RepoScanType
 
 from app.modules.secrets.secret_service import add_secret
 from app.modules.slack_integration.slack_integration_service import fetch_and_notify_secrets
+from app.modules.slack_integration.slack_notifier import slack_notifier
 
 from app.utils.scan_repo_secrets import runScan
 from app.utils.clone_repo import clone_repo, get_branches_from_commit
 from app.utils.fetch_repos import fetch_repos
 from app.utils.process_repo_data import process_repo_data
 from app.utils.pagination import paginate
-from app.utils.mark_severity import mark_severity
+from app.utils.counting import count_rows
+from app.utils.search import search_document, matches, search_int, search_day
+from app.modules.facets.facet_service import get_facet_values
+from app.utils.mark_severity import classify
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 from app.utils.sbom_generator import generate_sbom
 from app.utils.delete_folder import delete_folder
@@ -54,6 +60,80 @@ from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
 
+# Related collections a repository listing can embed via include=
+REPO_INCLUDES = {"secrets"}
+
+# Matches the ix_repositories_search_trgm index expression
+REPO_SEARCH_DOCUMENT = search_document(Repo.name)
+
+
+def parse_repo_include(include: Optional[str]) -> set:
+    """Parse a comma-separated include= value, e.g. "secrets"."""
+    requested = {part.strip() for part in (include or "").split(",") if part.strip()}
+    unknown = requested - REPO_INCLUDES
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported include: {', '.join(sorted(unknown))}")
+    return requested
+
+
+async def get_severity_histograms(
+    db: AsyncSession,
+    repo_ids: List[int]
+) -> Tuple[Dict[int, Dict[str, int]], Dict[int, Dict[str, int]]]:
+    """
+    Secret and vulnerability counts per severity for the given repositories,
+    as {repo_id: {severity: count}}, from two grouped queries.
+    """
+    secret_counts: Dict[int, Dict[str, int]] = {repo_id: {} for repo_id in repo_ids}
+    vulnerability_counts: Dict[int, Dict[str, int]] = {repo_id: {} for repo_id in repo_ids}
+    if not repo_ids:
+        return secret_counts, vulnerability_counts
+
+    secret_rows = await db.execute(
+        select(Secrets.repository_id, Secrets.severity, func.count(Secrets.id))
+        .where(Secrets.repository_id.in_(repo_ids))
+        .group_by(Secrets.repository_id, Secrets.severity)
+    )
+    for repo_id, severity, count in secret_rows.all():
+        key = severity.value if severity else "unknown"
+        secret_counts[repo_id][key] = secret_counts[repo_id].get(key, 0) + count
+
+    vulnerability_severity = func.lower(func.coalesce(Vulnerability.severity, "unknown"))
+    vulnerability_rows = await db.execute(
+        select(Vulnerability.repository_id, vulnerability_severity, func.count(Vulnerability.id))
+        .where(Vulnerability.repository_id.in_(repo_ids))
+        .group_by(Vulnerability.repository_id, vulnerability_severity)
+    )
+    for repo_id, severity, count in vulnerability_rows.all():
+        vulnerability_counts[repo_id][severity] = count
+
+    return secret_counts, vulnerability_counts
+
+
+def _repo_summary(repo: Repo, secret_counts: Dict[str, int], vulnerability_counts: Dict[str, int],
+                  include: set) -> RepoResponse:
+    return RepoResponse(
+        id=repo.id,
+        name=repo.name,
+        repoUrl=repo.repoUrl,
+        author=repo.author,
+        other_repo_details=repo.other_repo_details,
+        lastScanDate=repo.lastScanDate,
+        created_at=repo.created_at,
+        score_normalized=repo.score_normalized,
+        score_normalized_on=repo.score_normalized_on,
+        secrets_count=sum(secret_counts.values()),
+        vulnerability_count=sum(vulnerability_counts.values()),
+        secret_severity_counts=secret_counts,
+        vulnerability_severity_counts=vulnerability_counts,
+        vc=repo.vc,
+        sca_branches=repo.sca_branches,
+        secrets=[SecretsResponse.from_orm(secret) for secret in repo.secrets] if "secrets" in include else None
+    )
+
+
 # Gets the repository by vc id
 async def get_repos_by_vc_id(
     db: AsyncSession,
@@ -63,13 +143,14 @@ async def get_repos_by_vc_id(
     sort_by: Optional[str] = None,
     order_by: Optional[str] = "asc",
     page: int = 1,
-    limit: int = 10
+    limit: int = 10,
+    include: Optional[set] = None
 ) -> dict:
+    include = include or set()
     try:
-        query = select(Repo).options(
-            selectinload(
-                Repo.secrets), joinedload(
-                Repo.vc))
+        query = select(Repo).options(joinedload(Repo.vc))
+        if "secrets" in include:
+            query = query.options(selectinload(Repo.secrets))
 
         # if vc_name:
         #     vc_subquery = select(VC.id).where(VC.name.ilike(f"%{vc_name}%"))
@@ -89,35 +170,24 @@ async def get_repos_by_vc_id(
                 sort_by):
             query = query.order_by(order(getattr(Repo, sort_by)))
         elif sort_by == 'secrets_count':
-            query = query.order_by(order(func.count(Repo.secrets)))
+            secrets_count = (
+                select(func.count(Secrets.id))
+                .where(Secrets.repository_id == Repo.id)
+                .scalar_subquery()
+            )
+            query = query.order_by(order(secrets_count))
 
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count_result = await db.execute(total_count_query)
-        total_count = total_count_result.scalar()
+        total_count, approximate = await count_rows(db, query)
 
-        pagination = paginate(query, total_count, page, limit)
+        pagination = paginate(query, total_count, page, limit, approximate)
         paginated_query = pagination['query']
 
         result = await db.execute(paginated_query)
         repos = result.scalars().all()
 
+        secret_counts, vulnerability_counts = await get_severity_histograms(db, [repo.id for repo in repos])
         repo_responses = [
-            RepoResponse(
-                id=repo.id,
-                name=repo.name,
-                repoUrl=repo.repoUrl,
-                author=repo.author,
-                other_repo_details=repo.other_repo_details,
-                lastScanDate=repo.lastScanDate,
-                created_at=repo.created_at,
-                score_normalized=repo.score_normalized,
-                score_normalized_on=repo.score_normalized_on,
-                secrets_count=len(repo.secrets),
-                vulnerability_count=0,
-                vc=repo.vc,
-                sca_branches=repo.sca_branches,
-                secrets=[SecretsResponse.from_orm(secret) for secret in repo.secrets]
-            )
+            _repo_summary(repo, secret_counts[repo.id], vulnerability_counts[repo.id], include)
             for repo in repos
         ]
 
@@ -142,26 +212,25 @@ async def get_repos_for_vc_id(
     db: AsyncSession,
     vc_id: Optional[int] = None,
     page: int = 1,
-    limit: int = 1_000_000
+    limit: int = 1_000_000,
+    include: Optional[set] = None
 ) -> dict:
+    include = include or set()
     try:
         # Start the query
-        query = select(Repo).options(
-            selectinload(Repo.secrets), 
-            joinedload(Repo.vc)
-        )
+        query = select(Repo).options(joinedload(Repo.vc))
+        if "secrets" in include:
+            query = query.options(selectinload(Repo.secrets))
         
         # Filter by vc_id
         if vc_id:
             query = query.where(Repo.vc_id == vc_id)
         
         # Calculate total count for pagination
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count_result = await db.execute(total_count_query)
-        total_count = total_count_result.scalar()
+        total_count, approximate = await count_rows(db, query)
         
         # Apply pagination
-        pagination = paginate(query, total_count, page, limit)
+        pagination = paginate(query, total_count, page, limit, approximate)
         paginated_query = pagination['query']
         
         # Execute the query
@@ -169,23 +238,9 @@ async def get_repos_for_vc_id(
         repos = result.scalars().all()
         
         # Format the response
+        secret_counts, vulnerability_counts = await get_severity_histograms(db, [repo.id for repo in repos])
         repo_responses = [
-            RepoResponse(
-                id=repo.id,
-                name=repo.name,
-                repoUrl=repo.repoUrl,
-                author=repo.author,
-                other_repo_details=repo.other_repo_details,
-                lastScanDate=repo.lastScanDate,
-                created_at=repo.created_at,
-                score_normalized=repo.score_normalized,
-                score_normalized_on=repo.score_normalized_on,
-                secrets_count=len(repo.secrets),
-                vulnerability_count=0,  # Defaulted to 0 if not provided
-                vc=repo.vc,
-                sca_branches=repo.sca_branches,
-                secrets=[SecretsResponse.from_orm(secret) for secret in repo.secrets]
-            )
+            _repo_summary(repo, secret_counts[repo.id], vulnerability_counts[repo.id], include)
             for repo in repos
         ]
 
@@ -249,6 +304,7 @@ async def fetch_all_repos_for_vc(
                 db.add(new_repo)
 
         await db.commit()
+        repo_resolver.invalidate(vc.id)
 
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
@@ -366,35 +422,37 @@ async def scan_all_repos_for_vc(
                 detail=f"No repositories found for VC ID {vc_id}"
             )
 
-        # Perform scans on each repository
-        scans = []
-        for repo in repos:
-            try:
-                print("Sending repo for scanning", scan_count)
-                # Create a task for scanning
-                scan_task = asyncio.create_task(
-                    scan_repo_by_id(db, repo.id, current_user)
-                )
-                # Add timeout using wait_for
-                scan = await asyncio.wait_for(scan_task, timeout=15 * 60)  # 15 minutes
-                scans.append(scan)
-                print("Repos scanned", scan_count)
-                scan_count += 1
-            except asyncio.TimeoutError:
-                logger.error(
-                    f"Timeout occurred while scanning repository ID {repo.id}. Cancelling the scan."
-                )
-                scan_task.cancel()
+        # One Slack digest for the whole VC when SLACK_DIGEST_VC_SCANS is on
+        async with slack_notifier.scan_digest(f"Secret scan of {vc.name}"):
+            # Perform scans on each repository
+            scans = []
+            for repo in repos:
                 try:
-                    await scan_task
-                except asyncio.CancelledError:
-                    logger.info(f"Scan for repository ID {repo.id} was successfully cancelled.")
-            except Exception as scan_error:
-                logger.error(
-                    f"Error scanning repository ID {repo.id}: {scan_error}"
-                )
-                # Rollback the session to ensure it's valid for the next iteration
-                await db.rollback()
+                    print("Sending repo for scanning", scan_count)
+                    # Create a task for scanning
+                    scan_task = asyncio.create_task(
+                        scan_repo_by_id(db, repo.id, current_user)
+                    )
+                    # Add timeout using wait_for
+                    scan = await asyncio.wait_for(scan_task, timeout=15 * 60)  # 15 minutes
+                    scans.append(scan)
+                    print("Repos scanned", scan_count)
+                    scan_count += 1
+                except asyncio.TimeoutError:
+                    logger.error(
+                        f"Timeout occurred while scanning repository ID {repo.id}. Cancelling the scan."
+                    )
+                    scan_task.cancel()
+                    try:
+                        await scan_task
+                    except asyncio.CancelledError:
+                        logger.info(f"Scan for repository ID {repo.id} was successfully cancelled.")
+                except Exception as scan_error:
+                    logger.error(
+                        f"Error scanning repository ID {repo.id}: {scan_error}"
+                    )
+                    # Rollback the session to ensure it's valid for the next iteration
+                    await db.rollback()
 
         if not scans:
             raise HTTPException(
@@ -467,12 +525,14 @@ async def scan_repo(
                 "unknown": 0
             }
 
-            for sec in secrets:
+            # One registry lookup per distinct rule in the scan
+            severities = classify(sec.get("RuleID") if isinstance(sec, dict) else None for sec in secrets)
+
+            for sec, severity in zip(secrets, severities):
                 if not isinstance(sec, dict) or "RuleID" not in sec:
                     print(f"Skipping secret: {sec}, missing 'RuleID'")
                     continue
 
-                severity = mark_severity(sec.get("RuleID", "low"))
                 severity_str = severity.value.lower() if isinstance(
                     severity, str) else str(severity.value).lower()
 
@@ -537,6 +597,33 @@ async def scan_repo(
             detail=f"An error occurred while processing repo {repo.name}: {str(e)}", exc_info=True)
 
 
+# Projections of the repository listing, matching RepoResponse and its
+# nested VCResponse / SecretsResponse field for field
+REPO_LIST_COLUMNS = (
+    Repo.id, Repo.name, Repo.repoUrl, Repo.author, Repo.other_repo_details,
+    Repo.lastScanDate, Repo.created_at, Repo.score_normalized, Repo.score_normalized_on,
+)
+REPO_VC_FIELDS = list(RepoVCResponse.model_fields)
+REPO_VC_COLUMNS = tuple(getattr(VC, field).label(f"vc_{field}") for field in REPO_VC_FIELDS)
+REPO_SECRET_FIELDS = list(SecretsResponse.model_fields)
+
+
+async def get_secrets_by_repo(db: AsyncSession, repo_ids: List[int]) -> Dict[int, List[dict]]:
+    """Secrets of the given repositories as SecretsResponse-shaped dicts, {repo_id: [secret]}."""
+    secrets: Dict[int, List[dict]] = {repo_id: [] for repo_id in repo_ids}
+    if not repo_ids:
+        return secrets
+
+    result = await db.execute(
+        select(*(getattr(Secrets, field) for field in REPO_SECRET_FIELDS))
+        .where(Secrets.repository_id.in_(repo_ids))
+        .order_by(Secrets.id)
+    )
+    for row in result.mappings():
+        secrets[row["repository_id"]].append(dict(row))
+    return secrets
+
+
 # get all the repositories
 async def get_repos(
     db: AsyncSession,
@@ -551,7 +638,9 @@ async def get_repos(
     page: int = 1,
     limit: int = 10,
     authors: Optional[List[str]] = None,
+    include: Optional[set] = None,
 ) -> dict:
+    include = include or set()
     secret_count_subquery = (
         select(Repo.id, func.count(Secrets.id).label("secret_count"))
         .join(Secrets, Secrets.repository_id == Repo.id)
@@ -566,14 +655,17 @@ async def get_repos(
         .subquery()
     )
 
+    # Plain columns rather than Repo entities: rows go straight to dicts
     query = (
-        select(Repo, secret_count_subquery.c.secret_count, vulnerability_count_subquery.c.vulnerability_count)
+        select(
+            *REPO_LIST_COLUMNS,
+            secret_count_subquery.c.secret_count,
+            vulnerability_count_subquery.c.vulnerability_count,
+            *REPO_VC_COLUMNS,
+        )
         .outerjoin(secret_count_subquery, Repo.id == secret_count_subquery.c.id)
         .outerjoin(vulnerability_count_subquery, Repo.id == vulnerability_count_subquery.c.id)
-        .options(
-            selectinload(Repo.secrets),
-            selectinload(Repo.vc)
-        )
+        .outerjoin(VC, Repo.vc_id == VC.id)
     )
 
     if repo_name:
@@ -591,15 +683,15 @@ async def get_repos(
         query = query.where(func.date(Repo.created_at) <= created_before)
 
     if search:
-        search_query = f"%{search}%"
-        query = query.where(
-            or_(
-                Repo.name.ilike(search_query),
-                cast(Repo.vc_id, String).ilike(search_query),
-                cast(Repo.id, String).ilike(search_query),
-                func.to_char(Repo.created_at, 'YYYY-MM-DD').ilike(search_query)
-            )
-        )
+        # Ids and dates match exactly so every branch of the OR is indexable
+        conditions = [matches(REPO_SEARCH_DOCUMENT, search)]
+        search_id = search_int(search)
+        if search_id is not None:
+            conditions += [Repo.id == search_id, Repo.vc_id == search_id]
+        created_on = search_day(Repo.created_at, search)
+        if created_on is not None:
+            conditions.append(created_on)
+        query = query.where(or_(*conditions))
 
     if authors:
         query = query.where(func.date(Repo.author).in_(authors))
@@ -630,33 +722,41 @@ async def get_repos(
         elif sort_by in ['lastScanDate', 'created_at']:
             query = query.order_by(order(getattr(Repo, sort_by)))
 
-    total_count_query = select(func.count()).select_from(query.subquery())
-    total_count_result = await db.execute(total_count_query)
-    total_count = total_count_result.scalar()
+    total_count, approximate = await count_rows(db, query)
 
-    pagination = paginate(query, total_count, page, limit)
+    pagination = paginate(query, total_count, page, limit, approximate)
     paginated_query = pagination['query']
 
     result = await db.execute(paginated_query)
     repo_results = result.all()
 
+    repo_ids = [row.id for row in repo_results]
+    secret_counts, vulnerability_counts = await get_severity_histograms(db, repo_ids)
+    repo_secrets = await get_secrets_by_repo(db, repo_ids) if "secrets" in include else None
+
+    # Same shape as RepoResponse, see fast_page
     repo_responses = [
-        RepoResponse(
-            id=repo[0].id,
-            name=repo[0].name,
-            repoUrl=repo[0].repoUrl,
-            author=repo[0].author,
-            other_repo_details=repo[0].other_repo_details,
-            lastScanDate=repo[0].lastScanDate,
-            created_at=repo[0].created_at,
-            score_normalized=repo[0].score_normalized,
-            score_normalized_on=repo[0].score_normalized_on,
-            secrets_count=repo[1] if repo[1] is not None else 0,
-            vulnerability_count=repo[2] if repo[2] is not None else 0,
-            secrets=[SecretsResponse.from_orm(secret) for secret in repo[0].secrets],
-            vc=VCResponse.from_orm(repo[0].vc) if repo[0].vc else None
-        )
-        for repo in repo_results
+        {
+            "name": row.name,
+            "repoUrl": row.repoUrl,
+            "author": row.author,
+            "other_repo_details": row.other_repo_details,
+            "score_normalized": row.score_normalized,
+            "score_normalized_on": row.score_normalized_on,
+            "secrets_count": row.secret_count or 0,
+            "vulnerability_count": row.vulnerability_count or 0,
+            "secret_severity_counts": secret_counts[row.id],
+            "vulnerability_severity_counts": vulnerability_counts[row.id],
+            "sca_branches": None,
+            "id": row.id,
+            "lastScanDate": row.lastScanDate,
+            "created_at": row.created_at,
+            "vc": {
+                field: row._mapping[f"vc_{field}"] for field in REPO_VC_FIELDS
+            } if row.vc_id is not None else None,
+            "secrets": repo_secrets[row.id] if repo_secrets is not None else None,
+        }
+        for row in repo_results
     ]
 
     return {
@@ -665,6 +765,30 @@ async def get_repos(
     }
 
 
+async def get_repo_secrets(
+    db: AsyncSession,
+    repo_id: int,
+    page: int = 1,
+    limit: int = 10
+) -> dict:
+    """Paginated secrets of one repository, newest first."""
+    await get_repo_by_id(db, repo_id)
+
+    query = (
+        select(Secrets)
+        .where(Secrets.repository_id == repo_id)
+        .order_by(desc(Secrets.id))
+    )
+    total_count, approximate = await count_rows(db, query)
+    pagination = paginate(query, total_count, page, limit, approximate)
+    result = await db.execute(pagination['query'])
+
+    return {
+        "data": [SecretsResponse.from_orm(secret) for secret in result.scalars().all()],
+        **pagination['meta']
+    }
+
+
 async def get_available_filters() -> List[FilterOption]:
     return [
         FilterOption(key="vc_ids", label="Version Control ID", type="integer", searchable=True),
@@ -702,15 +826,14 @@ async def get_filter_values(
         if search:
             query = query.where(func.date(Repo.created_at) == search)
 
-    elif filter_key == "repo_name":
-        query = select(Repo.name, func.count(Repo.id)).group_by(Repo.name)
-        if search:
-            query = query.where(Repo.name.ilike(f"%{search}%"))
-
-    elif filter_key == "authors":
-        query = select(Repo.author, func.count(Repo.id)).group_by(Repo.author)
-        if search:
-            query = query.where(Repo.author.ilike(f"%{search}%"))
+    elif filter_key in ("repo_name", "authors"):
+        # Facet rows already carry the per-value counts
+        column = Repo.name if filter_key == "repo_name" else Repo.author
+        rows, total_count = await get_facet_values(db, column, search, page, limit)
+        return {
+            "values": [{"value": value, "label": str(count)} for value, count in rows],
+            "total_count": total_count
+        }
 
     elif filter_key == "sort_by":
         return {
@@ -4,6 +4,8 @@ from pydantic import ValidationError
 from app.modules.repository.repository_service import (
     fetch_all_repos_for_vc,
     get_repos,
+    get_repo_secrets,
+    parse_repo_include,
     get_available_filters,
     get_filter_values,
     scan_repo_by_id,
@@ -18,17 +20,20 @@ from app.modules.repository.schemas.repository_schema import (
     RepoId,
     SortByEnum,
     FilterValueCount,
-    FilterOption
+    FilterOption,
+    RepoResponse
 )
+from app.utils.responses import fast_page
 import json
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from io import BytesIO
 from fastapi import APIRouter, Depends, HTTPException
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.modules.auth.auth_utils import role_required, get_current_user
 # from app.modules.vulnerability.vulnerability_service import scan_vulnerability_repo_by_id
 from app.modules.user.models.user import UserRole
+from app.utils.response_cache import cached_response
 from typing import Optional, List
 from datetime import datetime
 
@@ -69,7 +74,8 @@ async def get_repos_controller(
     limit: int = 10,
     created_after: Optional[datetime] = None,
     created_before: Optional[datetime] = None,
-    db: AsyncSession = Depends(get_db)
+    include: Optional[str] = Query(None, description="Comma-separated related data to embed, e.g. 'secrets'"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         repos = await get_repos(
@@ -83,9 +89,10 @@ async def get_repos_controller(
             created_before=created_before,
             search=search,
             limit=limit,
-            authors=authors
+            authors=authors,
+            include=parse_repo_include(include)
         )
-        return repos
+        return fast_page(repos, RepoResponse)
     except ValidationError as ve:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -111,12 +118,13 @@ async def get_filters():
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_filter_values_endpoint(
     filter_key: str,
     search: Optional[str] = None,
     page: int = 1,
     limit: int = 10,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     try:
         return await get_filter_values(
@@ -184,6 +192,18 @@ async def get_repo(repo_id: int, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred: {str(e)}")
 
+@router.get("/{repo_id}/secrets",
+            dependencies=[Depends(role_required([UserRole.admin,
+                                                 UserRole.user,
+                                                 UserRole.readonly]))])
+async def get_repo_secrets_endpoint(
+    repo_id: int,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1),
+    db: AsyncSession = Depends(get_read_db)
+):
+    return await get_repo_secrets(db, repo_id, page, limit)
+
 @router.put("/{repo_id}/sca-branches",
             dependencies=[Depends(role_required([UserRole.admin, UserRole.user]))])
 async def update_sca_branches_endpoint(
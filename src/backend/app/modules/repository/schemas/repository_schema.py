@@ -80,11 +80,16 @@ class RepoUpdate(RepoBase):
 class RepoResponse(RepoBase):
     secrets_count: int
     vulnerability_count: int
+    # Counts per severity value, e.g. {"high": 3, "low": 1}
+    secret_severity_counts: Dict[str, int] = {}
+    vulnerability_severity_counts: Dict[str, int] = {}
     sca_branches: Optional[List[str]] = None
     id: int
     lastScanDate: datetime
     created_at: datetime
     vc: Optional[VCResponse] = None
+    # Only populated with include=secrets; use /repo/{repo_id}/secrets to page through them
+    secrets: Optional[List[SecretsResponse]] = None
 
     class Config:
         from_attributes = True
@@ -74,3 +74,26 @@ class RegulatoryRequirement(Base):
         onupdate=datetime.utcnow)
 
     repos = relationship('Repo', back_populates='regulation')
+
+
+class RepositoryScore(Base):
+    """
+    Running sums and counts of normalized finding scores per repository.
+    Maintained by database triggers on `secrets` and `vulnerability`, so
+    repo and group scores can be derived without scanning findings.
+    Whitelisted findings are not counted.
+    """
+    __tablename__ = 'repository_scores'
+
+    repository_id = Column(
+        Integer,
+        ForeignKey('repositories.id', ondelete="CASCADE"),
+        primary_key=True)
+    secret_score_sum = Column(Float, nullable=False, default=0)
+    secret_count = Column(Integer, nullable=False, default=0)
+    vulnerability_score_sum = Column(Float, nullable=False, default=0)
+    vulnerability_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Annotated, Dict, List, Optional
 from enum import Enum
 
 
@@ -77,3 +77,35 @@ class PropertyResponse(PropertyBase):
 class AttachPropertyRequest(BaseModel):
     property_id: int
     property_type: PropertyType
+
+
+class PropertyWeights(BaseModel):
+    criticality: float = 0.4
+    environment: float = 0.3
+    sensitivity: float = 0.2
+    regulation: float = 0.1
+
+
+class ScoreSimulationRequest(BaseModel):
+    property_weights: PropertyWeights = PropertyWeights()
+    severity_scores: Optional[Dict[str, float]] = None
+    # Days open are divided by the SLA, so it must be positive
+    sla_days: Optional[Dict[str, Annotated[float, Field(gt=0)]]] = None
+    limit: int = Field(20, ge=1, le=1000)
+    refresh: bool = False
+
+
+class SimulatedScore(BaseModel):
+    id: int
+    name: Optional[str]
+    rank: int
+    score: float
+    current_score: float
+
+
+class ScoreSimulationResponse(BaseModel):
+    repos: List[SimulatedScore]
+    groups: List[SimulatedScore]
+    finding_count: int
+    features_age_seconds: float
+    elapsed_ms: float
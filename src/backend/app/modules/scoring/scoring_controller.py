@@ -6,6 +6,8 @@ from app.modules.user.models.user import UserRole
 from typing import List, Dict
 from app.modules.scoring.scoring_service import ScoringService
 from app.modules.scoring.scoring_cron import calculate_score
+from app.modules.scoring.scoring_simulation_service import ScoringSimulationService
+from app.modules.scoring.schema.schema import ScoreSimulationRequest, ScoreSimulationResponse
 
 router = APIRouter(prefix="/scoring", tags=["Scoring"])
 
@@ -39,6 +41,19 @@ async def get_group_score(group_id: int, db: AsyncSession = Depends(get_db)):
     return {"group_id": group_id, "score": score}
 
 
+@router.post("/simulate",
+             response_model=ScoreSimulationResponse,
+             dependencies=[Depends(role_required([UserRole.admin, UserRole.user]))])
+async def simulate_scores(
+    request: ScoreSimulationRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Rank repos and groups under candidate scoring weights without persisting anything.
+    """
+    return await ScoringSimulationService.simulate(db, request)
+
+
 @router.post("/run-cron")
 async def runCron(db: AsyncSession = Depends(get_db)):
     return await calculate_score(db)
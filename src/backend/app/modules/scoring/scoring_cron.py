@@ -8,81 +8,31 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from datetime import datetime
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
+from app.core.logger import logger
 
 
 async def calculate_score(db: AsyncSession):
-    # Step 1: Get all secrets, calculate scores, and normalize them
-    # Calculate raw scores for each secret
-    secret_query = select(Secrets)
-    secret_result = await db.execute(secret_query)
-    secrets = secret_result.scalars().all()
-    max_score = 1
-    for secret in secrets:
-        score_raw = await ScoringService.calculate_secret_score_by_id(db, secret.id)
-        secret.score_raw = score_raw
-        print('Score Raw Secret', score_raw)
-        if score_raw > max_score:
-            max_score = score_raw
-        db.add(secret)
+    # Step 0: Bring secret severities in line with the current rule overrides
+    reclassified = await ScoringService.reclassify_secret_severities(db)
+    logger.info(f"Reclassified {reclassified} secrets")
 
-    await db.commit()
-
-    # Maintain max score and normalize scores for secrets
-    for secret in secrets:
-        score_normalized = await ScoringService.normalize_score(secret.score_raw, max_score)
-        secret.score_normalized = score_normalized
-        secret.score_normalized_on = datetime.utcnow()  # Update score_normalized_on
-        db.add(secret)
-
-    await db.commit()
-
-    # Calculate raw scores for each vulnerability
-    vulnerability_query = select(Vulnerability)
-    vulnerability_result = await db.execute(vulnerability_query)
-    vulnerabilities = vulnerability_result.scalars().all()
-    max_score = 1
-    for vulnerability in vulnerabilities:
-        score_raw = await ScoringService.calculate_vul_score_by_id(db, vulnerability.id)
-        vulnerability.score_raw = score_raw
-        print('Score Raw Vul', score_raw)
-        if score_raw > max_score:
-            max_score = score_raw
-        db.add(vulnerability)
-
-    await db.commit()
-
-    # Maintain max score and normalize scores for vulnerabilities
-    for vulnerability in vulnerabilities:
-        score_normalized = await ScoringService.normalize_score(vulnerability.score_raw, max_score)
-        vulnerability.score_normalized = score_normalized
-        vulnerability.score_normalized_on = datetime.utcnow()  # Update score_normalized_on
-        db.add(secret)
-
-    await db.commit()
-
-    # Step 2: Get all repositories and update their scores
-    repo_query = select(Repo)
-    repo_result = await db.execute(repo_query)
-    repos = repo_result.scalars().all()
+    # Step 1: Calculate raw and normalized scores for secrets and vulnerabilities,
+    # one set-based UPDATE per table
+    secrets_scored = await ScoringService.update_secret_scores(db)
+    logger.info(f"Scored {secrets_scored} secrets")
 
-    for repo in repos:
-        normalized_repo_score = await ScoringService.calculate_repo_score_from_normailzed_secret(db, repo.id)
-        repo.score_normalized = normalized_repo_score
-        repo.score_normalized_on = datetime.utcnow()  # Update score_normalized_on
-        db.add(repo)
+    vulnerabilities_scored = await ScoringService.update_vulnerability_scores(db)
+    logger.info(f"Scored {vulnerabilities_scored} vulnerabilities")
 
     await db.commit()
 
-    # Step 3: Get all groups and update their scores
-    group_query = select(Group)
-    group_result = await db.execute(group_query)
-    groups = group_result.scalars().all()
+    # Step 2: Update repository scores from the trigger-maintained aggregates
+    repos_scored = await ScoringService.refresh_repo_scores(db)
+    logger.info(f"Scored {repos_scored} repositories")
 
-    for group in groups:
-        normalized_group_score = await ScoringService.calculate_group_score_from_normalized_secret(db, group.id)
-        group.score_normalized = normalized_group_score
-        group.score_normalized_on = datetime.utcnow()  # Update score_normalized_on
-        db.add(group)
+    # Step 3: Roll repository scores up to groups
+    groups_scored = await ScoringService.refresh_group_scores(db)
+    logger.info(f"Scored {groups_scored} groups")
 
     await db.commit()
 
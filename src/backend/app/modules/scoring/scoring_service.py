@@ -1,13 +1,25 @@
+from collections import defaultdict
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from typing import List
-from app.modules.secrets.model.secrets_model import Secrets
+from app.modules.secrets.model.secrets_model import Secrets, SeverityLevel
 from app.modules.repository.models.repository import Repo
-from app.modules.groups.models.group_model import Group
-from sqlalchemy import func
+from app.modules.groups.models.group_model import Group, group_repo_association
+from app.modules.scoring.model.model import (
+    BusinessCriticality,
+    Environment,
+    DataSensitivity,
+    RegulatoryRequirement,
+    RepositoryScore
+)
+from sqlalchemy import func, case, update, literal, cast, Float, String, exists
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
+from app.modules.incidents.models.incident_model import Incidents
+from app.modules.incidents.models.activity_model import Activity, Action
+from app.modules.facets.models.facet_model import FacetValue
+from app.utils.mark_severity import classify
 
 
 # Enum for severity scores
@@ -214,48 +226,90 @@ class ScoringService:
 
         return total_score
 
+    @staticmethod
+    def repo_score_expression(repo_scores=None):
+        """
+        Repo score from the maintained aggregates: the mean of the non-zero
+        secret and vulnerability averages, 0 when the repo has neither.
+        """
+        repo_scores = repo_scores if repo_scores is not None else RepositoryScore.__table__
+        secret_avg = case(
+            (repo_scores.c.secret_count > 0, repo_scores.c.secret_score_sum / repo_scores.c.secret_count),
+            else_=0.0
+        )
+        vulnerability_avg = case(
+            (repo_scores.c.vulnerability_count > 0,
+             repo_scores.c.vulnerability_score_sum / repo_scores.c.vulnerability_count),
+            else_=0.0
+        )
+        return case(
+            ((secret_avg > 0) & (vulnerability_avg > 0), (secret_avg + vulnerability_avg) / 2),
+            (secret_avg > 0, secret_avg),
+            (vulnerability_avg > 0, vulnerability_avg),
+            else_=0.0
+        )
+
     @staticmethod
     async def calculate_repo_score_from_normailzed_secret(
             db: AsyncSession, repo_id: int) -> float:
-        """Calculate the average score for a repo based on all open secrets."""
+        """Calculate the average score for a repo from its maintained score aggregates."""
         # Ensure the repository exists
-        repo_query = select(Repo).where(Repo.id == repo_id)
+        repo_query = select(Repo.id).where(Repo.id == repo_id)
         repo_result = await db.execute(repo_query)
         repo = repo_result.scalars().first()
 
         if not repo:
             raise ValueError(f"Repository with ID {repo_id} not found")
 
-        # Calculate the average score of secrets directly using SQL aggregation
-        secret_score_query = (
-            select(func.avg(Secrets.score_normalized))
-            .where(Secrets.repository_id == repo_id)
+        score_query = (
+            select(ScoringService.repo_score_expression())
+            .where(RepositoryScore.repository_id == repo_id)
         )
+        average_score = await db.scalar(score_query)
 
-        secret_score_result = await db.execute(secret_score_query)
-        secret_average_score = secret_score_result.scalar()
-        if secret_average_score is None:
-            secret_average_score = 0.0
+        return float(average_score) if average_score is not None else 0.0
 
-
-        # Vulnerability
-        # Calculate the average score of vulnerability directly using SQL aggregation
-        vulnerability_score_query = (
-            select(func.avg(Vulnerability.score_normalized))
-            .where(Vulnerability.repository_id == repo_id)
+    @staticmethod
+    async def refresh_repo_scores(db: AsyncSession) -> int:
+        """Write every repo's score from the aggregates in one UPDATE ... FROM."""
+        repo_scores = RepositoryScore.__table__
+        stmt = (
+            update(Repo)
+            .where(Repo.id == repo_scores.c.repository_id)
+            .values(
+                score_normalized=ScoringService.repo_score_expression(repo_scores),
+                score_normalized_on=datetime.utcnow(),
+                updated_at=Repo.updated_at
+            )
+            .execution_options(synchronize_session=False)
         )
+        result = await db.execute(stmt)
+        return result.rowcount or 0
 
-        vulnerability_score_result = await db.execute(vulnerability_score_query)
-        vulnerability_average_score = vulnerability_score_result.scalar()
-        if vulnerability_average_score is None:
-            vulnerability_average_score = 0.0
-
-        average_score = 0
-        non_zero_scores = [score for score in [secret_average_score, vulnerability_average_score] if score > 0]
-        if non_zero_scores:
-            average_score = sum(non_zero_scores) / len(non_zero_scores)
-
-        return average_score
+    @staticmethod
+    async def refresh_group_scores(db: AsyncSession) -> int:
+        """Roll repo scores up to their groups in one UPDATE ... FROM."""
+        group_scores = (
+            select(
+                Group.id.label("group_id"),
+                func.avg(func.coalesce(Repo.score_normalized, 0)).label("score")
+            )
+            .outerjoin(group_repo_association, group_repo_association.c.group_id == Group.id)
+            .outerjoin(Repo, Repo.id == group_repo_association.c.repo_id)
+            .group_by(Group.id)
+            .subquery("group_scores")
+        )
+        stmt = (
+            update(Group)
+            .where(Group.id == group_scores.c.group_id)
+            .values(
+                score_normalized=group_scores.c.score,
+                score_normalized_on=datetime.utcnow()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return result.rowcount or 0
 
     @staticmethod
     async def calculate_group_score(db: AsyncSession, group_id: int) -> float:
@@ -285,28 +339,153 @@ class ScoringService:
     @staticmethod
     async def calculate_group_score_from_normalized_secret(
             db: AsyncSession, group_id: int) -> float:
-        """Calculate the pod (group) score as a weighted average of its repos."""
-        query = select(Group).where(
-            Group.id == group_id).options(
-            selectinload(
-                Group.repos))
-        result = await db.execute(query)
-        group = result.scalars().first()
+        """Calculate the pod (group) score as the average of its repos' aggregate scores."""
+        group_query = select(Group.id).where(Group.id == group_id)
+        group_result = await db.execute(group_query)
+        group = group_result.scalars().first()
 
         if not group:
             raise ValueError(f"Group with ID {group_id} not found")
 
-        # Calculate the score for each repo
-        repo_scores = [
-            await ScoringService.calculate_repo_score_from_normailzed_secret(db, repo.id) for repo in group.repos
-        ]
+        score_query = (
+            select(func.avg(func.coalesce(ScoringService.repo_score_expression(), 0)))
+            .select_from(group_repo_association)
+            .outerjoin(
+                RepositoryScore,
+                RepositoryScore.repository_id == group_repo_association.c.repo_id
+            )
+            .where(group_repo_association.c.group_id == group_id)
+        )
+        pod_score = await db.scalar(score_query)
 
-        # Calculate the weighted average pod score
-        if len(repo_scores) == 0:
-            return 0.0  # Handle empty groups
-        pod_score = sum(repo_scores) / len(repo_scores)
+        # Handle empty groups
+        return float(pod_score) if pod_score is not None else 0.0
 
-        return pod_score
+    @staticmethod
+    def repo_weight_subquery():
+        """Per-repo total risk weight, mirroring the weights used in calculate_secret_score."""
+        total_weight = (
+            0.4 * func.coalesce(BusinessCriticality.value, 0) +
+            0.3 * func.coalesce(Environment.value, 0) +
+            0.2 * func.coalesce(DataSensitivity.value, 0) +
+            0.1 * func.coalesce(RegulatoryRequirement.value, 0)
+        )
+        return (
+            select(Repo.id.label("repo_id"), total_weight.label("total_weight"))
+            .outerjoin(BusinessCriticality, Repo.criticality_id == BusinessCriticality.id)
+            .outerjoin(Environment, Repo.environment_id == Environment.id)
+            .outerjoin(DataSensitivity, Repo.sensitivity_id == DataSensitivity.id)
+            .outerjoin(RegulatoryRequirement, Repo.regulation_id == RegulatoryRequirement.id)
+            .subquery("repo_weights")
+        )
+
+    @staticmethod
+    def raw_score_expression(base_score, sla, created_at, total_weight, now: datetime):
+        """SQL form of the risk-adjusted score: base * time decay (capped at 2x) * (1 + weight)."""
+        days_open = func.coalesce(func.date_part("day", literal(now) - created_at), 0)
+        time_decay = func.least(1 + days_open / cast(sla, Float), 2)
+        return base_score * time_decay * (1 + total_weight)
+
+    @staticmethod
+    async def update_scores(db: AsyncSession, model, base_score, sla) -> int:
+        """
+        Recompute score_raw and score_normalized for every row of `model` in a
+        single UPDATE ... FROM. Raw scores are normalized against a window
+        max() over the same rows (floored at 1, as in the original cron).
+        """
+        now = datetime.utcnow()
+        weights = ScoringService.repo_weight_subquery()
+        raw = ScoringService.raw_score_expression(
+            base_score, sla, model.created_at, weights.c.total_weight, now
+        )
+
+        scores = (
+            select(model.id.label("id"), cast(raw, Float).label("score_raw"))
+            .join(weights, model.repository_id == weights.c.repo_id)
+            .subquery("raw_scores")
+        )
+        normalized = (
+            select(
+                scores.c.id,
+                scores.c.score_raw,
+                cast(func.greatest(func.max(scores.c.score_raw).over(), 1), Float).label("max_score")
+            )
+            .subquery("normalized_scores")
+        )
+
+        stmt = (
+            update(model)
+            .where(model.id == normalized.c.id)
+            .values(
+                score_raw=normalized.c.score_raw,
+                score_normalized=normalized.c.score_raw / normalized.c.max_score * 100,
+                score_normalized_on=now,
+                # Scoring is not a content change; keep updated_at as is
+                updated_at=model.updated_at
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return result.rowcount or 0
+
+    @staticmethod
+    async def reclassify_secret_severities(db: AsyncSession) -> int:
+        """
+        Re-apply the rule severity registry and its overrides to stored
+        secrets, so an override change reaches existing findings. The
+        distinct rules come from the secrets.rule facet and are classified in
+        one batch. Secrets whose severity was changed by hand on their
+        incident keep it. Returns the number of secrets updated.
+        """
+        rules = (await db.scalars(
+            select(FacetValue.value).where(
+                FacetValue.source == Secrets.__tablename__,
+                FacetValue.dimension == Secrets.rule.key,
+                FacetValue.occurrences > 0,
+            )
+        )).all()
+        rules_by_severity = defaultdict(list)
+        for rule, severity in zip(rules, classify(rules)):
+            rules_by_severity[severity].append(rule)
+
+        edited_by_hand = exists().where(
+            Incidents.secret_id == Secrets.id,
+            Activity.incident_id == Incidents.id,
+            Activity.action == Action.SEVERITY_UPDATED,
+        )
+        updated = 0
+        for severity, severity_rules in rules_by_severity.items():
+            stmt = (
+                update(Secrets)
+                .where(Secrets.rule.in_(severity_rules), Secrets.severity != severity, ~edited_by_hand)
+                .values(severity=severity)
+                .execution_options(synchronize_session=False)
+            )
+            result = await db.execute(stmt)
+            updated += result.rowcount or 0
+        return updated
+
+    @staticmethod
+    async def update_secret_scores(db: AsyncSession) -> int:
+        # The severitylevel enum stores member names ('CRITICAL'), so compare
+        # the column as text against the names
+        severity = cast(Secrets.severity, String)
+        severity_scores = {
+            level.name: SEVERITY_SCORES[level.value] for level in SeverityLevel if level.value in SEVERITY_SCORES
+        }
+        sla_days = {
+            level.name: SLA_DAYS[level.value] for level in SeverityLevel if level.value in SLA_DAYS
+        }
+        base_score = case(severity_scores, value=severity, else_=SEVERITY_SCORES["unknown"])
+        sla = case(sla_days, value=severity, else_=SLA_DAYS["unknown"])
+        return await ScoringService.update_scores(db, Secrets, base_score, sla)
+
+    @staticmethod
+    async def update_vulnerability_scores(db: AsyncSession) -> int:
+        severity = func.lower(Vulnerability.severity)
+        base_score = case(SEVERITY_SCORES, value=severity, else_=SEVERITY_SCORES["unknown"])
+        sla = case(SLA_DAYS, value=severity, else_=SLA_DAYS["unknown"])
+        return await ScoringService.update_scores(db, Vulnerability, base_score, sla)
 
     @staticmethod
     async def normalize_score(raw_score: float, max_score: float) -> float:
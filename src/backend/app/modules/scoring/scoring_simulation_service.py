@@ -0,0 +1,261 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.config import settings
+from app.modules.groups.models.group_model import Group, group_repo_association
+from app.modules.repository.models.repository import Repo
+from app.modules.scoring.model.model import (
+    BusinessCriticality,
+    Environment,
+    DataSensitivity,
+    RegulatoryRequirement
+)
+from app.modules.scoring.schema.schema import (
+    PropertyWeights,
+    ScoreSimulationRequest,
+    ScoreSimulationResponse,
+    SimulatedScore
+)
+from app.modules.scoring.scoring_service import SEVERITY_SCORES, SLA_DAYS
+from app.modules.secrets.model.secrets_model import Secrets, SeverityLevel
+from app.modules.vulnerability.models.vulnerability_model import Vulnerability
+
+SEVERITY_LEVELS = [level.value for level in SeverityLevel]
+_SEVERITY_INDEX = {level: index for index, level in enumerate(SEVERITY_LEVELS)}
+_UNKNOWN_INDEX = _SEVERITY_INDEX[SeverityLevel.UNKNOWN.value]
+
+
+@dataclass
+class FindingFeatures:
+    severity: np.ndarray  # index into SEVERITY_LEVELS
+    created_at: np.ndarray  # POSIX seconds
+    repo_pos: np.ndarray  # position in ScoringFeatures.repo_ids
+    whitelisted: np.ndarray
+
+
+@dataclass
+class ScoringFeatures:
+    repo_ids: np.ndarray
+    repo_names: List[str]
+    repo_properties: np.ndarray  # (repos, 4): criticality, environment, sensitivity, regulation
+    repo_current_scores: np.ndarray
+    group_ids: np.ndarray
+    group_names: List[str]
+    group_current_scores: np.ndarray
+    membership_group_pos: np.ndarray
+    membership_repo_pos: np.ndarray
+    secrets: FindingFeatures
+    vulnerabilities: FindingFeatures
+    loaded_at: float
+
+
+def _finding_features(rows, repo_index: Dict[int, int]) -> FindingFeatures:
+    rows = [row for row in rows if row[2] in repo_index]
+    return FindingFeatures(
+        severity=np.fromiter(
+            (_SEVERITY_INDEX.get(row[0], _UNKNOWN_INDEX) for row in rows), dtype=np.int8, count=len(rows)
+        ),
+        created_at=np.fromiter(
+            (row[1].timestamp() if row[1] else np.nan for row in rows), dtype=np.float64, count=len(rows)
+        ),
+        repo_pos=np.fromiter((repo_index[row[2]] for row in rows), dtype=np.int64, count=len(rows)),
+        whitelisted=np.fromiter((bool(row[3]) for row in rows), dtype=bool, count=len(rows)),
+    )
+
+
+class ScoringSimulationService:
+    """
+    Evaluate alternative scoring weights against a columnar snapshot of the
+    finding features. The snapshot is loaded once and cached for
+    SCORING_SIMULATION_CACHE_TTL seconds; each simulation is pure NumPy.
+    """
+
+    _features: Optional[ScoringFeatures] = None
+    _lock = asyncio.Lock()
+
+    @staticmethod
+    async def load_features(db: AsyncSession) -> ScoringFeatures:
+        repo_rows = (await db.execute(
+            select(
+                Repo.id,
+                Repo.name,
+                func.coalesce(BusinessCriticality.value, 0),
+                func.coalesce(Environment.value, 0),
+                func.coalesce(DataSensitivity.value, 0),
+                func.coalesce(RegulatoryRequirement.value, 0),
+                func.coalesce(Repo.score_normalized, 0),
+            )
+            .outerjoin(BusinessCriticality, Repo.criticality_id == BusinessCriticality.id)
+            .outerjoin(Environment, Repo.environment_id == Environment.id)
+            .outerjoin(DataSensitivity, Repo.sensitivity_id == DataSensitivity.id)
+            .outerjoin(RegulatoryRequirement, Repo.regulation_id == RegulatoryRequirement.id)
+            .order_by(Repo.id)
+        )).all()
+        repo_index = {row[0]: pos for pos, row in enumerate(repo_rows)}
+
+        group_rows = (await db.execute(
+            select(Group.id, Group.name, func.coalesce(Group.score_normalized, 0)).order_by(Group.id)
+        )).all()
+        group_index = {row[0]: pos for pos, row in enumerate(group_rows)}
+
+        membership_rows = [
+            row for row in (await db.execute(
+                select(group_repo_association.c.group_id, group_repo_association.c.repo_id)
+            )).all()
+            if row[0] in group_index and row[1] in repo_index
+        ]
+
+        secret_rows = (await db.execute(
+            select(Secrets.severity, Secrets.created_at, Secrets.repository_id, Secrets.whitelisted)
+        )).all()
+        secret_rows = [
+            (row[0].value if row[0] else None, row[1], row[2], row[3]) for row in secret_rows
+        ]
+        vulnerability_rows = (await db.execute(
+            select(
+                func.lower(Vulnerability.severity),
+                Vulnerability.created_at,
+                Vulnerability.repository_id,
+                Vulnerability.whitelisted
+            )
+        )).all()
+
+        return ScoringFeatures(
+            repo_ids=np.array([row[0] for row in repo_rows], dtype=np.int64),
+            repo_names=[row[1] for row in repo_rows],
+            repo_properties=np.array([row[2:6] for row in repo_rows], dtype=np.float64).reshape(-1, 4),
+            repo_current_scores=np.array([row[6] for row in repo_rows], dtype=np.float64),
+            group_ids=np.array([row[0] for row in group_rows], dtype=np.int64),
+            group_names=[row[1] for row in group_rows],
+            group_current_scores=np.array([row[2] for row in group_rows], dtype=np.float64),
+            membership_group_pos=np.array([group_index[row[0]] for row in membership_rows], dtype=np.int64),
+            membership_repo_pos=np.array([repo_index[row[1]] for row in membership_rows], dtype=np.int64),
+            secrets=_finding_features(secret_rows, repo_index),
+            vulnerabilities=_finding_features(vulnerability_rows, repo_index),
+            loaded_at=time.monotonic(),
+        )
+
+    @classmethod
+    async def get_features(cls, db: AsyncSession, refresh: bool = False) -> ScoringFeatures:
+        async with cls._lock:
+            features = cls._features
+            expired = (
+                features is None or
+                time.monotonic() - features.loaded_at > settings.SCORING_SIMULATION_CACHE_TTL
+            )
+            if refresh or expired:
+                cls._features = await cls.load_features(db)
+            return cls._features
+
+    @staticmethod
+    def _severity_table(values: Dict[str, float]) -> np.ndarray:
+        return np.array(
+            [values.get(level, values["unknown"]) for level in SEVERITY_LEVELS], dtype=np.float64
+        )
+
+    @staticmethod
+    def _repo_averages(
+            findings: FindingFeatures,
+            repo_weight: np.ndarray,
+            severity_scores: np.ndarray,
+            sla_days: np.ndarray,
+            now: float) -> np.ndarray:
+        """Average normalized finding score per repo, mirroring ScoringService.update_scores."""
+        repo_count = len(repo_weight)
+        if findings.severity.size == 0:
+            return np.zeros(repo_count)
+
+        days_open = np.nan_to_num(np.floor((now - findings.created_at) / 86400.0))
+        time_decay = np.minimum(1 + days_open / sla_days[findings.severity], 2)
+        raw = severity_scores[findings.severity] * time_decay * (1 + repo_weight[findings.repo_pos])
+        normalized = raw / max(raw.max(), 1) * 100
+
+        counted = ~findings.whitelisted
+        sums = np.bincount(findings.repo_pos[counted], weights=normalized[counted], minlength=repo_count)
+        counts = np.bincount(findings.repo_pos[counted], minlength=repo_count)
+        return np.divide(sums, counts, out=np.zeros(repo_count), where=counts > 0)
+
+    @staticmethod
+    def evaluate(
+            features: ScoringFeatures,
+            property_weights: PropertyWeights,
+            severity_scores: Dict[str, float],
+            sla_days: Dict[str, float],
+            now: Optional[float] = None):
+        """Return (repo_scores, group_scores) arrays for the given weighting."""
+        now = now if now is not None else datetime.utcnow().timestamp()
+        weights = np.array([
+            property_weights.criticality,
+            property_weights.environment,
+            property_weights.sensitivity,
+            property_weights.regulation,
+        ], dtype=np.float64)
+        repo_weight = features.repo_properties @ weights
+        severity_table = ScoringSimulationService._severity_table(severity_scores)
+        sla_table = ScoringSimulationService._severity_table(sla_days)
+
+        secret_avg = ScoringSimulationService._repo_averages(
+            features.secrets, repo_weight, severity_table, sla_table, now)
+        vulnerability_avg = ScoringSimulationService._repo_averages(
+            features.vulnerabilities, repo_weight, severity_table, sla_table, now)
+
+        # Mean of the non-zero averages; scores are non-negative, so when at
+        # most one is non-zero the max is that one (or 0)
+        both = (secret_avg > 0) & (vulnerability_avg > 0)
+        repo_scores = np.where(
+            both, (secret_avg + vulnerability_avg) / 2, np.maximum(secret_avg, vulnerability_avg))
+
+        group_count = len(features.group_ids)
+        group_sums = np.bincount(
+            features.membership_group_pos,
+            weights=repo_scores[features.membership_repo_pos],
+            minlength=group_count)
+        group_sizes = np.bincount(features.membership_group_pos, minlength=group_count)
+        group_scores = np.divide(
+            group_sums, group_sizes, out=np.zeros(group_count), where=group_sizes > 0)
+
+        return repo_scores, group_scores
+
+    @staticmethod
+    def _ranked(ids, names, scores, current_scores, limit) -> List[SimulatedScore]:
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [
+            SimulatedScore(
+                id=int(ids[pos]),
+                name=names[pos],
+                rank=rank,
+                score=float(scores[pos]),
+                current_score=float(current_scores[pos]),
+            )
+            for rank, pos in enumerate(order, start=1)
+        ]
+
+    @staticmethod
+    async def simulate(db: AsyncSession, request: ScoreSimulationRequest) -> ScoreSimulationResponse:
+        started = time.perf_counter()
+        features = await ScoringSimulationService.get_features(db, refresh=request.refresh)
+
+        severity_scores = {**SEVERITY_SCORES, **(request.severity_scores or {})}
+        sla_days = {**SLA_DAYS, **(request.sla_days or {})}
+        repo_scores, group_scores = ScoringSimulationService.evaluate(
+            features, request.property_weights, severity_scores, sla_days)
+
+        return ScoreSimulationResponse(
+            repos=ScoringSimulationService._ranked(
+                features.repo_ids, features.repo_names, repo_scores,
+                features.repo_current_scores, request.limit),
+            groups=ScoringSimulationService._ranked(
+                features.group_ids, features.group_names, group_scores,
+                features.group_current_scores, request.limit),
+            finding_count=int(features.secrets.severity.size + features.vulnerabilities.severity.size),
+            features_age_seconds=time.monotonic() - features.loaded_at,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, ARRAY, Float, Enum, Boolean
+import hashlib
+from typing import Iterable
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, ARRAY, Float, Enum, Boolean, Index, text, func, and_
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from enum import Enum as PyEnum
@@ -26,6 +28,16 @@ class SeverityLevel(PyEnum):
 
 class Secrets(Base):
     __tablename__ = "secrets"
+    __table_args__ = (
+        Index('ix_secrets_repository_id', 'repository_id'),
+        # Secret values are unbounded (PEM keys run to kilobytes), beyond what
+        # a B-tree entry can hold, so lookups by value go through their digest
+        Index('ix_secrets_secret_md5', text('md5(secret)')),
+        Index('ix_secrets_pr_scan_id', 'pr_scan_id', postgresql_where=text('pr_scan_id IS NOT NULL')),
+        Index('ix_secrets_live_commit_scan_id', 'live_commit_scan_id',
+              postgresql_where=text('live_commit_scan_id IS NOT NULL')),
+        Index('ix_secrets_whitelist_id', 'whitelist_id', postgresql_where=text('whitelist_id IS NOT NULL')),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     description = Column(String, nullable=True)
@@ -106,3 +118,10 @@ class Secrets(Base):
             f"file={self.file}, line={self.line})>"
         )
 
+
+def secret_value_in(values: Iterable[str]):
+    """Matches secrets whose value is one of `values`, using ix_secrets_secret_md5.
+    The value comparison itself guards against digest collisions."""
+    values = list(values)
+    digests = [hashlib.md5(value.encode("utf-8")).hexdigest() for value in values]
+    return and_(func.md5(Secrets.secret).in_(digests), Secrets.secret.in_(values))
@@ -161,4 +161,9 @@ class GetSecretsRequest(BaseModel):
     page: int = 1
     limit: int = 10
     sort_by: Optional[str] = "repo_count"  # e.g. "repo_count", "secrets", "rules"
-    order_by: Optional[str] = "asc"  # "asc" or "desc"
\ No newline at end of file
+    order_by: Optional[str] = "asc"  # "asc" or "desc"
+
+    # Keyset pagination for the secrets listing: "" for the first page,
+    # then the previous page's next_cursor
+    cursor: Optional[str] = None
+    include_total: bool = True
\ No newline at end of file
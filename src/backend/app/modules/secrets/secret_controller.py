@@ -1,7 +1,7 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.modules.secrets.schema.secret_schema import (
     SecretsCreate,
     SecretsResponse,
@@ -19,12 +19,16 @@ from app.modules.secrets.secret_service import (
     delete_secret,
     get_secrets_by_param_service,
     get_distinct_secrets_with_repos,
-    get_repos_for_secret
+    get_repos_for_secret,
+    export_secrets
 )
 from app.core.logger import logger
 from app.modules.auth.auth_utils import role_required, get_current_user
 from app.modules.user.models.user import UserRole
 from app.utils.pagination import Pagination
+from app.utils.export import ExportFormat
+from app.utils.responses import fast_page
+from app.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/secrets", tags=["Secrets"])
 
@@ -35,7 +39,7 @@ router = APIRouter(prefix="/secrets", tags=["Secrets"])
                                                  UserRole.readonly]))])
 async def list_secrets(
         params: GetSecretsRequest = Body(..., description="Secrets fetch parameters"),
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_read_db)
 ):
 
     # Fetch secrets using service with dynamic filters
@@ -47,11 +51,13 @@ async def list_secrets(
         vc_ids=params.vc_ids,
         pr_ids=params.pr_ids,
         page=params.page,
-        limit=params.limit
+        limit=params.limit,
+        cursor=params.cursor,
+        include_total=params.include_total
     )
 
     # logger.debug(f"Returning {len(secrets['secrets'])} secrets.")
-    return secrets
+    return fast_page(secrets)
 
 
 @router.post(
@@ -60,7 +66,7 @@ async def list_secrets(
 )
 async def list_secrets(
     params: GetSecretsRequest = Body(..., description="Secrets fetch parameters"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     # Call the service function passing all parameters from the request model.
     secrets = await get_distinct_secrets_with_repos(
@@ -76,6 +82,28 @@ async def list_secrets(
     return secrets
 
 
+@router.post(
+    "/export",
+    dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))],
+)
+async def export_secrets_endpoint(
+    params: GetSecretsRequest = Body(..., description="Secrets filters, as for the listing"),
+    format: ExportFormat = Query(ExportFormat.csv, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip the download"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    return await export_secrets(
+        db=db,
+        query=params,
+        search=params.search,
+        repo_ids=params.repo_ids,
+        vc_ids=params.vc_ids,
+        pr_ids=params.pr_ids,
+        export_format=format,
+        compress=gzip
+    )
+
+
 @router.get("/:secret_name/repos",
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
@@ -84,7 +112,7 @@ async def list_secrets(
     secret_name: str = Query(None, description="Secret name"),
     page: int = Query(1, description="Page number"),
     limit: int = Query(10, description="Number of items per page"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
 
     # Fetch secrets using service with dynamic filters
@@ -101,6 +129,7 @@ async def list_secrets(
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_filters(db: AsyncSession = Depends(get_db)):
     logger.info("Request received to fetch available filters for secrets")
     filters = await get_available_filters(db)
@@ -112,12 +141,13 @@ async def get_filters(db: AsyncSession = Depends(get_db)):
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_filter_values_endpoint(
     filter_name: str,
     search: Optional[str] = Query(None, description="Search for specific filter values"),
     page: int = Query(1, description="Page number"),
     page_size: int = Query(10, description="Number of items per page"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     logger.info(
         f"Request received to fetch distinct values for filter: {filter_name}, search={search}, page: {page}, page_size: {page_size}")
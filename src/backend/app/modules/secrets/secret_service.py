@@ -4,13 +4,18 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload, load_only
 from app.modules.repository.models.repository import Repo
 from sqlalchemy import select, func, literal_column, update, distinct, cast, String, or_
-from app.modules.secrets.model.secrets_model import Secrets, SeverityLevel
+from app.modules.secrets.model.secrets_model import Secrets, SeverityLevel, secret_value_in
 from app.modules.secrets.schema.secret_schema import SecretsUpdate, GetSecretsRequest, SecretsResponse
 from app.core.logger import logger
 from datetime import datetime
 from app.modules.repository.models.repository_scan import RepositoryScan
 from fastapi import HTTPException, status
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, keyset_paginate, keyset_page
+from app.utils.counting import count_rows
+from app.utils.search import search_document, matches
+from app.utils.export import ExportFormat, export_response
+from app.utils.single_flight import single_flight
+from app.modules.facets.facet_service import is_faceted, get_facet_values
 from app.modules.whitelist.whitelist_service import is_whitelisted
 
 from app.modules.incidents.models.incident_model import IncidentStatusEnum, IncidentTypeEnum
@@ -24,6 +29,10 @@ from app.modules.whitelist.schema.whitelist_schema import WhiteListType
 from datetime import datetime
 from math import ceil
 
+# Matches the ix_secrets_search_trgm index expression
+SECRET_SEARCH_DOCUMENT = search_document(
+    Secrets.secret, Secrets.rule, Secrets.description, Secrets.commit, Secrets.author, Secrets.email)
+
 
 def make_naive(dt: datetime) -> datetime:
     if dt.tzinfo is not None:
@@ -35,7 +44,7 @@ def make_naive(dt: datetime) -> datetime:
 
 async def add_secret(db: AsyncSession, secret_data: Secrets, scan=None) -> Secrets:
     existing_secret_query = select(Secrets).where(
-        Secrets.secret == secret_data.secret,
+        secret_value_in([secret_data.secret]),
         Secrets.fingerprint == secret_data.fingerprint,
         Secrets.file == secret_data.file,
         Secrets.line == secret_data.line,
@@ -179,30 +188,16 @@ async def delete_secret(db: AsyncSession, secret_id: int):
 
 
 # Updated service to apply filters dynamically
-async def get_secrets_by_param_service(
+async def _secrets_query(
     db: AsyncSession,
     query: Optional[GetSecretsRequest] = None,
     search: Optional[str] = None,
     repo_ids: Optional[List[int]] = None,
     vc_ids: Optional[List[int]] = None,
     pr_ids: Optional[List[int]] = None,
-    page: int = 1,
-    limit: int = 10
 ):
-    logger.info("Fetching secrets with search and filters")
-
-    # Base query for secrets
-    stmt = select(Secrets).options(
-        joinedload(Secrets.repository).load_only(
-            Repo.id,
-            Repo.name,
-            Repo.repoUrl,
-            Repo.author,
-            Repo.lastScanDate,
-            Repo.created_at,
-            Repo.other_repo_details
-        )
-    )
+    """select(Secrets) with the listing's filters applied, shared by the listing and the export."""
+    stmt = select(Secrets)
 
     # Fetch available filters dynamically
     available_filters = await get_available_filters(db)
@@ -214,7 +209,7 @@ async def get_secrets_by_param_service(
         if query.commit_scan_id:
             stmt = stmt.where(Secrets.pr_scan_id == query.commit_scan_id)
         if query.secrets and any(f["key"] == "secrets" for f in available_filters["filters"]):
-            stmt = stmt.where(Secrets.secret.in_(query.secrets))
+            stmt = stmt.where(secret_value_in(query.secrets))
         if query.severities and any(f["key"] == "severities" for f in available_filters["filters"]):
             severity_values = [s.upper() if isinstance(s, str) else s.value for s in query.severities]
             stmt = stmt.where(Secrets.severity.in_(severity_values))
@@ -245,29 +240,113 @@ async def get_secrets_by_param_service(
 
     # Apply global search
     if search:
-        stmt = stmt.where(
-            (Secrets.secret.ilike(f"%{search}%")) |
-            (Secrets.rule.ilike(f"%{search}%")) |
-            (Secrets.description.ilike(f"%{search}%")) |
-            (Secrets.commit.ilike(f"%{search}%")) |
-            (Secrets.author.ilike(f"%{search}%")) |
-            (Secrets.email.ilike(f"%{search}%"))
-        )
+        stmt = stmt.where(matches(SECRET_SEARCH_DOCUMENT, search))
+
+    return stmt
+
+
+# The secrets listing reads every secrets column plus a summary of the repository
+SECRET_LIST_FIELDS = [column.key for column in Secrets.__table__.columns]
+SECRET_LIST_REPO_FIELDS = ["id", "name", "repoUrl", "author", "lastScanDate", "created_at", "other_repo_details"]
+SECRET_LIST_REPO_COLUMNS = tuple(getattr(Repo, field).label(f"repo_{field}") for field in SECRET_LIST_REPO_FIELDS)
+
+
+def _secret_list_item(row) -> dict:
+    mapping = row._mapping
+    item = {field: mapping[field] for field in SECRET_LIST_FIELDS}
+    item["repository"] = {
+        field: mapping[f"repo_{field}"] for field in SECRET_LIST_REPO_FIELDS
+    } if mapping["repo_id"] is not None else None
+    return item
+
+
+@single_flight
+async def get_secrets_by_param_service(
+    db: AsyncSession,
+    query: Optional[GetSecretsRequest] = None,
+    search: Optional[str] = None,
+    repo_ids: Optional[List[int]] = None,
+    vc_ids: Optional[List[int]] = None,
+    pr_ids: Optional[List[int]] = None,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    include_total: bool = True
+):
+    logger.info("Fetching secrets with search and filters")
+
+    stmt = await _secrets_query(db, query, search, repo_ids, vc_ids, pr_ids)
 
     # Count query for pagination
-    count_query = select(func.count()).select_from(stmt.subquery())
-    total_count = (await db.execute(count_query)).scalar()
+    total_count, approximate = await count_rows(db, stmt) if include_total else (None, False)
 
-    # Paginate the query results
-    result_query = paginate(stmt, total_count, page, limit)
-    result = await db.execute(result_query['query'])
-    secrets = result.scalars().all()
+    # Plain columns rather than Secrets entities: rows go straight to dicts
+    listing = (
+        stmt.outerjoin(Repo, Secrets.repository_id == Repo.id)
+        .with_only_columns(*Secrets.__table__.columns, *SECRET_LIST_REPO_COLUMNS)
+    )
+
+    # Paginate the query results, newest first when paging by cursor
+    if cursor is not None:
+        result_query = keyset_paginate(
+            listing, Secrets.id, Secrets.id, cursor, limit, total_count=total_count, approximate=approximate)
+        result = await db.execute(result_query['query'])
+        rows = keyset_page(result.all(), result_query, lambda row: (row.id, row.id))
+    else:
+        result_query = paginate(listing, total_count, page, limit, approximate)
+        result = await db.execute(result_query['query'])
+        rows = result.all()
+
+    secrets = [_secret_list_item(row) for row in rows]
 
     return {
         "data": secrets, **result_query['meta']
     }
 
 
+SECRET_EXPORT_COLUMNS = [
+    ("id", Secrets.id),
+    ("secret", Secrets.secret),
+    ("rule", Secrets.rule),
+    ("description", Secrets.description),
+    ("severity", Secrets.severity),
+    ("scan_type", Secrets.scan_type),
+    ("file", Secrets.file),
+    ("line", Secrets.line),
+    ("commit", Secrets.commit),
+    ("author", Secrets.author),
+    ("email", Secrets.email),
+    ("message", Secrets.message),
+    ("branches", Secrets.branches),
+    ("whitelisted", Secrets.whitelisted),
+    ("repository_id", Secrets.repository_id),
+    ("repository_name", Repo.name),
+    ("vc_id", Secrets.vc_id),
+    ("pr_id", Secrets.pr_id),
+    ("created_at", Secrets.created_at),
+    ("updated_at", Secrets.updated_at),
+]
+
+
+async def export_secrets(
+    db: AsyncSession,
+    query: Optional[GetSecretsRequest] = None,
+    search: Optional[str] = None,
+    repo_ids: Optional[List[int]] = None,
+    vc_ids: Optional[List[int]] = None,
+    pr_ids: Optional[List[int]] = None,
+    export_format: ExportFormat = ExportFormat.csv,
+    compress: bool = False,
+):
+    """Every secret matching the listing's filters, streamed as a download."""
+    stmt = (
+        (await _secrets_query(db, query, search, repo_ids, vc_ids, pr_ids))
+        .outerjoin(Repo, Secrets.repository_id == Repo.id)
+        .order_by(Secrets.id)
+    )
+    return export_response(stmt, SECRET_EXPORT_COLUMNS, "secrets", export_format, compress)
+
+
 async def get_distinct_secrets_with_repos(
     db: AsyncSession,
     query: Optional[GetSecretsRequest] = None,
@@ -312,7 +391,7 @@ async def get_distinct_secrets_with_repos(
         if query.commit_scan_id:
             stmt = stmt.where(Secrets.pr_scan_id == query.commit_scan_id)
         if query.secrets and any(f["key"] == "secrets" for f in available_filters["filters"]):
-            stmt = stmt.where(Secrets.secret.in_(query.secrets))
+            stmt = stmt.where(secret_value_in(query.secrets))
         if query.severities and any(f["key"] == "severities" for f in available_filters["filters"]):
             severity_values = []
             for s in query.severities:
@@ -360,14 +439,7 @@ async def get_distinct_secrets_with_repos(
 
     # Apply global search
     if search:
-        stmt = stmt.where(
-            (Secrets.secret.ilike(f"%{search}%")) |
-            (Secrets.rule.ilike(f"%{search}%")) |
-            (Secrets.description.ilike(f"%{search}%")) |
-            (Secrets.commit.ilike(f"%{search}%")) |
-            (Secrets.author.ilike(f"%{search}%")) |
-            (Secrets.email.ilike(f"%{search}%"))
-        )
+        stmt = stmt.where(matches(SECRET_SEARCH_DOCUMENT, search))
 
     # Now group by the (secret + rule) to get unique combinations
     stmt = stmt.group_by(Secrets.secret, Secrets.rule)
@@ -398,8 +470,7 @@ async def get_distinct_secrets_with_repos(
     # 1) Get total count (number of unique rows after the GROUP BY).
     #    To do this in SQLAlchemy, we typically wrap the grouped statement
     #    in a subquery and count its rows:
-    count_subq = stmt.with_only_columns(func.count()).subquery()
-    total_count = (await db.execute(select(func.count()).select_from(count_subq))).scalar()
+    total_count, approximate = await count_rows(db, stmt)
 
     # 2) Paginate
     offset = (page - 1) * limit
@@ -427,6 +498,7 @@ async def get_distinct_secrets_with_repos(
     return {
         "secrets": secrets_list,
         "total_count": total_count,
+        "total_count_approximate": approximate,
         "current_limit": limit,
         "current_page": page,
         "total_pages": total_pages,
@@ -453,13 +525,12 @@ async def get_repos_for_secret(
         )
         .distinct(Repo.name)  # Ensure repositories are unique by name
         .join(Secrets, Secrets.repository_id == Repo.id)
-        .where(Secrets.secret == secret_name)
+        .where(secret_value_in([secret_name]))
         .order_by(Repo.name.asc())  # Order by repository name
     )
 
     # Count query for pagination
-    count_query = select(func.count().label("total_count")).select_from(query_stmt.subquery())
-    total_count = (await db.execute(count_query)).scalar()
+    total_count, approximate = await count_rows(db, query_stmt)
 
     # Pagination logic
     offset = (page - 1) * limit
@@ -489,6 +560,7 @@ async def get_repos_for_secret(
         "secret": secret_name,
         "repositories": repos_list,
         "total_count": total_count,
+        "total_count_approximate": approximate,
         "current_limit": limit,
         "current_page": page,
         "total_pages": total_pages,
@@ -532,6 +604,11 @@ async def get_filter_values(
 
     column = getattr(Secrets, actual_column_name)
 
+    # Trigger-maintained facet counts instead of a DISTINCT over all secrets
+    if filter_name not in ["created_ats", "updated_ats"] and is_faceted(column):
+        values, total_count = await get_facet_values(db, column, search, page, page_size)
+        return [{"label": str(value), "value": str(value)} for value, _ in values], total_count
+
     # Handle the case if the column represents an array (e.g., branches) if needed.
     if filter_name == "branches":
         query = select(func.unnest(column)).where(column.isnot(None))
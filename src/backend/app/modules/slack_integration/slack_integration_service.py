@@ -4,8 +4,7 @@ from app.modules.slack_integration.model.model import SlackIntegration
 from app.modules.slack_integration.schema.schemas import CreateSlackIntegration, UpdateSlackIntegration
 from fastapi import HTTPException
 from app.modules.user.models.user import User
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+from app.modules.slack_integration.slack_notifier import slack_notifier
 from app.utils.string import mask_string
 from typing import Optional
 import os
@@ -47,6 +46,7 @@ async def create_slack_integration(
     )
     db.add(new_integration)
     await db.commit()
+    slack_notifier.invalidate_config()
     await db.refresh(new_integration)
     return new_integration
 
@@ -70,10 +70,17 @@ async def update_slack_integration(
         integration.active = slack_integration_data.active
     integration.updated_by = current_user.id
     await db.commit()
+    slack_notifier.invalidate_config()
     await db.refresh(integration)
     return integration
 
 
+def _severity_summary(counts) -> str:
+    """' (2 critical, 1 high)' from (severity, count) pairs, skipping zeros; '' when all are zero."""
+    parts = ", ".join(f"{count} {severity}" for severity, count in counts if count > 0)
+    return f" ({parts})" if parts else ""
+
+
 async def fetch_and_notify_secrets(
     db: AsyncSession,
     severity_count: dict,
@@ -84,13 +91,6 @@ async def fetch_and_notify_secrets(
     repo_id: Optional[int] = None
 ):
     try:
-        # Fetch Slack integration
-        result = await db.execute(select(SlackIntegration).limit(1))
-        slack_integration = result.scalar_one_or_none()
-
-        if not slack_integration:
-            return {"message": "No Slack integration found"}
-
         severity_colors = {
             "critical": ":red_circle:",
             "high": ":large_orange_circle:",
@@ -129,22 +129,12 @@ async def fetch_and_notify_secrets(
             message += f"\n• Commit ID: `{commit_id}`"
         message += f"\n• <{incident_link}|More details>"
 
-        client = WebClient(token=slack_integration.token)
-        response = client.chat_postMessage(
-            channel=slack_integration.channel,
-            text=message
+        summary = (
+            f"*{repo_name}* ({scan_type_label}): {sum(severity_count.values())} secrets"
+            f"{_severity_summary(severity_count.items())} <{incident_link}|details>"
         )
-        return {
-            "message": "Notification sent",
-            "channel": response["channel"],
-            "ts": response["ts"],
-            "status": response["ok"]
-        }
+        return slack_notifier.notify(message, summary)
 
-    except SlackApiError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Slack API error: {e.response['error']}")
     except Exception as e:
         return {"message": f"An error occurred: {str(e)}"}
 
@@ -159,17 +149,6 @@ async def notify_vulnerabilities(
     repo_id: Optional[int] = None
 ):
     try:
-        # Fetch Slack integration
-        result = await db.execute(select(SlackIntegration).limit(1))
-        slack_integration = result.scalar_one_or_none()
-
-        print("---------------------")
-        print(severity_count)
-        print("---------------------")
-
-        if not slack_integration:
-            return {"message": "No Slack integration found"}
-
         severity_colors = {
             "critical": ":red_circle:",
             "high": ":large_orange_circle:",
@@ -204,22 +183,11 @@ async def notify_vulnerabilities(
         if commit_id: message += f"\n• Commit ID: `{commit_id}`"
         message += f"\n•For more details, click <{incident_link}|here>"
 
-        client = WebClient(token=slack_integration.token)
-        response = client.chat_postMessage(
-            channel=slack_integration.channel,
-            text=message
-        )
-        return {
-            "message": "Notification sent",
-            "channel": response["channel"],
-            "ts": response["ts"],
-            "status": response["ok"]
-        }
-    except SlackApiError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Slack API error: {e.response['error']}"
+        summary = (
+            f"*{repo_name}* ({scan_type} scan): {sum(severity_count.values())} vulnerabilities"
+            f"{_severity_summary(severity_count.items())} <{incident_link}|details>"
         )
+        return slack_notifier.notify(message, summary)
     except Exception as e:
         return {"message": f"An error occurred: {str(e)}"}
 
@@ -245,19 +213,6 @@ async def fetch_and_notify(
 
         print(f"Severity Count: {severity_count}")
 
-        # Fetch Slack integration
-        try:
-            result = await db.execute(select(SlackIntegration).limit(1))
-            slack_integration = result.scalar_one_or_none()
-            print("Slack Integration:", slack_integration)
-        except Exception as e:
-            print(f"Error fetching Slack integration: {e}")
-            raise e
-
-        if not slack_integration:
-            print("No Slack integration found.")
-            return {"message": "No Slack integration found"}
-
         severity_colors = {
             "critical": ":red_circle:",
             "high": ":large_orange_circle:",
@@ -275,17 +230,20 @@ async def fetch_and_notify(
 
         try:
             message = f"*Scan Summary for {repo_name} during {scan_type_label}:*\n"
+            summary = f"*{repo_name}* ({scan_type_label}):"
             if sec_count > 0:
                 message += f"\n*Secrets Found:* {sec_count}\n"
                 secret_items = severity_count.get("secret", [])
                 for item in secret_items:
                     if item['count'] > 0:
                         message += f"{severity_colors.get(item['severity'], ':white_circle:')} {item['severity'].title()}: {item['count']}\n"
+                summary += f" {sec_count} secrets{_severity_summary((item['severity'], item['count']) for item in secret_items)}"
             if vul_count > 0:
                 message += f"\n*Vulnerabilities Found:* {vul_count}\n"
                 for severity, count in severity_count.get("vulnerability", {}).items():
                     if count > 0:
                         message += f"{severity_colors[severity]} {severity.title()}: {count}\n"
+                summary += f" {vul_count} vulnerabilities{_severity_summary(severity_count.get('vulnerability', {}).items())}"
 
         except Exception as e:
             print(f"Error constructing message: {e}")
@@ -310,8 +268,10 @@ async def fetch_and_notify(
 
             if secret_incident_link:
                 message += f"\n• <{secret_incident_link}|Secret Incident Details>"
+                summary += f" <{secret_incident_link}|secrets>"
             if vul_incident_link:
                 message += f"\n• <{vul_incident_link}|Vulnerability Incident Details>"
+                summary += f" <{vul_incident_link}|vulnerabilities>"
 
             print("Secret Incident Link:", secret_incident_link)
             print("Vulnerability Incident Link:", vul_incident_link)
@@ -320,37 +280,9 @@ async def fetch_and_notify(
             print(f"Error adding incident link: {e}")
             raise e
 
-        # Send notification to Slack
-        if sec_count != 0 or vul_count != 0:
-            try:
-                client = WebClient(token=slack_integration.token)
-                response = client.chat_postMessage(
-                    channel=slack_integration.channel,
-                    text=message
-                )
-                print("Slack Response:", response)
-                return {
-                    "message": "Notification sent",
-                    "channel": response["channel"],
-                    "ts": response["ts"],
-                    "status": response["ok"]
-                }
-            except SlackApiError as e:
-                print(f"Slack API error: {e.response['error']}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Slack API error: {e.response['error']}"
-                )
-            except Exception as e:
-                print(f"Error sending Slack message: {e}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Unexpected error: {str(e)}"
-                )
+        # Posted by the notifier's worker, off the scan's path
+        return slack_notifier.notify(message, summary)
 
     except Exception as e:
         print(f"An unexpected error occurred: {str(e)}")
         return {"message": f"An error occurred: {str(e)}"}
-
-
-
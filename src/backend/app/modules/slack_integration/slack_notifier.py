@@ -0,0 +1,188 @@
+import asyncio
+import contextvars
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.async_client import AsyncWebClient
+from sqlalchemy.future import select
+
+from app.core.config import settings
+from app.core.db import SessionLocal
+from app.core.logger import logger
+from app.modules.slack_integration.model.model import SlackIntegration
+
+# Lines listed in one digest message before the rest are summarized as a count
+DIGEST_MAX_LINES = 50
+
+
+@dataclass
+class _Digest:
+    title: str
+    summaries: List[str] = field(default_factory=list)
+
+
+# Digest of the scan batch (e.g. a whole-VC scan) running in this context
+_scan_digest: contextvars.ContextVar[Optional[_Digest]] = contextvars.ContextVar("scan_digest", default=None)
+
+
+def _digest_text(title: str, summaries: List[str]) -> str:
+    lines = [f"*{title}: {len(summaries)} scans with findings*"]
+    lines += [f"• {summary}" for summary in summaries[:DIGEST_MAX_LINES]]
+    if len(summaries) > DIGEST_MAX_LINES:
+        lines.append(f"…and {len(summaries) - DIGEST_MAX_LINES} more")
+    return "\n".join(lines)
+
+
+def _retry_after(error: SlackApiError) -> float:
+    for name, value in error.response.headers.items():
+        if name.lower() == "retry-after":
+            return float(value)
+    return 1.0
+
+
+class SlackNotifier:
+    """
+    Posts scan notifications from a background worker so scans never wait
+    on Slack.
+
+    Notifications are queued in process and posted one at a time with
+    AsyncWebClient. The integration's token and channel are re-read at most
+    every SLACK_CONFIG_CACHE_TTL seconds. Posts to a channel are spaced
+    SLACK_MIN_POST_INTERVAL apart, and a 429 waits out its Retry-After.
+
+    Digest mode is optional. With SLACK_DIGEST_WINDOW set, notifications
+    are collected and posted as one message per window. With
+    SLACK_DIGEST_VC_SCANS, a whole-VC scan posts a single message when it
+    finishes.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._config: Optional[Tuple[str, str]] = None
+        self._config_loaded_at: Optional[float] = None
+        self._clients: Dict[str, AsyncWebClient] = {}
+        self._next_post_at: Dict[str, float] = {}
+        self._window: List[str] = []
+        self._window_flush: Optional[asyncio.TimerHandle] = None
+
+    def notify(self, text: str, summary: str) -> dict:
+        """
+        Queues one scan's notification.
+
+        :param text: The full message, posted when no digest applies.
+        :param summary: One line standing for the scan in a digest.
+        """
+        digest = _scan_digest.get()
+        if digest is not None:
+            digest.summaries.append(summary)
+            return {"message": "Notification added to the scan digest"}
+
+        if settings.SLACK_DIGEST_WINDOW > 0:
+            self._window.append(summary)
+            if self._window_flush is None:
+                self._window_flush = asyncio.get_running_loop().call_later(
+                    settings.SLACK_DIGEST_WINDOW, self._flush_window)
+            return {"message": "Notification added to the digest"}
+
+        self._enqueue(text)
+        return {"message": "Notification queued"}
+
+    @asynccontextmanager
+    async def scan_digest(self, title: str):
+        """Collects the notifications sent inside the block into one digest message
+        when SLACK_DIGEST_VC_SCANS is on."""
+        if not settings.SLACK_DIGEST_VC_SCANS:
+            yield
+            return
+
+        digest = _Digest(title)
+        token = _scan_digest.set(digest)
+        try:
+            yield
+        finally:
+            _scan_digest.reset(token)
+            if digest.summaries:
+                self._enqueue(_digest_text(digest.title, digest.summaries))
+
+    def invalidate_config(self):
+        self._config_loaded_at = None
+
+    def _flush_window(self):
+        self._window_flush = None
+        summaries, self._window = self._window, []
+        if summaries:
+            self._enqueue(_digest_text(f"Scan digest (last {settings.SLACK_DIGEST_WINDOW}s)", summaries))
+
+    def _enqueue(self, text: str):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=settings.SLACK_QUEUE_SIZE)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        try:
+            self._queue.put_nowait(text)
+        except asyncio.QueueFull:
+            logger.warning("Slack notification queue is full, dropping notification")
+
+    async def _run(self):
+        while True:
+            text = await self._queue.get()
+            try:
+                await self._post(text)
+            except Exception as e:
+                logger.error(f"Failed to send Slack notification: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _get_config(self) -> Optional[Tuple[str, str]]:
+        if self._config_loaded_at is None or time.monotonic() - self._config_loaded_at > settings.SLACK_CONFIG_CACHE_TTL:
+            async with SessionLocal() as db:
+                result = await db.execute(select(SlackIntegration).limit(1))
+                integration = result.scalar_one_or_none()
+            self._config = (integration.token, integration.channel) if integration else None
+            self._config_loaded_at = time.monotonic()
+        return self._config
+
+    async def _post(self, text: str):
+        config = await self._get_config()
+        if config is None:
+            logger.info("No Slack integration found, dropping notification")
+            return
+        token, channel = config
+        client = self._clients.get(token)
+        if client is None:
+            client = self._clients[token] = AsyncWebClient(token=token)
+
+        for attempt in range(settings.SLACK_MAX_RETRIES + 1):
+            wait = self._next_post_at.get(channel, 0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                await client.chat_postMessage(channel=channel, text=text)
+                self._next_post_at[channel] = time.monotonic() + settings.SLACK_MIN_POST_INTERVAL
+                return
+            except SlackApiError as e:
+                if e.response.status_code != 429 or attempt == settings.SLACK_MAX_RETRIES:
+                    raise
+                retry_after = _retry_after(e)
+                self._next_post_at[channel] = time.monotonic() + retry_after
+                logger.warning(f"Slack rate limited channel {channel}, retrying in {retry_after:.0f}s")
+
+    async def close(self, timeout: float = 10):
+        """Posts the pending digest and waits briefly for the queue to drain."""
+        if self._window_flush is not None:
+            self._window_flush.cancel()
+            self._flush_window()
+        if self._worker is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {self._queue.qsize()} unsent Slack notifications on shutdown")
+        self._worker.cancel()
+
+
+slack_notifier = SlackNotifier()
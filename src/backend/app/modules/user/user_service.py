@@ -9,6 +9,7 @@ from app.core.logger import logger
 from app.core.security import get_password_hash, decode_token
 from fastapi import HTTPException, status
 from app.utils.pagination import paginate
+from app.modules.auth.user_cache import user_cache
 from sqlalchemy.sql import func
 
 
@@ -94,6 +95,7 @@ async def update_user(
                 synchronize_session="fetch"))
     await db.execute(stmt)
     await db.commit()
+    user_cache.invalidate(user_id)
     return await get_user_by_id(db, user_id)
 
 
@@ -120,6 +122,7 @@ async def delete_user(db: AsyncSession, user_id: int):
     )
     await db.execute(stmt)
     await db.commit()
+    user_cache.invalidate(user_id)
     logger.info(f"User with id: {user_id} has been deactivated.")
     return await get_user_by_id(db, user_id)
 
@@ -137,6 +140,7 @@ async def update_user_password(
             updated_by_uid=current_user.id))
     await db.execute(stmt)
     await db.commit()
+    user_cache.invalidate(user_id)
     logger.info(f"Password updated for user id: {user_id}")
     return await get_user_by_id(db, user_id)
 
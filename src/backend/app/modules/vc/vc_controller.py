@@ -6,6 +6,7 @@ from app.core.db import get_db
 from app.modules.vc.vc_service import *
 from app.modules.auth.auth_utils import role_required, get_current_user
 from app.modules.user.models.user import UserRole
+from app.utils.response_cache import cached_response
 
 
 router = APIRouter(prefix="/vc", tags=["Version Control"])
@@ -68,6 +69,7 @@ async def get_all_vcs_controller(
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
                                                  UserRole.readonly]))])
+@cached_response
 async def get_distinct_vc_types_controller(
         db: AsyncSession = Depends(get_db),
         current_user=Depends(get_current_user)):
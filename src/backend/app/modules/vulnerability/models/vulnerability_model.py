@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, Text, JSON, Float, Boolean, ForeignKey, ARRAY, DateTime, Enum
+    Column, Integer, String, Text, JSON, Float, Boolean, ForeignKey, ARRAY, DateTime, Enum, Index, text
 )
 from sqlalchemy.orm import relationship
 from enum import Enum as PyEnum
@@ -14,6 +14,15 @@ class VulnerabilityType(PyEnum):
 
 class Vulnerability(Base):
     __tablename__ = "vulnerability"
+    __table_args__ = (
+        Index('ix_vulnerability_repository_id', 'repository_id'),
+        Index('ix_vulnerability_vulnerability_id_repository_id', 'vulnerability_id', 'repository_id'),
+        Index('ix_vulnerability_cve_id', 'cve_id', postgresql_where=text('cve_id IS NOT NULL')),
+        Index('ix_vulnerability_pr_scan_id', 'pr_scan_id', postgresql_where=text('pr_scan_id IS NOT NULL')),
+        Index('ix_vulnerability_live_commit_scan_id', 'live_commit_scan_id',
+              postgresql_where=text('live_commit_scan_id IS NOT NULL')),
+        Index('ix_vulnerability_whitelist_id', 'whitelist_id', postgresql_where=text('whitelist_id IS NOT NULL')),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     vulnerability_id = Column(String, nullable=False)
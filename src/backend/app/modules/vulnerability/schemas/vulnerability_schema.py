@@ -96,3 +96,8 @@ class UniqueVulnerabilityFetchParams(BaseModel):
     page: int = 1
     sort_by: str = "created_at"
     order_by: str = "asc"
+
+    # Keyset pagination for the vulnerabilities listing: "" for the first
+    # page, then the previous page's next_cursor
+    cursor: Optional[str] = None
+    include_total: bool = True
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException, status, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.modules.vulnerability.schemas.vulnerability_schema import (
     VulnerabilityPaginationResponse,
     VulnerabilityGroupedResponse,
@@ -19,10 +19,13 @@ from app.modules.vulnerability.vulnerability_service import (
     scan_vulnerability_repo_by_id,
     get_vulnerability_by_id,
     get_repos_for_vulnerability,
-    get_all_unique_vulnerabilities
+    get_all_unique_vulnerabilities,
+    export_vulnerabilities
 )
 from app.modules.auth.auth_utils import role_required, get_current_user
 from app.modules.user.models.user import UserRole
+from app.utils.export import ExportFormat
+from app.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/vulnerabilities", tags=["Vulnerabilities"])
 
@@ -30,7 +33,7 @@ router = APIRouter(prefix="/vulnerabilities", tags=["Vulnerabilities"])
             dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))])
 async def list_vulnerabilities(
         params: UniqueVulnerabilityFetchParams = Body(..., description="Unique vulnerability filters and paging parameters"),
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_read_db)
 ):
     vulnerabilities = await get_all_vulnerabilities(
         db,
@@ -62,6 +65,8 @@ async def list_vulnerabilities(
         limit=params.limit,
         sort_by=params.sort_by,
         order=params.order_by,
+        cursor=params.cursor,
+        include_total=params.include_total,
     )
     return vulnerabilities
 
@@ -71,7 +76,7 @@ async def list_vulnerabilities(
 )
 async def list_vulnerabilities_unique(
     params: UniqueVulnerabilityFetchParams = Body(..., description="Unique vulnerability filters and paging parameters"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     vulnerabilities = await get_all_unique_vulnerabilities(
         db,
@@ -106,6 +111,16 @@ async def list_vulnerabilities_unique(
     )
     return vulnerabilities
 
+
+@router.post("/export",
+             dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))])
+async def export_vulnerabilities_endpoint(
+    params: UniqueVulnerabilityFetchParams = Body(..., description="Vulnerability filters, as for the listing"),
+    format: ExportFormat = Query(ExportFormat.csv, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip the download"),
+):
+    return export_vulnerabilities(params, export_format=format, compress=gzip)
+
 @router.get("/:vulnerability_id/repos",
             dependencies=[Depends(role_required([UserRole.admin,
                                                  UserRole.user,
@@ -130,18 +145,20 @@ async def list_repos_for_vulnerability(
 @router.get("/filters",
             response_model=dict,
             dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))])
+@cached_response
 async def get_filters(db: AsyncSession = Depends(get_db)):
     filters = await get_available_vulnerability_filters(db)
     return filters
 
 @router.get("/filters/{filter_name}/values",
             dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))])
+@cached_response
 async def get_filter_values_endpoint(
     filter_name: str,
     search: Optional[str] = Query(None, description="Search for specific filter values"),
     page: int = Query(1, description="Page number"),
     limit: int = Query(10, description="Number of items per page"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     return await get_vulnerability_filter_values(db, filter_name, search, page, limit)
 @router.get("/{id}", dependencies=[Depends(role_required([UserRole.admin, UserRole.user, UserRole.readonly]))])
@@ -20,7 +20,8 @@ from app.modules.user.models.user import User
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, distinct, asc, desc, or_, cast, String
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, keyset_paginate, keyset_page
+from app.utils.counting import count_rows
 from app.modules.whitelist.whitelist_service import add_whitelist
 from app.modules.whitelist.model.whitelist_model import Whitelist
 from app.modules.whitelist.schema.whitelist_schema import WhitelistCreate
@@ -32,8 +33,16 @@ from math import ceil
 from app.modules.whitelist.whitelist_service import is_whitelisted
 from app.modules.whitelist.schema.whitelist_schema import WhiteListType
 from app.modules.slack_integration.slack_integration_service import fetch_and_notify
+from app.modules.slack_integration.slack_notifier import slack_notifier
 from app.utils.delete_folder import delete_folder
+from app.utils.search import search_document, matches
+from app.utils.export import ExportFormat, export_response
+from app.utils.single_flight import single_flight
+from app.modules.vulnerability.schemas.vulnerability_schema import UniqueVulnerabilityFetchParams
+from app.modules.facets.facet_service import is_faceted, get_facet_values
 
+# Matches the ix_vulnerability_search_trgm index expression
+VULNERABILITY_SEARCH_DOCUMENT = search_document(Vulnerability.vulnerability_id, Vulnerability.cve_id)
 
 async def create_repo_scan(db: AsyncSession, repo_id: int) -> RepositoryScan:
     existing_scan_result = await db.execute(
@@ -338,6 +347,16 @@ async def get_vulnerability_filter_values(
     if not column:
         raise ValueError("Invalid filter name")
 
+    def extract_value(item):
+        return item.value if hasattr(item, "value") else str(item)
+
+    if is_faceted(column):
+        values, total_count = await get_facet_values(db, column, search, page, page_size)
+        return {
+            "values": [{"label": extract_value(value), "value": extract_value(value)} for value, _ in values],
+            "total": total_count
+        }
+
     query = select(distinct(column)).where(column.isnot(None))
 
     # For datetime filters, perform special date parsing.
@@ -356,9 +375,6 @@ async def get_vulnerability_filter_values(
     result = await db.execute(paginated_query)
     values = [row[0] for row in result.fetchall()]
 
-    def extract_value(item):
-        return item.value if hasattr(item, "value") else str(item)
-
     formatted_values = [{"label": extract_value(value), "value": extract_value(value)} for value in values]
 
     return {"values": formatted_values, "total": total_count}
@@ -368,6 +384,10 @@ async def get_filter_values(db: AsyncSession, filter_name: str, search: Optional
     if not column:
         raise ValueError("Invalid filter name")
 
+    if is_faceted(column):
+        values, total_count = await get_facet_values(db, column, search, page, page_size)
+        return [value for value, _ in values], total_count
+
     query = select(distinct(column))
     if search:
         query = query.where(column.ilike(f"%{search}%"))
@@ -377,8 +397,7 @@ async def get_filter_values(db: AsyncSession, filter_name: str, search: Optional
     return [row[0] for row in result], paginated_query['meta']['total']
 
 
-async def get_all_vulnerabilities(
-        db: AsyncSession,
+def _vulnerabilities_query(
         search: Optional[str] = None,
         repo_ids: Optional[List[int]] = None,
         vc_ids: Optional[List[int]] = None,
@@ -402,23 +421,13 @@ async def get_all_vulnerabilities(
         cvss_exploitability_score: Optional[float] = None,
         cvss_impact_score: Optional[float] = None,
         fix_available: Optional[bool] = None,
-        page: int = 1,
-        limit: int = 10,
-        sort_by: str = "created_at",
-        order: str = "asc"
-) -> dict:
-    base_query = select(Vulnerability)
-
+):
+    """select(Vulnerability) with the listing's filters applied, shared by the listing and the export."""
     base_query = select(Vulnerability)
 
     # 2) Apply filters
     if search:
-        base_query = base_query.where(
-            or_(
-                Vulnerability.vulnerability_id.ilike(f"%{search}%"),
-                Vulnerability.cve_id.ilike(f"%{search}%")
-            )
-        )
+        base_query = base_query.where(matches(VULNERABILITY_SEARCH_DOCUMENT, search))
     if repo_ids:
         base_query = base_query.where(Vulnerability.repository_id.in_(repo_ids))
     if vc_ids:
@@ -469,19 +478,153 @@ async def get_all_vulnerabilities(
     if fix_available is not None:
         base_query = base_query.where(Vulnerability.fix_available == fix_available)
 
+    return base_query
+
+
+@single_flight
+async def get_all_vulnerabilities(
+        db: AsyncSession,
+        search: Optional[str] = None,
+        repo_ids: Optional[List[int]] = None,
+        vc_ids: Optional[List[int]] = None,
+        pr_ids: Optional[List[int]] = None,
+        live_commit_ids: Optional[List[int]] = None,
+        vulnerability_ids: Optional[List[str]] = None,
+        cve_ids: Optional[List[str]] = None,
+        severities: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        artifact_types: Optional[List[str]] = None,
+        packages: Optional[List[str]] = None,
+        licenses: Optional[List[str]] = None,
+        vulnerability_types: Optional[List[VulnerabilityType]] = None,
+        vulnerability_data_source: Optional[str] = None,
+        vulnerability_urls: Optional[List[str]] = None,
+        cve_urls: Optional[List[str]] = None,
+        cve_data_source: Optional[str] = None,
+        description: Optional[str] = None,
+        cvss_base_score: Optional[float] = None,
+        cvss_exploitability_score: Optional[float] = None,
+        cvss_impact_score: Optional[float] = None,
+        fix_available: Optional[bool] = None,
+        page: int = 1,
+        limit: int = 10,
+        sort_by: str = "created_at",
+        order: str = "asc",
+        cursor: Optional[str] = None,
+        include_total: bool = True
+) -> dict:
+    base_query = _vulnerabilities_query(
+        search=search,
+        repo_ids=repo_ids,
+        vc_ids=vc_ids,
+        pr_ids=pr_ids,
+        live_commit_ids=live_commit_ids,
+        vulnerability_ids=vulnerability_ids,
+        cve_ids=cve_ids,
+        severities=severities,
+        created_after=created_after,
+        created_before=created_before,
+        artifact_types=artifact_types,
+        packages=packages,
+        licenses=licenses,
+        vulnerability_types=vulnerability_types,
+        vulnerability_data_source=vulnerability_data_source,
+        vulnerability_urls=vulnerability_urls,
+        cve_urls=cve_urls,
+        cve_data_source=cve_data_source,
+        description=description,
+        cvss_base_score=cvss_base_score,
+        cvss_exploitability_score=cvss_exploitability_score,
+        cvss_impact_score=cvss_impact_score,
+        fix_available=fix_available,
+    )
+
     # Sorting
     order_by_func = asc if order == "asc" else desc
-    query = base_query.order_by(order_by_func(getattr(Vulnerability, sort_by)))
+    sort_column = getattr(Vulnerability, sort_by)
+    query = base_query.order_by(order_by_func(sort_column))
 
     # Pagination
-    total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
-    paginated_query = paginate(query, total_count, page, limit)
-    result = await db.execute(paginated_query['query'])
-    vulnerabilities = result.scalars().all()
+    total_count, approximate = await count_rows(db, query) if include_total else (None, False)
+    if cursor is not None:
+        paginated_query = keyset_paginate(
+            query, sort_column, Vulnerability.id, cursor, limit,
+            descending=order != "asc", total_count=total_count, approximate=approximate)
+        result = await db.execute(paginated_query['query'])
+        vulnerabilities = keyset_page(
+            result.scalars().all(), paginated_query, lambda v: (getattr(v, sort_by), v.id))
+    else:
+        paginated_query = paginate(query, total_count, page, limit, approximate)
+        result = await db.execute(paginated_query['query'])
+        vulnerabilities = result.scalars().all()
 
     return {"data": vulnerabilities,  **paginated_query['meta'] }
 
 
+VULNERABILITY_EXPORT_COLUMNS = [
+    ("id", Vulnerability.id),
+    ("vulnerability_id", Vulnerability.vulnerability_id),
+    ("cve_id", Vulnerability.cve_id),
+    ("severity", Vulnerability.severity),
+    ("vulnerability_type", Vulnerability.vulnerability_type),
+    ("package", Vulnerability.package),
+    ("package_version", Vulnerability.package_version),
+    ("fix_available", Vulnerability.fix_available),
+    ("artifact_type", Vulnerability.artifact_type),
+    ("artifact_path", Vulnerability.artifact_path),
+    ("license", Vulnerability.license),
+    ("cvss_base_score", Vulnerability.cvss_base_score),
+    ("description", Vulnerability.description),
+    ("whitelisted", Vulnerability.whitelisted),
+    ("repository_id", Vulnerability.repository_id),
+    ("repository_name", Repo.name),
+    ("vc_id", Vulnerability.vc_id),
+    ("pr_id", Vulnerability.pr_id),
+    ("created_at", Vulnerability.created_at),
+    ("updated_at", Vulnerability.updated_at),
+]
+
+
+def export_vulnerabilities(
+        params: UniqueVulnerabilityFetchParams,
+        export_format: ExportFormat = ExportFormat.csv,
+        compress: bool = False,
+):
+    """Every vulnerability matching the listing's filters, streamed as a download."""
+    query = (
+        _vulnerabilities_query(
+            search=params.search,
+            repo_ids=params.repo_ids,
+            vc_ids=params.vc_ids,
+            pr_ids=params.pr_ids,
+            live_commit_ids=params.live_commit_ids,
+            vulnerability_ids=params.vulnerability_ids,
+            cve_ids=params.cve_ids,
+            severities=params.severities,
+            created_after=params.created_after,
+            created_before=params.created_before,
+            artifact_types=params.artifact_types,
+            packages=params.packages,
+            licenses=params.licenses,
+            vulnerability_types=params.vulnerability_types,
+            vulnerability_data_source=params.vulnerability_data_source,
+            vulnerability_urls=params.vulnerability_urls,
+            cve_urls=params.cve_urls,
+            cve_data_source=params.cve_data_source,
+            description=params.description,
+            cvss_base_score=params.cvss_base_score,
+            cvss_exploitability_score=params.cvss_exploitability_score,
+            cvss_impact_score=params.cvss_impact_score,
+            fix_available=params.fix_available,
+        )
+        .outerjoin(Repo, Vulnerability.repository_id == Repo.id)
+        .order_by(Vulnerability.id)
+    )
+    return export_response(query, VULNERABILITY_EXPORT_COLUMNS, "vulnerabilities", export_format, compress)
+
+
+@single_flight
 async def get_all_unique_vulnerabilities(
         db: AsyncSession,
         search: Optional[str] = None,
@@ -517,12 +660,7 @@ async def get_all_unique_vulnerabilities(
 
     # 2) Apply filters
     if search:
-        base_query = base_query.where(
-            or_(
-                Vulnerability.vulnerability_id.ilike(f"%{search}%"),
-                Vulnerability.cve_id.ilike(f"%{search}%")
-            )
-        )
+        base_query = base_query.where(matches(VULNERABILITY_SEARCH_DOCUMENT, search))
     if repo_ids:
         base_query = base_query.where(Vulnerability.repository_id.in_(repo_ids))
     if vc_ids:
@@ -623,9 +761,7 @@ async def get_all_unique_vulnerabilities(
         final_query = final_query.order_by(order_by_func(sort_column))
 
     # 7) Count total rows
-    total_count = await db.scalar(
-        select(func.count()).select_from(final_query.subquery())
-    )
+    total_count, approximate = await count_rows(db, final_query)
 
     # 8) Pagination
     offset = (page - 1) * limit
@@ -668,6 +804,7 @@ async def get_all_unique_vulnerabilities(
     return {
         "data": data,
         "total_count": total_count,
+        "total_count_approximate": approximate,
         "current_page": page,
         "current_limit": limit,
         "total_pages": total_pages,
@@ -698,8 +835,7 @@ async def get_repos_for_vulnerability(
     )
 
     # Count query for pagination
-    count_query = select(func.count().label("total_count")).select_from(query_stmt.subquery())
-    total_count = (await db.execute(count_query)).scalar()
+    total_count, approximate = await count_rows(db, query_stmt)
 
     # Pagination logic
     offset = (page - 1) * limit
@@ -727,6 +863,7 @@ async def get_repos_for_vulnerability(
         "vulnerability_id": vulnerability_id,
         "repositories": repos_list,
         "total_count": total_count,
+        "total_count_approximate": approximate,
         "current_limit": limit,
         "current_page": page,
         "total_pages": total_pages,
@@ -907,20 +1044,22 @@ async def scan_vulnerability_all_repos_for_vc(db: AsyncSession, vc_id: int, curr
     limit = 100
     scans = []
 
-    while True:
-        repos = await get_repos_by_vc_id(db, vc_id=vc_id, page=page, limit=limit)
-        if not repos["data"]:
-            logger.info(f"No more repositories to scan for VC ID {vc_id}. Completed scanning.")
-            break
-
-        for repo in repos["data"]:
-            try:
-                scan = await scan_vulnerability_repo_by_id(db, repo.id, current_user=current_user)
-                if scan:
-                    scans.append(scan)
-            except Exception as e:
-                logger.error(f"Error scanning repository {repo.id}: {e}")
-        page += 1
+    # One Slack digest for the whole VC when SLACK_DIGEST_VC_SCANS is on
+    async with slack_notifier.scan_digest(f"Vulnerability scan of VC {vc_id}"):
+        while True:
+            repos = await get_repos_by_vc_id(db, vc_id=vc_id, page=page, limit=limit)
+            if not repos["data"]:
+                logger.info(f"No more repositories to scan for VC ID {vc_id}. Completed scanning.")
+                break
+
+            for repo in repos["data"]:
+                try:
+                    scan = await scan_vulnerability_repo_by_id(db, repo.id, current_user=current_user)
+                    if scan:
+                        scans.append(scan)
+                except Exception as e:
+                    logger.error(f"Error scanning repository {repo.id}: {e}")
+            page += 1
 
     return scans
 
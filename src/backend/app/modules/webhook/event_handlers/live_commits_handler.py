@@ -5,7 +5,7 @@ from app.core.logger import logger
 from app.modules.live_commits.live_commits_scans_service import add_live_commit_scan, update_live_commit_scan_status
 from app.modules.live_commits.models.live_commits_scan import LiveCommitScanType
 from app.modules.live_commits.schemas.live_commits_schemas import LiveCommitScanCreate, StatusEnum
-from app.modules.repository.repository_service import get_repos_by_vc_id
+from app.modules.repository.repo_resolver import repo_resolver
 from app.modules.vulnerability.vulnerability_service import scan_vulnerability_live_commit_id
 from app.secret_scanner.live_commits_secret_scanner import commit_loose_scan, commit_aggressive_scan
 from app.modules.live_commits.live_commits_service import add_live_commit
@@ -120,11 +120,10 @@ async def live_commits_handler(
     ):
 
     try:
-        repo = await get_repos_by_vc_id(db, vc.id, repo_name=event_info['repository'])
-        if not repo or not repo['data']:
+        repo_dict = await repo_resolver.resolve(db, vc.id, event_info['repository'])
+        if not repo_dict:
             raise HTTPException(status_code=404, detail="Repository not found")
 
-        repo_dict = repo['data'][0]
         repo_id = repo_dict.id
         print("Got the repo")
 
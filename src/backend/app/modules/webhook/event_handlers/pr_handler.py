@@ -8,7 +8,7 @@ from app.modules.pr.schemas.pr_scan_schema import PRScanCreate, PRScanUpdate
 from app.modules.pr.models.pr_scan import StatusEnum, PRScanType
 from app.modules.pr.pr_service import create_pr, update_pr_blocked_status, get_pr_blocked_status
 from app.modules.pr.pr_scan_service import create_pr_scan, update_pr_scan
-from app.modules.repository.repository_service import get_repos_by_vc_id
+from app.modules.repository.repo_resolver import repo_resolver
 from app.secret_scanner.pr_secret_scanner import pr_loose_scan, pr_aggressive_scan
 from app.utils.secret_scanning.handle_pr_actions import comment_pr, update_pr_status
 from app.utils.store_secrets import store_secrets
@@ -136,13 +136,12 @@ async def pr_handler(db: AsyncSession, vc, webhook_config: WebhookConfig, event_
     """
     print("into pr handler")
     # Retrieve the repository
-    repo = await get_repos_by_vc_id(db, vc.id, repo_name=event_info['repository'])
-    if not repo or not repo['data']:
+    repo_dict = await repo_resolver.resolve(db, vc.id, event_info['repository'])
+    if not repo_dict:
         logger.error("Repository not found")
         raise HTTPException(status_code=404, detail="Repository not found")
     print("Got the repo")
 
-    repo_dict = repo['data'][0]
     repo_id = repo_dict.id
 
     print(repo_id) 
@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.future import select
 
 from app.modules.repository.models.repository import Repo
+from app.modules.repository.repo_resolver import repo_resolver
 from app.modules.repository.repository_service import scan_repo_by_id
 from app.modules.vc.vc_service import get_vc
 
@@ -34,6 +35,7 @@ async def repo_creation_handler(db, vc_id, event_info):
         db.add(new_repo)
         await db.commit()
         await db.refresh(new_repo)
+        repo_resolver.invalidate(vc.id, repo_name)
 
         await scan_repo_by_id(db, new_repo.id)
         return JSONResponse(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, ARRAY, DateTime, func, Enum
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, ARRAY, DateTime, func, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
 from app.core.db import Base
 from datetime import datetime
@@ -13,6 +13,9 @@ class WhiteListType(enum.Enum):
 
 class Whitelist(Base):
     __tablename__ = 'whitelist'
+    __table_args__ = (
+        Index('ix_whitelist_type_active_name', 'type', 'active', 'name'),
+    )
 
     type = Column(Enum(WhiteListType), nullable=False)
     id = Column(Integer, primary_key=True, autoincrement=True)
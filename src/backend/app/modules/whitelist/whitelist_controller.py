@@ -11,6 +11,7 @@ from app.modules.whitelist.whitelist_service import (
 from app.core.db import get_db
 from app.modules.user.models.user import UserRole, User
 from app.modules.auth.auth_utils import role_required, get_current_user
+from app.utils.response_cache import cached_response
 
 router = APIRouter(
     prefix="/whitelist",
@@ -46,7 +47,9 @@ async def fetch_whitelist(
     order_by: Optional[str] = Query("asc", description="Order direction: asc or desc"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
-    repo_whitelist: Optional[bool] = Query(default=False, description="Send only repo whitelist")
+    repo_whitelist: Optional[bool] = Query(default=False, description="Send only repo whitelist"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor: empty for the first page, then next_cursor"),
+    include_total: bool = Query(True, description="Compute the total count")
 ):
     return await get_whitelist(
         db, 
@@ -59,7 +62,9 @@ async def fetch_whitelist(
         sort_by=sort_by, 
         order_by=order_by,
         type=type,
-        repo_whitelist=repo_whitelist
+        repo_whitelist=repo_whitelist,
+        cursor=cursor,
+        include_total=include_total
     )
 
 # Fetch available filter options for whitelist
@@ -69,6 +74,7 @@ async def fetch_filters(db: Session = Depends(get_db)):
 
 
 @router.get("/{value}/filter", response_model=dict, dependencies=[Depends(get_current_user)])
+@cached_response
 async def fetch_filter_values(
     value: str,
     page: int = Query(1, ge=1, description="Page number (starting from 1)"),
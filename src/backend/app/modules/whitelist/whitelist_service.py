@@ -23,7 +23,7 @@ from app.modules.whitelist.schema.whitelist_schema import (
     RepoInfo,
     WhitelistUpdateResponse,
     WhiteListType)
-from app.utils.pagination import paginate
+from app.utils.pagination import paginate, keyset_paginate, keyset_page
 from app.modules.user.models.user import User
 from app.modules.vc.models.vc import VC
 from app.modules.repository.models.repository import Repo
@@ -127,7 +127,9 @@ async def get_whitelist(
     limit: int = 10,
     sort_by: str = "id",
     order_by: str = "asc",
-    repo_whitelist=False
+    repo_whitelist=False,
+    cursor: Optional[str] = None,
+    include_total: bool = True
 ):  
     # Initial whitelist query
     query = select(Whitelist).filter(Whitelist.active)
@@ -157,15 +159,25 @@ async def get_whitelist(
     query = query.order_by(desc(sort_column) if order_by == "desc" else asc(sort_column))
 
     # Get total count for pagination
-    total_count_query = select(func.count()).select_from(query.subquery())
-    total_count = await db.scalar(total_count_query)
+    total_count = None
+    total_pages = None
+    if include_total:
+        total_count_query = select(func.count()).select_from(query.subquery())
+        total_count = await db.scalar(total_count_query)
+        total_pages = (total_count + limit - 1) // limit
 
     # Pagination logic
-    total_pages = (total_count + limit - 1) // limit
-    offset = (page - 1) * limit
-    paginated_query = query.offset(offset).limit(limit)
-    results = await db.scalars(paginated_query)
-    whitelists = results.all()
+    if cursor is not None:
+        pagination = keyset_paginate(
+            query, sort_column, Whitelist.id, cursor, limit,
+            descending=order_by == "desc", total_count=total_count)
+        results = await db.scalars(pagination["query"])
+        whitelists = keyset_page(results.all(), pagination, lambda w: (getattr(w, sort_column.key), w.id))
+    else:
+        offset = (page - 1) * limit
+        paginated_query = query.offset(offset).limit(limit)
+        results = await db.scalars(paginated_query)
+        whitelists = results.all()
 
     # Fetch VCS and repository details
     vcs_ids = {vcs_id for w in whitelists for vcs_id in w.vcs}
@@ -228,6 +240,9 @@ async def get_whitelist(
         for w in whitelists
     ]
 
+    if cursor is not None:
+        return {"data": whitelist_responses, **pagination["meta"]}
+
     return {
         "data": whitelist_responses,
         "total_count": total_count,
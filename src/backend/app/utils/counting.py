@@ -0,0 +1,129 @@
+import json
+import time
+from collections import OrderedDict
+from datetime import date
+from enum import Enum
+from typing import Optional, Tuple
+
+from sqlalchemy import Table, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.config import settings
+
+# (total, approximate)
+CountResult = Tuple[int, bool]
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, with its parameters bound as usual."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _normalize(value):
+    if isinstance(value, (list, tuple, set)):
+        # IN lists: the same filter set in any order is the same count
+        return tuple(sorted((_normalize(item) for item in value), key=repr))
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, int, float, bool, date)) or value is None:
+        return value
+    return repr(value)
+
+
+class CountCache:
+    """
+    In-process LRU of listing totals keyed by the compiled count query and
+    its normalized parameters. Entries live COUNT_CACHE_TTL seconds, so a
+    user paging through one filter set pays for the count once. Local
+    writes clear it (see app.utils.response_cache).
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, Tuple[CountResult, float]]" = OrderedDict()
+
+    @staticmethod
+    def key(query) -> tuple:
+        # The same filter set under any sort is the same total
+        compiled = query.order_by(None).compile(dialect=postgresql.dialect())
+        params = tuple(sorted((name, _normalize(value)) for name, value in compiled.params.items()))
+        return compiled.string, params
+
+    def get(self, key: tuple) -> Optional[CountResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        result, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: tuple, result: CountResult):
+        self._entries[key] = (result, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+count_cache = CountCache(settings.COUNT_CACHE_SIZE, settings.COUNT_CACHE_TTL)
+
+
+async def estimate_rows(db: AsyncSession, query) -> Optional[int]:
+    """
+    Planner row estimate for a query: pg_class.reltuples for an unfiltered
+    single-table listing, otherwise the top node of its EXPLAIN plan. None
+    when the table has never been analyzed.
+    """
+    froms = query.get_final_froms()
+    if query.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+        reltuples = await db.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": froms[0].fullname})
+        return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+    plan = await db.scalar(Explain(query))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(db: AsyncSession, query) -> CountResult:
+    """
+    Total rows of a listing query as (count, approximate).
+
+    Exact counts come from a short-TTL cache keyed by the filter set. When
+    the planner expects more than COUNT_EXACT_THRESHOLD rows the estimate is
+    returned instead of scanning the whole set, flagged as approximate.
+    """
+    key = count_cache.key(query)
+    cached = count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    estimate = await estimate_rows(db, query)
+    if estimate is not None and estimate > settings.COUNT_EXACT_THRESHOLD:
+        result = (estimate, True)
+    else:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        result = (await db.scalar(count_query), False)
+
+    count_cache.set(key, result)
+    return result
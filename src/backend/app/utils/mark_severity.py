@@ -1,5 +1,15 @@
 from app.modules.secrets.model.secrets_model import SeverityLevel
+from app.core.config import settings
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional
+import json
+import logging
+import os
 import re
+import time
+
+logger = logging.getLogger(__name__)
 
 
 severity_map = {
@@ -681,11 +691,100 @@ def convert_case(string: str) -> str:
         return re.sub(r'([a-z0-9])([A-Z])', r'\1-\2', string).lower()
 
 
-def mark_severity(key_name: str) -> SeverityLevel:
-    key_name = convert_case(key_name).lower()
+@lru_cache(maxsize=4096)
+def normalize_rule(key_name: str) -> str:
+    return convert_case(key_name).lower()
+
 
+def _build_registry() -> Mapping[str, SeverityLevel]:
+    # The first severity listing a rule wins, as with the original linear search
+    registry = {}
     for severity, keys in severity_map.items():
-        converted_keys = [convert_case(key).lower() for key in keys]
-        if key_name in converted_keys:
-            return severity
-    return SeverityLevel.UNKNOWN
+        for key in keys:
+            registry.setdefault(normalize_rule(key), severity)
+    return MappingProxyType(registry)
+
+
+# Normalized rule name -> severity, built once at import
+severity_registry = _build_registry()
+
+
+class SeverityOverrides:
+    """
+    Rule severity overrides layered on top of `severity_registry`.
+
+    Overrides come from a JSON file of {"rule": "severity"} pairs
+    (settings.SEVERITY_OVERRIDES_FILE), which is re-read when its mtime
+    changes, or are set directly with `set_overrides` (e.g. from the DB).
+    """
+
+    def __init__(self, path: str = '', check_interval: float = 30.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._file_overrides: Mapping[str, SeverityLevel] = MappingProxyType({})
+        self._overrides: Mapping[str, SeverityLevel] = MappingProxyType({})
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+
+    @staticmethod
+    def _parse(mapping: Mapping[str, str]) -> Dict[str, SeverityLevel]:
+        return {
+            normalize_rule(rule): SeverityLevel(str(severity).lower())
+            for rule, severity in mapping.items()
+        }
+
+    def set_overrides(self, mapping: Mapping[str, str]):
+        """Replaces the runtime overrides, which take precedence over the file."""
+        self._overrides = MappingProxyType(self._parse(mapping))
+
+    def _reload_file(self):
+        now = time.monotonic()
+        if not self.path or now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            if self._mtime is not None:
+                logger.warning("Severity overrides file %s is gone, dropping overrides", self.path)
+                self._file_overrides = MappingProxyType({})
+                self._mtime = None
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path) as f:
+                self._file_overrides = MappingProxyType(self._parse(json.load(f)))
+            self._mtime = mtime
+            logger.info("Loaded %d severity overrides from %s", len(self._file_overrides), self.path)
+        except (OSError, ValueError) as e:
+            logger.error("Could not load severity overrides from %s: %s", self.path, e)
+
+    def get(self, normalized_rule: str) -> Optional[SeverityLevel]:
+        self._reload_file()
+        return self._overrides.get(normalized_rule) or self._file_overrides.get(normalized_rule)
+
+
+severity_overrides = SeverityOverrides(settings.SEVERITY_OVERRIDES_FILE)
+
+
+def mark_severity(key_name: str) -> SeverityLevel:
+    key_name = normalize_rule(key_name)
+
+    override = severity_overrides.get(key_name)
+    if override is not None:
+        return override
+    return severity_registry.get(key_name, SeverityLevel.UNKNOWN)
+
+
+def classify(rule_ids: Iterable[Optional[str]]) -> List[SeverityLevel]:
+    """
+    Severity for each rule id, in order. Each distinct rule is resolved once
+    per batch; a missing rule id is UNKNOWN.
+    """
+    rule_ids = list(rule_ids)
+    severities = {
+        rule_id: mark_severity(rule_id) if rule_id else SeverityLevel.UNKNOWN
+        for rule_id in set(rule_ids)
+    }
+    return [severities[rule_id] for rule_id in rule_ids]
@@ -1,20 +1,28 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
 from math import ceil
-from typing import Any
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
+from fastapi import HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy import and_, or_, tuple_
 
 
-def paginate(query, total_count: int, page: int, limit: int):
+def paginate(query, total_count: Optional[int], page: int, limit: int, approximate: bool = False):
     """
     Applies pagination to a query.
 
     :param query: SQLAlchemy query object.
-    :param total_count: Total number of records.
+    :param total_count: Total number of records, or None when the count was skipped.
     :param page: The current page number.
     :param limit: The number of records per page.
+    :param approximate: Whether total_count is a planner estimate.
     :return: Paginated query, metadata.
     """
-    total_pages = ceil(total_count / limit)
+    total_pages = ceil(total_count / limit) if total_count is not None else None
     paginated_query = query.offset((page - 1) * limit).limit(limit)
 
     return {
@@ -23,11 +31,141 @@ def paginate(query, total_count: int, page: int, limit: int):
             "current_page": page,
             "total_pages": total_pages,
             "current_limit": limit,
-            "total_count": total_count
+            "total_count": total_count,
+            "total_count_approximate": approximate
         }
     }
 
 
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _decode_value(column, value):
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    enum_class = getattr(column.type, "enum_class", None)
+    if enum_class is not None and value is not None:
+        return enum_class(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for the position after a row with the given key values."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[list]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != 2:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
+
+
+def _after(sort_column, id_column, sort_value, last_id, descending: bool):
+    """Rows strictly after (sort_value, last_id) in (sort_column, id_column) order, NULLs last."""
+    if sort_column is id_column:
+        return id_column < last_id if descending else id_column > last_id
+    if sort_value is None:
+        # Already inside the trailing block of NULL sort values
+        return and_(sort_column.is_(None), id_column < last_id if descending else id_column > last_id)
+    if not getattr(sort_column, "nullable", True):
+        # Row comparison, so Postgres can walk a (sort, id) index directly
+        position = tuple_(sort_value, last_id, types=[sort_column.type, id_column.type])
+        if descending:
+            return tuple_(sort_column, id_column) < position
+        return tuple_(sort_column, id_column) > position
+    beyond = sort_column < sort_value if descending else sort_column > sort_value
+    tie = id_column < last_id if descending else id_column > last_id
+    return or_(beyond, and_(sort_column == sort_value, tie), sort_column.is_(None))
+
+
+def keyset_paginate(
+        query,
+        sort_column,
+        id_column,
+        cursor: Optional[str],
+        limit: int,
+        descending: bool = True,
+        total_count: Optional[int] = None,
+        approximate: bool = False):
+    """
+    Applies keyset (cursor) pagination to a query.
+
+    The query is ordered by (sort_column, id_column) and restricted to rows
+    after the position encoded in `cursor`, so every page costs the same
+    however deep it is. One extra row is fetched to detect whether another
+    page follows; pass the results through `keyset_page`.
+
+    :param query: SQLAlchemy query object.
+    :param sort_column: Column the listing is sorted by.
+    :param id_column: Unique tie-breaker, normally the primary key.
+    :param cursor: `next_cursor` of the previous page; empty or None for the first page.
+    :param limit: The number of records per page.
+    :param descending: Sort direction.
+    :param total_count: Total number of records, or None when the count was skipped.
+    :param approximate: Whether total_count is a planner estimate.
+    :return: Paginated query, metadata.
+    """
+    position = decode_cursor(cursor)
+    if sort_column is id_column:
+        ordering = [id_column.desc() if descending else id_column.asc()]
+    else:
+        ordering = [
+            (sort_column.desc() if descending else sort_column.asc()).nulls_last(),
+            id_column.desc() if descending else id_column.asc(),
+        ]
+    query = query.order_by(None).order_by(*ordering)
+
+    if position is not None:
+        sort_value, last_id = position
+        query = query.where(_after(
+            sort_column, id_column, _decode_value(sort_column, sort_value), last_id, descending))
+
+    return {
+        "query": query.limit(limit + 1),
+        "meta": {
+            "current_limit": limit,
+            "total_pages": ceil(total_count / limit) if total_count is not None else None,
+            "total_count": total_count,
+            "total_count_approximate": approximate,
+            "next_cursor": None,
+            "has_more": False,
+        }
+    }
+
+
+def keyset_page(rows: Sequence[Any], pagination: dict, key: Callable[[Any], Tuple[Any, Any]]) -> List[Any]:
+    """
+    Trims the look-ahead row from a keyset page and fills in `next_cursor`.
+
+    :param rows: Rows returned by the query from `keyset_paginate`.
+    :param pagination: The dict returned by `keyset_paginate`; its meta is updated in place.
+    :param key: Returns (sort value, id) for a row.
+    :return: The rows of the current page.
+    """
+    meta = pagination["meta"]
+    rows = list(rows)
+    meta["has_more"] = len(rows) > meta["current_limit"]
+    rows = rows[:meta["current_limit"]]
+    if meta["has_more"]:
+        meta["next_cursor"] = encode_cursor(key(rows[-1]))
+    return rows
+
+
 class Pagination(BaseModel):
     total: int
     page: int
@@ -0,0 +1,247 @@
+import asyncio
+import hashlib
+import inspect
+import time
+from collections import OrderedDict
+from functools import wraps
+from itertools import chain
+from typing import Awaitable, Callable, NamedTuple, Optional, Tuple
+
+from fastapi import Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_mapper
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.modules.auth.auth_utils import get_current_user
+from app.utils.counting import count_cache
+from app.utils.responses import FastJSONResponse
+from app.utils.single_flight import flights
+
+# Writes to these tables never change a cached response
+UNVERSIONED_TABLES = frozenset({
+    "users",
+    "licenses",
+    "comments",
+    "whitelist_comments",
+    "jira_alerts",
+    "slack_integrations",
+    "webhook_configs",
+})
+
+
+class CachedResponse(NamedTuple):
+    version: int
+    etag: str
+    body: bytes
+
+
+class MemoryCacheBackend:
+    """
+    Per-process LRU of rendered responses plus this process's data version.
+    Writes on another replica do not bump this version, so entries expire
+    after `ttl` seconds (RESPONSE_CACHE_MEMORY_TTL, a few seconds) to bound
+    how stale they can be; the cache then mostly absorbs bursts of identical
+    requests.
+    """
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[CachedResponse, float]]" = OrderedDict()
+        self._version = 0
+
+    async def lookup(self, key: str) -> Tuple[int, Optional[CachedResponse]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return self._version, None
+        cached, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return self._version, None
+        self._entries.move_to_end(key)
+        return self._version, cached
+
+    async def set(self, key: str, cached: CachedResponse):
+        self._entries[key] = (cached, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def bump_version(self):
+        self._version += 1
+
+    def clear(self):
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    Rendered responses and the data version kept in Redis, so every replica
+    shares both: a write on one replica invalidates the others' entries too.
+    """
+
+    def __init__(self, url: str, ttl: int, prefix: str = "response_cache"):
+        import redis.asyncio as redis  # only needed when the shared backend is configured
+
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+        self._version_key = f"{prefix}:version"
+
+    async def lookup(self, key: str) -> Tuple[int, Optional[CachedResponse]]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._version_key)
+            pipe.hmget(f"{self.prefix}:{key}", "version", "etag", "body")
+            version, (entry_version, etag, body) = await pipe.execute()
+        version = int(version or 0)
+        if body is None:
+            return version, None
+        return version, CachedResponse(int(entry_version), etag.decode(), body)
+
+    async def set(self, key: str, cached: CachedResponse):
+        name = f"{self.prefix}:{key}"
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(name, mapping=cached._asdict())
+            pipe.expire(name, self.ttl)
+            await pipe.execute()
+
+    async def bump_version(self):
+        await self._redis.incr(self._version_key)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+class ResponseCache:
+    """
+    Cache of rendered dashboard and filter responses keyed by (path,
+    normalized query params, role).
+
+    Every entry records the data version it was computed at. Committing a
+    session that wrote to any table outside UNVERSIONED_TABLES bumps the
+    version (see the session listeners below), so the next request recomputes
+    instead of serving older data. Responses carry a strong ETag over the
+    body and conditional requests are answered with 304.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._pending_bumps = 0
+        self._tasks = set()
+
+    @staticmethod
+    def key(request: Request, role) -> str:
+        # Repeated params in any order are the same filter set
+        params = sorted(request.query_params.multi_items())
+        raw = repr((request.url.path, params, getattr(role, "value", role)))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def data_changed(self):
+        """Bumps the data version after a commit. Every session in this app is
+        async, so commits happen on the running loop."""
+        self._pending_bumps += 1
+        task = asyncio.get_running_loop().create_task(self.backend.bump_version())
+        self._tasks.add(task)
+        task.add_done_callback(self._bumped)
+
+    def _bumped(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        self._pending_bumps -= 1
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Failed to bump the response cache data version: {task.exception()}")
+
+    async def respond(self, request: Request, role, compute: Callable[[], Awaitable]) -> Response:
+        key = self.key(request, role)
+        version, cached = None, None
+        # Until a pending bump lands the stored version is behind this
+        # process's own writes: neither serve nor store entries meanwhile
+        if not self._pending_bumps:
+            try:
+                version, cached = await self.backend.lookup(key)
+            except Exception as e:
+                logger.warning(f"Response cache lookup failed, computing uncached: {e}")
+
+        if cached is None or cached.version != version:
+            result = await compute()
+            if isinstance(result, Response):
+                return result
+            body = FastJSONResponse(jsonable_encoder(result)).body
+            cached = CachedResponse(version or 0, f'"{hashlib.sha1(body).hexdigest()}"', body)
+            if version is not None and not self._pending_bumps:
+                try:
+                    await self.backend.set(key, cached)
+                except Exception as e:
+                    logger.warning(f"Response cache store failed: {e}")
+
+        headers = {"ETag": cached.etag, "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(cached.body, media_type="application/json", headers=headers)
+
+
+def _create_backend():
+    if settings.RESPONSE_CACHE_REDIS_URL:
+        return RedisCacheBackend(settings.RESPONSE_CACHE_REDIS_URL, settings.RESPONSE_CACHE_TTL)
+    return MemoryCacheBackend(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_MEMORY_TTL)
+
+
+response_cache = ResponseCache(_create_backend())
+
+
+def cached_response(endpoint):
+    """
+    Serves a GET endpoint through `response_cache`. The endpoint keeps its
+    own parameters and dependencies; the request and the current user are
+    injected alongside them to build the key.
+    """
+    signature = inspect.signature(endpoint)
+
+    @wraps(endpoint)
+    async def wrapper(*args, cache_request: Request, cache_user=None, **kwargs):
+        return await response_cache.respond(
+            cache_request, cache_user.role, lambda: endpoint(*args, **kwargs))
+
+    wrapper.__signature__ = signature.replace(parameters=[
+        *signature.parameters.values(),
+        inspect.Parameter("cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        inspect.Parameter("cache_user", inspect.Parameter.KEYWORD_ONLY, default=Depends(get_current_user)),
+    ])
+    return wrapper
+
+
+def _versioned(table) -> bool:
+    return getattr(table, "name", None) not in UNVERSIONED_TABLES
+
+
+@event.listens_for(Session, "before_flush")
+def _track_flush(session, flush_context, instances):
+    changed = chain(session.new, session.dirty, session.deleted)
+    if any(_versioned(object_mapper(obj).local_table) for obj in changed):
+        session.info["data_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state):
+    # Bulk insert/update/delete statements bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        if _versioned(orm_execute_state.statement.table):
+            orm_execute_state.session.info["data_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    if session.info.pop("data_changed", False):
+        response_cache.data_changed()
+        flights.forget_all()
+        count_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session):
+    session.info.pop("data_changed", None)
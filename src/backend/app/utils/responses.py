@@ -0,0 +1,47 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, List, Optional
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes Decimal (numeric aggregates)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def fast_response(content: Any, model: Optional[Any] = None, status_code: int = 200) -> FastJSONResponse:
+    """
+    Returns plain dicts/lists straight to orjson, skipping FastAPI's
+    jsonable_encoder and response-model validation. With
+    DEBUG_RESPONSE_VALIDATION the content is first validated against
+    `model` (any pydantic type, e.g. RepoResponse or List[RepoResponse]).
+    """
+    if model is not None and settings.DEBUG_RESPONSE_VALIDATION:
+        _adapter(model).validate_python(content)
+    return FastJSONResponse(content, status_code=status_code)
+
+
+def fast_page(page: dict, item_model: Optional[Any] = None) -> FastJSONResponse:
+    """fast_response for a paginated payload: `item_model` applies to each of page["data"]."""
+    if item_model is not None and settings.DEBUG_RESPONSE_VALIDATION:
+        _adapter(List[item_model]).validate_python(page["data"])
+    return FastJSONResponse(page)
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import List, Optional, Type
+
+from sqlalchemy import and_, func, literal_column
+
+# Literal (not bound) so the rendered expression is identical to the one the
+# trigram indexes were built on and the planner can match it
+_EMPTY = literal_column("''")
+_SEPARATOR = literal_column("' '")
+
+_INT4_MAX = 2 ** 31 - 1
+
+
+def search_document(*columns):
+    """
+    coalesce(a, '') || ' ' || coalesce(b, '') || ... over the searchable
+    text columns of a table. Must list the same columns, in the same order,
+    as the table's GIN trigram index in the search_trigram_indexes migration.
+    """
+    document = func.coalesce(columns[0], _EMPTY)
+    for column in columns[1:]:
+        document = document.concat(_SEPARATOR).concat(func.coalesce(column, _EMPTY))
+    return document
+
+
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def matches(document, term: str):
+    """Case-insensitive substring match, answered by the document's trigram index."""
+    return document.ilike(f"%{escape_like(term)}%")
+
+
+def search_int(term: str) -> Optional[int]:
+    """The term as an integer id, or None when it is not one."""
+    term = term.strip()
+    if not term.isdigit():
+        return None
+    value = int(term)
+    return value if value <= _INT4_MAX else None
+
+
+def search_day(column, term: str):
+    """`column` within the day the term names (YYYY-MM-DD), or None when it is not a date."""
+    try:
+        day = datetime.strptime(term.strip(), "%Y-%m-%d")
+    except ValueError:
+        return None
+    return and_(column >= day, column < day + timedelta(days=1))
+
+
+def search_enum(column, enum_class: Type[Enum], term: str):
+    """`column` IN the members whose name or value contains the term, or None when none do."""
+    needle = term.strip().lower()
+    members: List[Enum] = [
+        member for member in enum_class
+        if needle in member.name.lower() or needle in str(member.value).lower()
+    ]
+    return column.in_(members) if members else None
@@ -0,0 +1,137 @@
+import asyncio
+import inspect
+import time
+from dataclasses import asdict, dataclass
+from datetime import date
+from enum import Enum
+from functools import wraps
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+
+@dataclass
+class FlightStats:
+    executions: int = 0
+    coalesced: int = 0  # joined an execution still in flight
+    reused: int = 0  # served a finished result within the staleness window
+    failures: int = 0
+
+
+flight_stats: Dict[str, FlightStats] = {}
+
+
+class _Abandoned(Exception):
+    """The leading call was cancelled before it finished; its waiters retry."""
+
+
+def _freeze(value) -> Hashable:
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        # Only true sets are order-free; lists may be order-sensitive (sort
+        # keys, ordered ids), so they keep their order in the key
+        return (set, tuple(sorted((_freeze(item) for item in value), key=repr)))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, int, float, bool, date)) or value is None:
+        return value
+    return repr(value)
+
+
+class SingleFlight:
+    """
+    Shares one execution of an identical read between concurrent callers.
+
+    The first caller for a key runs the query; callers arriving while it is
+    in flight await the same result instead of sending their own. A result
+    is shared for at most `max_staleness` seconds from the start of its
+    execution, so the finished result is also reused within that window.
+    Local writes (see app.utils.response_cache) forget every shared result.
+    """
+
+    def __init__(self, max_staleness: float):
+        self.max_staleness = max_staleness
+        self._flights: Dict[Hashable, Tuple[asyncio.Future, float]] = {}
+
+    def _forget(self, key: Hashable, flight: tuple):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def forget_all(self):
+        self._flights.clear()
+
+    async def do(self, name: str, key: Hashable, compute: Callable[[], Awaitable]):
+        stats = flight_stats.setdefault(name, FlightStats())
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                break
+            future, started_at = flight
+            if time.monotonic() - started_at > self.max_staleness:
+                self._forget(key, flight)
+                break
+            if future.done():
+                stats.reused += 1
+            else:
+                stats.coalesced += 1
+            try:
+                # Shielded: a waiter going away must not cancel everyone's query
+                return await asyncio.shield(future)
+            except _Abandoned:
+                continue
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        flight = (future, time.monotonic())
+        self._flights[key] = flight
+        stats.executions += 1
+        try:
+            result = await compute()
+        except BaseException as e:
+            self._forget(key, flight)
+            if isinstance(e, asyncio.CancelledError):
+                future.set_exception(_Abandoned())
+            else:
+                stats.failures += 1
+                future.set_exception(e)
+            future.exception()  # retrieved, whether or not anyone was waiting
+            raise
+
+        future.set_result(result)
+        loop.call_later(max(flight[1] + self.max_staleness - time.monotonic(), 0), self._forget, key, flight)
+        return result
+
+
+flights = SingleFlight(settings.SINGLE_FLIGHT_MAX_STALENESS)
+
+
+def single_flight(fn):
+    """
+    Coalesces concurrent identical calls of an async read service. Calls
+    are identical when every argument except the session normalizes equal;
+    the session of the call that runs the query serves everyone.
+    """
+    signature = inspect.signature(fn)
+    name = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if flights.max_staleness <= 0:
+            return await fn(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (name, _freeze({arg: value for arg, value in bound.arguments.items() if arg != "db"}))
+        return await flights.do(name, key, lambda: fn(*args, **kwargs))
+
+    return wrapper
+
+
+def get_single_flight_stats() -> Dict[str, dict]:
+    return {name: asdict(stats) for name, stats in flight_stats.items()}
@@ -2,7 +2,7 @@ import json
 from app.modules.secrets.model.secrets_model import Secrets, ScanType
 from datetime import datetime
 from app.modules.secrets.secret_service import add_secret
-from app.utils.mark_severity import mark_severity
+from app.utils.mark_severity import classify
 from app.utils.clone_repo import get_branches_from_commit
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,12 +30,15 @@ async def store_secrets(
     secrets_res = []
     secrets_res_new = []
 
-    for secret in secrets:
+    # One registry lookup per distinct rule in the scan
+    rule_key = "RuleID" if scan_type == "repo_scan" else "DetectorName"
+    severities = classify(secret.get(rule_key) if isinstance(secret, dict) else None for secret in secrets)
+
+    for secret, severity in zip(secrets, severities):
         try:
             # Determine if it's a PR/commit or repository scan
             if scan_type == "repo_scan":
                 print("into repo scan")
-                severity = mark_severity(secret.get("RuleID"))
                 secret_data = Secrets(
                     description=secret.get("Description"),
                     secret=secret.get("Secret"),
@@ -71,7 +74,6 @@ async def store_secrets(
                     secrets_res_new.append(sec)
 
             else:  # PR or commit scan (Trufflehog)
-                severity = mark_severity(secret["DetectorName"])
                 secret_data = Secrets(
                     description=f"{secret['DetectorName']}:{secret['DecoderName']}",
                     secret=secret['Raw'],
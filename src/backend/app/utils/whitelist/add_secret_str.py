@@ -1,11 +1,11 @@
 from sqlalchemy.future import select
-from sqlalchemy import update, insert, func, and_
+from sqlalchemy import update, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
 from typing import Optional, List
-from app.modules.secrets.secret_service import Secrets
+from app.modules.secrets.model.secrets_model import Secrets, secret_value_in
 from app.modules.incidents.models.incident_model import Incidents, IncidentStatusEnum, IncidentClosedBy
-from app.modules.incidents.models.activity_model import Activity, Action
+from app.modules.incidents.models.activity_model import Action
+from app.modules.incidents.services.activity_service import update_incidents_with_activity
 from app.utils.whitelist.check_secrets_whitelisted import check_secrets_whitelisted
 from app.utils.whitelist.update_pr_status import update_pr_status
 from app.core.logger import logger
@@ -31,7 +31,7 @@ async def add_secret_str(
 
     conditions = []
     if name:
-        conditions.append(Secrets.secret == name)
+        conditions.append(secret_value_in([name]))
     if not is_global:
         if repos:
             conditions.append(Secrets.repository_id.in_(repos))
@@ -61,7 +61,6 @@ async def add_secret_str(
         await db.commit()
         return 0
 
-    # Close incidents for these secrets
     incident_stmt = (
         update(Incidents)
         .where(
@@ -73,25 +72,16 @@ async def add_secret_str(
             closed_by=IncidentClosedBy.PROGRAM
         )
     )
-    await db.execute(incident_stmt)
-    logger.info(f"Closed incidents for secrets: {secret_ids_list}")
-
-    # Log activity
-    incidents = await db.scalars(
-        select(Incidents).where(Incidents.secret_id.in_(secret_ids_list))
+    # Close incidents and log activity in one statement
+    closed_count = await update_incidents_with_activity(
+        db,
+        incident_stmt,
+        Action.INCIDENT_CLOSED,
+        str(IncidentStatusEnum.OPEN),
+        str(IncidentStatusEnum.CLOSED),
+        user_id
     )
-    for incident in incidents.all():
-        await db.execute(
-            insert(Activity).values(
-                action=Action.INCIDENT_CLOSED,
-                old_value=str(IncidentStatusEnum.OPEN),
-                new_value=str(IncidentStatusEnum.CLOSED),
-                incident_id=incident.id,
-                user_id=user_id,
-                created_at=datetime.utcnow()
-            )
-        )
-        logger.debug(f"Logged activity for closed incident={incident.id}")
+    logger.info(f"Closed {closed_count} incidents for secrets: {secret_ids_list}")
 
     await db.commit()
     logger.info("Committed changes after closing incidents.")
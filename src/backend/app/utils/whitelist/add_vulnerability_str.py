@@ -1,11 +1,11 @@
 from sqlalchemy.future import select
-from sqlalchemy import update, insert, or_
+from sqlalchemy import update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
 from typing import Optional, List
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 from app.modules.incidents.models.incident_model import Incidents, IncidentStatusEnum, IncidentClosedBy
-from app.modules.incidents.models.activity_model import Activity, Action
+from app.modules.incidents.models.activity_model import Action
+from app.modules.incidents.services.activity_service import update_incidents_with_activity
 
 # import utils
 from app.utils.whitelist.check_vulnerability_whitelisted import check_vulnerabilities_whitelisted
@@ -14,7 +14,6 @@ from app.utils.whitelist.update_pr_status import update_pr_status
 from app.core.logger import logger
 from sqlalchemy import select, update, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
 from app.modules.whitelist.model.whitelist_model import Whitelist
 
 async def add_vulnerability_str(
@@ -76,7 +75,7 @@ async def add_vulnerability_str(
         await db.commit()
         return 0
 
-    # Close open incidents
+    # Close open incidents and log activity in one statement
     incident_stmt = (
         update(Incidents)
         .where(
@@ -88,24 +87,15 @@ async def add_vulnerability_str(
             closed_by=IncidentClosedBy.PROGRAM,
         )
     )
-    await db.execute(incident_stmt)
-    logger.info(f"Closed incidents for vulnerabilities: {vulnerability_ids_list}")
-
-    incidents = await db.scalars(
-        select(Incidents).where(Incidents.vulnerability_id.in_(vulnerability_ids_list))
+    closed_count = await update_incidents_with_activity(
+        db,
+        incident_stmt,
+        Action.INCIDENT_CLOSED,
+        str(IncidentStatusEnum.OPEN),
+        str(IncidentStatusEnum.CLOSED),
+        user_id,
     )
-    for incident in incidents.all():
-        await db.execute(
-            insert(Activity).values(
-                action=Action.INCIDENT_CLOSED,
-                old_value=str(IncidentStatusEnum.OPEN),
-                new_value=str(IncidentStatusEnum.CLOSED),
-                incident_id=incident.id,
-                user_id=user_id,
-                created_at=datetime.utcnow(),
-            )
-        )
-        logger.debug(f"Logged activity for closed incident={incident.id}")
+    logger.info(f"Closed {closed_count} incidents for vulnerabilities: {vulnerability_ids_list}")
 
     await db.commit()
     logger.info("Committed changes to the database after closing incidents.")
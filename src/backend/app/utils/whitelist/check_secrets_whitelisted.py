@@ -1,3 +1,4 @@
+from typing import Dict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, and_
 from sqlalchemy.future import select
@@ -8,4 +9,27 @@ async def check_secrets_whitelisted(db: AsyncSession, pr_scan_id: int) -> bool:
         and_(Secrets.pr_scan_id == pr_scan_id, Secrets.whitelisted == False)
     )
     result = await db.scalar(query)
-    return result == 0
\ No newline at end of file
+    return result == 0
+
+
+async def get_pr_scans_whitelisted_by_whitelist(db: AsyncSession, whitelist_id: int) -> Dict[int, bool]:
+    """
+    For every PR scan holding a secret tied to `whitelist_id`, report whether
+    all of that scan's secrets are whitelisted. One grouped query replaces a
+    COUNT per secret.
+    """
+    affected_pr_scans = (
+        select(Secrets.pr_scan_id)
+        .where(Secrets.whitelist_id == whitelist_id, Secrets.pr_scan_id.isnot(None))
+        .distinct()
+    )
+    query = (
+        select(
+            Secrets.pr_scan_id,
+            func.count().filter(Secrets.whitelisted == False)
+        )
+        .where(Secrets.pr_scan_id.in_(affected_pr_scans))
+        .group_by(Secrets.pr_scan_id)
+    )
+    result = await db.execute(query)
+    return {pr_scan_id: remaining == 0 for pr_scan_id, remaining in result.all()}
@@ -1,3 +1,4 @@
+from typing import Dict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, and_
 from sqlalchemy.future import select
@@ -9,3 +10,25 @@ async def check_vulnerabilities_whitelisted(db: AsyncSession, pr_scan_id: int) -
     )
     result = await db.scalar(query)
     return result == 0
+
+
+async def get_pr_scans_vulnerabilities_whitelisted_by_whitelist(db: AsyncSession, whitelist_id: int) -> Dict[int, bool]:
+    """
+    For every PR scan holding a vulnerability tied to `whitelist_id`, report
+    whether all of that scan's vulnerabilities are whitelisted.
+    """
+    affected_pr_scans = (
+        select(Vulnerabilities.pr_scan_id)
+        .where(Vulnerabilities.whitelist_id == whitelist_id, Vulnerabilities.pr_scan_id.isnot(None))
+        .distinct()
+    )
+    query = (
+        select(
+            Vulnerabilities.pr_scan_id,
+            func.count().filter(Vulnerabilities.whitelisted == False)
+        )
+        .where(Vulnerabilities.pr_scan_id.in_(affected_pr_scans))
+        .group_by(Vulnerabilities.pr_scan_id)
+    )
+    result = await db.execute(query)
+    return {pr_scan_id: remaining == 0 for pr_scan_id, remaining in result.all()}
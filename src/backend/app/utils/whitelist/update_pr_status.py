@@ -1,3 +1,4 @@
+from typing import Dict
 from sqlalchemy.orm import Session
 from sqlalchemy.future import select
 from sqlalchemy import update
@@ -21,4 +22,41 @@ async def update_pr_status(db: AsyncSession, pr_scan_id: int, unblock: bool):
     pr_scan = pr_scan.first()
 
     vc = await get_vc(db=db, vc_id=pr_scan.vc_id)
-    await update_pr_status_global(vc.type, vc.token, pr_scan.stat_url, 0, 0, unblock=unblock)
\ No newline at end of file
+    await update_pr_status_global(vc.type, vc.token, pr_scan.stat_url, 0, 0, unblock=unblock)
+
+
+async def update_pr_statuses(db: AsyncSession, transitions: Dict[int, bool]):
+    """
+    Apply block/unblock transitions for many PR scans at once.
+
+    `transitions` maps pr_scan_id -> unblock. PR scans are loaded in one query,
+    `block_status` is written with one UPDATE per direction, and the outbound
+    status call is sent once per (VC, status URL) so scans sharing a commit
+    do not post the same status repeatedly.
+    """
+    if not transitions:
+        return
+
+    pr_scans = await db.scalars(select(PRScan).where(PRScan.id.in_(list(transitions))))
+    pr_scans = pr_scans.all()
+
+    for unblock in (True, False):
+        ids = [pr_scan_id for pr_scan_id, value in transitions.items() if value is unblock]
+        if ids:
+            await db.execute(
+                update(PRScan).where(PRScan.id.in_(ids)).values(block_status=not unblock)
+            )
+
+    vcs = {}
+    posted = set()
+    for pr_scan in pr_scans:
+        unblock = transitions[pr_scan.id]
+        key = (pr_scan.vc_id, pr_scan.stat_url, unblock)
+        if key in posted:
+            continue
+        posted.add(key)
+
+        if pr_scan.vc_id not in vcs:
+            vcs[pr_scan.vc_id] = await get_vc(db=db, vc_id=pr_scan.vc_id)
+        vc = vcs[pr_scan.vc_id]
+        await update_pr_status_global(vc.type, vc.token, pr_scan.stat_url, 0, 0, unblock=unblock)
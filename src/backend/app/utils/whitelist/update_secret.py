@@ -22,8 +22,10 @@ from typing import Optional, List
 from app.modules.secrets.secret_service import Secrets
 from app.modules.incidents.models.incident_model import Incidents, IncidentStatusEnum, IncidentClosedBy
 from app.modules.incidents.models.activity_model import Activity, Action
-from app.utils.whitelist.check_secrets_whitelisted import check_secrets_whitelisted
-from app.utils.whitelist.update_pr_status import update_pr_status
+from app.modules.incidents.services.activity_service import update_incidents_with_activity
+from app.utils.whitelist.check_secrets_whitelisted import get_pr_scans_whitelisted_by_whitelist
+from app.utils.whitelist.check_vulnerability_whitelisted import get_pr_scans_vulnerabilities_whitelisted_by_whitelist
+from app.utils.whitelist.update_pr_status import update_pr_statuses
 from app.modules.vulnerability.models.vulnerability_model import Vulnerability
 
 logger = logging.getLogger(__name__)
@@ -109,68 +111,48 @@ async def update_secret(
     # 4) If active=False, we reopen incidents closed by PROGRAM for these secrets
     # ------------------------------------------------------
     if not active:
-        secret_ids = await db.scalars(
-            select(Secrets.id).where(Secrets.whitelist_id == whitelist_id)
-        )
-        secret_ids_list = secret_ids.all()
-        logger.info("Found %d secrets for inactive whitelist. Re-opening incidents if needed.", len(secret_ids_list))
-
-        if secret_ids_list:
-            reopen_stmt = (
-                update(Incidents)
-                .where(
-                    and_(
-                        Incidents.secret_id.in_(secret_ids_list),
-                        Incidents.status == IncidentStatusEnum.CLOSED,
-                        Incidents.closed_by == IncidentClosedBy.PROGRAM
-                    )
-                )
-                .values(
-                    status=IncidentStatusEnum.OPEN,
-                    closed_by=None
+        reopen_stmt = (
+            update(Incidents)
+            .where(
+                and_(
+                    Incidents.secret_id.in_(
+                        select(Secrets.id).where(Secrets.whitelist_id == whitelist_id)
+                    ),
+                    Incidents.status == IncidentStatusEnum.CLOSED,
+                    Incidents.closed_by == IncidentClosedBy.PROGRAM
                 )
             )
-            await db.execute(reopen_stmt)
-            logger.info("Reopened incidents for secrets: %s", secret_ids_list)
-
-            # Log activity for reopened incidents
-            incidents = await db.scalars(
-                select(Incidents).where(
-                    and_(
-                        Incidents.secret_id.in_(secret_ids_list),
-                        Incidents.status == IncidentStatusEnum.OPEN
-                    )
-                )
+            .values(
+                status=IncidentStatusEnum.OPEN,
+                closed_by=None
             )
-            for incident in incidents.all():
-                activity_stmt = insert(Activity).values(
-                    action=Action.INCIDENT_OPENED,
-                    old_value=str(IncidentStatusEnum.CLOSED),
-                    new_value=str(IncidentStatusEnum.OPEN),
-                    incident_id=incident.id,
-                    created_at=datetime.utcnow()
-                )
-                await db.execute(activity_stmt)
-                logger.debug("Logged activity for reopened incident_id=%s", incident.id)
+        )
+        # Reopen incidents and log activity for them in one statement
+        reopened_count = await update_incidents_with_activity(
+            db,
+            reopen_stmt,
+            Action.INCIDENT_OPENED,
+            str(IncidentStatusEnum.CLOSED),
+            str(IncidentStatusEnum.OPEN)
+        )
+        logger.info("Reopened %d incidents for inactive whitelist_id=%s.", reopened_count, whitelist_id)
 
     # ------------------------------------------------------
     # 5) Update PR statuses
     # ------------------------------------------------------
-    # For all secrets with the current whitelist_id,
-    # if active=True, check if fully whitelisted; if false, block the PR.
-    secrets_after_update = await db.scalars(
-        select(Secrets).where(Secrets.whitelist_id == whitelist_id)
-    )
-    for secret in secrets_after_update.all():
-        if secret.pr_scan_id:
-            if active:
-                all_whitelisted = await check_secrets_whitelisted(db, secret.pr_scan_id)
-                if all_whitelisted:
-                    await update_pr_status(db, secret.pr_scan_id, unblock=True)
-                    logger.info("PR scan %s unblocked (all secrets whitelisted).", secret.pr_scan_id)
-            else:
-                await update_pr_status(db, secret.pr_scan_id, unblock=False)
-                logger.info("PR scan %s blocked (whitelist is inactive).", secret.pr_scan_id)
+    # For every PR scan touched by this whitelist,
+    # if active=True, unblock it when fully whitelisted; if false, block the PR.
+    pr_scans_whitelisted = await get_pr_scans_whitelisted_by_whitelist(db, whitelist_id)
+    if active:
+        transitions = {
+            pr_scan_id: True
+            for pr_scan_id, all_whitelisted in pr_scans_whitelisted.items()
+            if all_whitelisted
+        }
+    else:
+        transitions = {pr_scan_id: False for pr_scan_id in pr_scans_whitelisted}
+    await update_pr_statuses(db, transitions)
+    logger.info("PR scans %s (whitelist active=%s): %s", "unblocked" if active else "blocked", active, list(transitions))
 
     # ------------------------------------------------------
     # 6) Commit changes and return
@@ -264,70 +246,47 @@ async def update_vulnerability(
     # 4) If active=False, reopen incidents previously closed by PROGRAM
     # ------------------------------------------------------
     if not active:
-        vuln_ids = await db.scalars(
-            select(Vulnerability.id).where(Vulnerability.whitelist_id == whitelist_id)
-        )
-        vulnerability_ids_list = vuln_ids.all()
-        logger.info(
-            "Found %d vulnerabilities for inactive whitelist. Checking if we need to reopen incidents.",
-            len(vulnerability_ids_list)
-        )
-
-        if vulnerability_ids_list:
-            reopen_stmt = (
-                update(Incidents)
-                .where(
-                    and_(
-                        Incidents.vulnerability_id.in_(vulnerability_ids_list),
-                        Incidents.status == IncidentStatusEnum.CLOSED,
-                        Incidents.closed_by == IncidentClosedBy.PROGRAM
-                    )
-                )
-                .values(
-                    status=IncidentStatusEnum.OPEN,
-                    closed_by=None
+        reopen_stmt = (
+            update(Incidents)
+            .where(
+                and_(
+                    Incidents.vulnerability_id.in_(
+                        select(Vulnerability.id).where(Vulnerability.whitelist_id == whitelist_id)
+                    ),
+                    Incidents.status == IncidentStatusEnum.CLOSED,
+                    Incidents.closed_by == IncidentClosedBy.PROGRAM
                 )
             )
-            await db.execute(reopen_stmt)
-            logger.info("Reopened incidents for vulnerabilities: %s", vulnerability_ids_list)
-
-            incidents = await db.scalars(
-                select(Incidents).where(
-                    and_(
-                        Incidents.vulnerability_id.in_(vulnerability_ids_list),
-                        Incidents.status == IncidentStatusEnum.OPEN
-                    )
-                )
+            .values(
+                status=IncidentStatusEnum.OPEN,
+                closed_by=None
             )
-            for incident in incidents.all():
-                activity_stmt = insert(Activity).values(
-                    action=Action.INCIDENT_OPENED,
-                    old_value=str(IncidentStatusEnum.CLOSED),
-                    new_value=str(IncidentStatusEnum.OPEN),
-                    incident_id=incident.id,
-                    created_at=datetime.utcnow()
-                )
-                await db.execute(activity_stmt)
-                logger.debug("Logged activity for reopened incident_id=%s", incident.id)
+        )
+        reopened_count = await update_incidents_with_activity(
+            db,
+            reopen_stmt,
+            Action.INCIDENT_OPENED,
+            str(IncidentStatusEnum.CLOSED),
+            str(IncidentStatusEnum.OPEN)
+        )
+        logger.info("Reopened %d incidents for inactive whitelist_id=%s.", reopened_count, whitelist_id)
 
     # ------------------------------------------------------
     # 5) Update PR statuses if needed
     # ------------------------------------------------------
-    # For vulnerabilities still having this whitelist_id,
-    # if active=True, check if entire PR is whitelisted; if not, block PR.
-    vulns_after_update = await db.scalars(
-        select(Vulnerability).where(Vulnerability.whitelist_id == whitelist_id)
-    )
-    for vuln in vulns_after_update.all():
-        if vuln.pr_scan_id:
-            if active:
-                all_whitelisted = await check_vulnerabilities_whitelisted(db, vuln.pr_scan_id)
-                if all_whitelisted:
-                    await update_pr_status(db, vuln.pr_scan_id, unblock=True)
-                    logger.info("PR scan %s unblocked (all vulnerabilities whitelisted).", vuln.pr_scan_id)
-            else:
-                await update_pr_status(db, vuln.pr_scan_id, unblock=False)
-                logger.info("PR scan %s blocked (whitelist is inactive).", vuln.pr_scan_id)
+    # For PR scans with vulnerabilities still having this whitelist_id,
+    # if active=True, unblock when the entire PR is whitelisted; if not, block PR.
+    pr_scans_whitelisted = await get_pr_scans_vulnerabilities_whitelisted_by_whitelist(db, whitelist_id)
+    if active:
+        transitions = {
+            pr_scan_id: True
+            for pr_scan_id, all_whitelisted in pr_scans_whitelisted.items()
+            if all_whitelisted
+        }
+    else:
+        transitions = {pr_scan_id: False for pr_scan_id in pr_scans_whitelisted}
+    await update_pr_statuses(db, transitions)
+    logger.info("PR scans %s (whitelist active=%s): %s", "unblocked" if active else "blocked", active, list(transitions))
 
     # ------------------------------------------------------
     # 6) Commit and return
@@ -0,0 +1,178 @@
+"""
+Serialization benchmark for the largest list responses.
+
+Times, without a database, what each listing spends turning one page of
+rows into bytes:
+
+  before  ORM objects -> pydantic models (RepoResponse / from_orm) ->
+          jsonable_encoder -> stdlib json (FastAPI's default path)
+  after   projected rows -> plain dicts -> orjson (fast_page)
+
+    python -m scripts.serialization_benchmark --rows 100 --secrets-per-repo 20
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import app.main  # noqa: F401 -- registers every model with the mapper
+from app.modules.repository.models.repository import Repo
+from app.modules.repository.repository_service import REPO_SECRET_FIELDS, REPO_VC_FIELDS
+from app.modules.repository.schemas.repository_schema import RepoResponse, SecretsResponse
+from app.modules.secrets.model.secrets_model import ScanType, Secrets, SeverityLevel
+from app.modules.secrets.secret_service import SECRET_LIST_FIELDS, SECRET_LIST_REPO_FIELDS
+from app.modules.vc.models.vc import VC, VcTypes
+from app.modules.vc.schemas.vc_schema import VCResponse
+from app.utils.responses import FastJSONResponse
+
+NOW = datetime(2026, 10, 19, 12, 0, 0)
+SEVERITIES = [SeverityLevel.CRITICAL, SeverityLevel.HIGH, SeverityLevel.MEDIUM, SeverityLevel.LOW]
+
+
+def make_vc() -> VC:
+    return VC(id=1, name="github", description="GitHub org", type=VcTypes.github, token="token",
+              url="https://github.com/org", added_by_user_id=1, created_by=1, updated_by=1, active=True)
+
+
+def make_secret(i: int, repo: Repo) -> Secrets:
+    return Secrets(
+        id=i, secret=f"AKIA{i:016d}", description="AWS access key", file=f"src/settings_{i % 50}.py",
+        line=str(i % 400), start_line=i % 400, end_line=i % 400, start_column=4, end_column=24,
+        match=f"aws_key = 'AKIA{i:016d}'", rule="aws-access-token", fingerprint=f"{i:x}:src:{i % 400}",
+        message="update settings", commit=f"{i:040x}", author=f"dev-{i % 17}", email=f"dev{i % 17}@example.com",
+        date=NOW - timedelta(hours=i), tags=["key", "aws"], branches=["main"], vc_id=1, whitelisted=False,
+        scan_type=ScanType.REPO_SCAN, severity=SEVERITIES[i % 4], created_at=NOW, updated_at=NOW,
+        repository_id=repo.id, repository=repo, score_raw=float(i % 10), score_normalized=float(i % 100),
+        score_normalized_on=NOW, entropy=None, symlink_file=None, commit_id=None, whitelist_id=None,
+        pr_id=None, pr_scan_id=None, repository_scan_id=None, live_commit_id=None, live_commit_scan_id=None,
+    )
+
+
+def make_repo(i: int, vc: VC, secrets_per_repo: int) -> Repo:
+    repo = Repo(
+        id=i, vc_id=vc.id, vctype=VcTypes.github, name=f"repo-{i}", repoUrl=f"https://github.com/org/repo-{i}",
+        author=f"team-{i % 7}", other_repo_details={"name": f"repo-{i}", "private": True, "default_branch": "main"},
+        lastScanDate=NOW, created_at=NOW, score_normalized=float(i % 100), score_normalized_on=NOW, vc=vc,
+    )
+    repo.secrets = [make_secret(i * 1000 + j, repo) for j in range(secrets_per_repo)]
+    return repo
+
+
+def counts(repo: Repo) -> dict:
+    return {"critical": 3, "high": 5, "low": 1}
+
+
+def repos_before(repos) -> bytes:
+    data = [
+        RepoResponse(
+            id=repo.id, name=repo.name, repoUrl=repo.repoUrl, author=repo.author,
+            other_repo_details=repo.other_repo_details, lastScanDate=repo.lastScanDate,
+            created_at=repo.created_at, score_normalized=repo.score_normalized,
+            score_normalized_on=repo.score_normalized_on, secrets_count=len(repo.secrets),
+            vulnerability_count=0, secret_severity_counts=counts(repo), vulnerability_severity_counts={},
+            secrets=[SecretsResponse.from_orm(secret) for secret in repo.secrets],
+            vc=VCResponse.from_orm(repo.vc),
+        )
+        for repo in repos
+    ]
+    return JSONResponse(jsonable_encoder({"data": data, "total_count": len(repos)})).body
+
+
+def repos_after(rows) -> bytes:
+    repo_rows, secret_rows = rows
+    data = [
+        {
+            "name": row["name"], "repoUrl": row["repoUrl"], "author": row["author"],
+            "other_repo_details": row["other_repo_details"], "score_normalized": row["score_normalized"],
+            "score_normalized_on": row["score_normalized_on"], "secrets_count": len(secret_rows[row["id"]]),
+            "vulnerability_count": 0, "secret_severity_counts": counts(row), "vulnerability_severity_counts": {},
+            "sca_branches": None, "id": row["id"], "lastScanDate": row["lastScanDate"],
+            "created_at": row["created_at"],
+            "vc": {field: row[f"vc_{field}"] for field in REPO_VC_FIELDS},
+            "secrets": [dict(secret) for secret in secret_rows[row["id"]]],
+        }
+        for row in repo_rows
+    ]
+    return FastJSONResponse({"data": data, "total_count": len(repo_rows)}).body
+
+
+def secrets_before(secrets) -> bytes:
+    return JSONResponse(jsonable_encoder({"data": secrets, "total_count": len(secrets)})).body
+
+
+def secrets_after(rows) -> bytes:
+    data = []
+    for row in rows:
+        item = {field: row[field] for field in SECRET_LIST_FIELDS}
+        item["repository"] = {field: row[f"repo_{field}"] for field in SECRET_LIST_REPO_FIELDS}
+        data.append(item)
+    return FastJSONResponse({"data": data, "total_count": len(rows)}).body
+
+
+def repo_rows(repos):
+    rows = []
+    for repo in repos:
+        row = {field: getattr(repo, field) for field in (
+            "id", "name", "repoUrl", "author", "other_repo_details", "lastScanDate", "created_at",
+            "score_normalized", "score_normalized_on")}
+        row.update({f"vc_{field}": getattr(repo.vc, field) for field in REPO_VC_FIELDS})
+        rows.append(row)
+    secrets = {
+        repo.id: [{field: getattr(secret, field) for field in REPO_SECRET_FIELDS} for secret in repo.secrets]
+        for repo in repos
+    }
+    return rows, secrets
+
+
+def secret_rows(secrets):
+    rows = []
+    for secret in secrets:
+        row = {field: getattr(secret, field) for field in SECRET_LIST_FIELDS}
+        row.update({f"repo_{field}": getattr(secret.repository, field) for field in SECRET_LIST_REPO_FIELDS})
+        rows.append(row)
+    return rows
+
+
+def best_ms(fn: Callable, payload, repeat: int) -> float:
+    fn(payload)  # warm up caches and pydantic validators
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(payload)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main(rows: int, secrets_per_repo: int, repeat: int):
+    vc = make_vc()
+    repos = [make_repo(i, vc, secrets_per_repo) for i in range(1, rows + 1)]
+    # The old secrets listing loaded only these repository attributes (load_only)
+    listed_repos = [make_repo(i, vc, 0) for i in range(1, rows + 1)]
+    secrets = [make_secret(i, listed_repos[i % rows]) for i in range(1, rows + 1)]
+    for repo in listed_repos:
+        for attr in ("vc_id", "vctype", "score_normalized", "score_normalized_on", "secrets", "vc"):
+            repo.__dict__.pop(attr, None)
+
+    cases = [
+        (f"GET /repo/?include=secrets ({rows} repos x {secrets_per_repo} secrets)",
+         repos_before, repos, repos_after, repo_rows(repos)),
+        (f"POST /secrets/ ({rows} secrets)", secrets_before, secrets, secrets_after, secret_rows(secrets)),
+    ]
+    print(f"{'case':60} {'before':>10} {'after':>10} {'speedup':>8}")
+    for name, before, before_payload, after, after_payload in cases:
+        before_ms = best_ms(before, before_payload, repeat)
+        after_ms = best_ms(after, after_payload, repeat)
+        print(f"{name:60} {before_ms:8.2f}ms {after_ms:8.2f}ms {before_ms / after_ms:7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100, help="rows per page")
+    parser.add_argument("--secrets-per-repo", type=int, default=20, help="secrets embedded per repository")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case; the best is reported")
+    args = parser.parse_args()
+    main(args.rows, args.secrets_per_repo, args.repeat)